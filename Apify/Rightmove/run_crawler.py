@@ -12,6 +12,7 @@ import re
 import sys
 import time
 from pathlib import Path
+from typing import Iterable
 
 # Logging: timestamp + level + message, to stderr so terminal shows it
 logging.basicConfig(
@@ -45,6 +46,7 @@ except ImportError:
 
 try:
     import openpyxl
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font
 except ImportError:
     print("Install: pip install openpyxl", file=sys.stderr)
@@ -217,21 +219,29 @@ def dedupe_rows(rows: list[dict]) -> list[dict]:
     return out
 
 
-def write_excel(rows: list[dict], path: Path) -> None:
-    """Write all rows to Excel (overwrites file)."""
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Rightmove London Commercial"
-    for col, h in enumerate(HEADERS, 1):
-        ws.cell(row=1, column=col, value=h)
-        ws.cell(row=1, column=col).font = Font(bold=True)
-    for row_idx, r in enumerate(rows, 2):
-        for col_idx, h in enumerate(HEADERS, 1):
+def write_excel(rows: Iterable[dict], path: Path) -> None:
+    """Write all rows to Excel (overwrites file). Streams rows through a write-only sheet; the file is
+    written next to path and swapped in, so a crash mid-save never leaves a truncated workbook."""
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Rightmove London Commercial")
+    bold = Font(bold=True)
+    header = []
+    for h in HEADERS:
+        cell = WriteOnlyCell(ws, value=h)
+        cell.font = bold
+        header.append(cell)
+    ws.append(header)
+    for r in rows:
+        row = []
+        for h in HEADERS:
             val = r.get(h, "")
             if isinstance(val, str) and len(val) > 32767:
                 val = val[:32767]
-            ws.cell(row=row_idx, column=col_idx, value=val)
-    wb.save(path)
+            row.append(val)
+        ws.append(row)
+    tmp = path.with_name(path.name + ".tmp")
+    wb.save(tmp)
+    os.replace(tmp, path)
 
 
 def main():
@@ -0,0 +1,143 @@
+"""
+Job manager for API-triggered scrapes. submit() returns at once: the run executes in its own process
+(runners/run_job.py, own session so cancel can signal its whole process group - run_all workers and
+browsers included) and reports its outcome to storage.run_history. Status is read from that history,
+so it survives API restarts and is the same from every API worker. Only one job is active at a time
+(runs share the seen index, HTTP cache and lead store). Jobs whose process vanished without reporting
+are marked interrupted.
+"""
+
+import os
+import signal
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from time import time
+from typing import Any
+
+from storage.run_history import (
+    ACTIVE, CANCELLED, INTERRUPTED, QUEUED, RUNNING, RunHistory, get_run_history,
+)
+from storage.run_journal import get_run_journal
+
+_BACKEND = Path(__file__).resolve().parent.parent
+
+# A queued job with no process after this long was lost between create and start (API crash)
+_START_GRACE_SECONDS = 60
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class JobManager:
+    def __init__(self, history: RunHistory | None = None, command: list[str] | None = None, log_dir: Path | None = None):
+        self.history = history or get_run_history()
+        self.command = command or [sys.executable, str(_BACKEND / "runners" / "run_job.py")]
+        self.log_dir = log_dir or _BACKEND / "storage" / "data" / "jobs"
+        self._procs: dict[str, subprocess.Popen] = {}  # jobs started by this API process
+        self._lock = threading.Lock()
+
+    def submit(self, params: dict[str, Any]) -> tuple[dict[str, Any], bool]:
+        """(job, created) - created is False when a job was already active (returned instead, whatever its params)."""
+        self.reap()
+        job, created = self.history.create(params)
+        if created:
+            self._start(job["job_id"])
+            job = self.history.get(job["job_id"]) or job
+        return job, created
+
+    def _start(self, job_id: str) -> None:
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.log_dir / f"{job_id}.log", "ab") as log:
+            proc = subprocess.Popen(
+                [*self.command, job_id],
+                cwd=str(_BACKEND),
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                start_new_session=True,
+            )
+        with self._lock:
+            self._procs[job_id] = proc
+        if not self.history.mark_running(job_id, proc.pid) and proc.poll() is None:
+            self._signal(proc.pid)  # cancelled before it got going
+
+    def _alive(self, job: dict[str, Any]) -> bool:
+        with self._lock:
+            proc = self._procs.get(job["job_id"])
+        if proc is not None:
+            return proc.poll() is None  # also reaps the child
+        return bool(job["pid"]) and _pid_alive(job["pid"])
+
+    def reap(self) -> None:
+        """Mark active jobs whose process is gone (or never started) as interrupted."""
+        now = time()
+        for job in self.history.active():
+            if job["status"] == RUNNING and not self._alive(job):
+                self.history.finish(job["job_id"], INTERRUPTED, error="job process exited without reporting")
+            elif job["status"] == QUEUED and job["pid"] is None and now - job["created_at"] > _START_GRACE_SECONDS:
+                with self._lock:
+                    started_here = job["job_id"] in self._procs
+                if not started_here:
+                    self.history.finish(job["job_id"], INTERRUPTED, error="job was never started")
+        with self._lock:
+            for job_id in [j for j, p in self._procs.items() if p.poll() is not None]:
+                del self._procs[job_id]
+
+    def status(self, job_id: str) -> dict[str, Any] | None:
+        """Job as stored, plus live progress from the run journal while it runs."""
+        self.reap()
+        job = self.history.get(job_id)
+        if job is not None and job["status"] == RUNNING:
+            job["progress"] = self._progress(job["run_id"])
+        return job
+
+    def _progress(self, run_id: str) -> dict[str, Any] | None:
+        try:
+            journal = get_run_journal()
+        except Exception:
+            return None
+        if journal is None:
+            return None
+        return {"platforms_done": sorted(journal.completed(run_id)), "leads_so_far": journal.lead_count(run_id)}
+
+    def recent(self, limit: int = 20) -> list[dict[str, Any]]:
+        self.reap()
+        return self.history.recent(limit)
+
+    def cancel(self, job_id: str) -> dict[str, Any] | None:
+        """Cancel an active job (SIGTERM to its process group). Returns the job, None if unknown."""
+        job = self.history.get(job_id)
+        if job is None or job["status"] not in ACTIVE:
+            return job
+        self.history.finish(job_id, CANCELLED, error="cancelled")
+        if job["pid"] and self._alive(job):
+            self._signal(job["pid"])
+        return self.history.get(job_id)
+
+    @staticmethod
+    def _signal(pid: int) -> None:
+        try:
+            os.killpg(pid, signal.SIGTERM)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+
+_manager: JobManager | None = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = JobManager()
+        return _manager
@@ -1,8 +1,17 @@
-"""Leads API - placeholder for Universal Leads AI logic."""
+"""Leads API - GET queries / full-text searches the lead store; POST is the Universal Leads AI intake stub."""
 
-from fastapi import APIRouter
+import sys
+from pathlib import Path
+
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
+_BACKEND = Path(__file__).resolve().parent.parent.parent
+if str(_BACKEND) not in sys.path:
+    sys.path.insert(0, str(_BACKEND))
+
+from storage.lead_store import LeadQuery, get_lead_store
+
 router = APIRouter()
 
 
@@ -18,9 +27,47 @@ class LeadResponse(BaseModel):
 
 
 @router.get("")
-def list_leads():
-    """List or search leads (stub)."""
-    return {"leads": [], "total": 0}
+def list_leads(
+    platform: str | None = None,
+    min_score: int | None = Query(None, ge=0, le=100),
+    has_email: bool | None = None,
+    email: str | None = None,
+    since: str | None = Query(None, description="post_date >= (ISO date)"),
+    until: str | None = Query(None, description="post_date <= (ISO date)"),
+    run_id: str | None = None,
+    sort: str = Query("confidence_score", description="confidence_score | post_date | last_seen_at | id"),
+    order: str = Query("desc", pattern="^(asc|desc)$"),
+    limit: int = Query(50, ge=1, le=500),
+    cursor: str | None = None,
+):
+    """Leads from the lead store - filter, sort, and page with next_cursor."""
+    store = get_lead_store()
+    if store is None:
+        return {"leads": [], "total": 0, "next_cursor": None}
+    q = LeadQuery(
+        platform=platform, min_score=min_score, has_email=has_email, email=email, since=since,
+        until=until, run_id=run_id, sort=sort, order=order, limit=limit, cursor=cursor,
+    )
+    try:
+        page = store.query(q)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail={"message": str(e), "code": "BAD_QUERY"})
+    return {"leads": page.leads, "total": page.total, "next_cursor": page.next_cursor}
+
+
+@router.get("/search")
+def search_leads(
+    q: str = Query(..., min_length=1, description='words must all match; "quoted phrases" match exactly'),
+    platform: str | None = None,
+    min_score: int | None = Query(None, ge=0, le=100),
+    limit: int = Query(20, ge=1, le=200),
+):
+    """Full-text search over stored leads, best match first, with highlighted snippets."""
+    store = get_lead_store()
+    if store is None:
+        return {"results": [], "count": 0}
+    results = store.search(q, limit=limit, platform=platform, min_score=min_score)
+    return {"results": results, "count": len(results)}
 
 
 @router.post("", response_model=LeadResponse)
@@ -1,10 +1,14 @@
-"""Scraper run API: POST /run, GET /runs/latest, GET /outputs, GET /outputs/{file}."""
+"""
+Scraper run API: POST /run, GET /runs, GET /runs/latest, GET|DELETE /runs/{job_id}, GET /outputs,
+GET /outputs/{file}. Runs execute as background jobs (app.jobs) with history in storage.run_history.
+"""
 
 import logging
 import sys
 from pathlib import Path
+from typing import Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
 
@@ -12,26 +16,32 @@ _BACKEND = Path(__file__).resolve().parent.parent.parent
 if str(_BACKEND) not in sys.path:
     sys.path.insert(0, str(_BACKEND))
 
+from app.jobs import get_job_manager
+from storage.run_history import CANCELLED, params_key
+
 router = APIRouter()
 log = logging.getLogger(__name__)
 
-# In-memory last run
-_last_summary = None
+
+class RunRequest(BaseModel):
+    """Optional POST /run body; a request with the same fields as the active job joins it."""
+    workers: int | None = None
+    resume: str | None = None  # run_id of a killed run to continue from its run journal
+    debug_save_candidates: bool = False
 
 
-class RunResponse(BaseModel):
-    """Run summary returned by POST /run and GET /runs/latest."""
+class JobResponse(BaseModel):
+    job_id: str
+    status: str  # queued | running | succeeded | failed | cancelled | interrupted
     run_id: str
-    started_at: str
-    finished_at: str
-    total_leads: int
-    unique_leads_after_dedupe: int
-    platforms_run: int
-    platforms_ok: int
-    platforms_failed: int
-    total_runtime_seconds: float
-    output_xlsx: str
-    output_jsonl: str
+    params: dict[str, Any]
+    created_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+    error: str = ""
+    summary: dict[str, Any] | None = None  # full run summary once succeeded
+    progress: dict[str, Any] | None = None  # platforms_done, leads_so_far while running
+    coalesced: bool = False  # POST /run joined a job already active with the same params
 
 
 class OutputFile(BaseModel):
@@ -43,29 +53,60 @@ class OutputsResponse(BaseModel):
     files: list[OutputFile]
 
 
-@router.post("/run")
-def trigger_run():
-    """Run all platforms, merge, dedupe, export XLSX+JSONL. Returns full run summary (RunResponse fields + platform_results)."""
-    global _last_summary
-    log.info("POST /run: starting scraper run")
-    try:
-        from runners.run_all import main
-        _last_summary = main()
-        out = _last_summary.model_dump(mode="json")
-        log.info("POST /run: completed run_id=%s unique_leads=%s", _last_summary.run_id, _last_summary.unique_leads_after_dedupe)
-        return out
-    except Exception as e:
-        log.exception("POST /run failed: %s", e)
-        raise HTTPException(status_code=500, detail={"message": str(e), "code": "RUN_FAILED"})
+def _job_or_404(job: dict | None) -> dict:
+    if job is None:
+        raise HTTPException(status_code=404, detail={"message": "Unknown run", "code": "NO_RUN"})
+    return job
+
+
+@router.post("/run", response_model=JobResponse, status_code=202)
+def trigger_run(req: RunRequest | None = None):
+    """
+    Start a scrape job and return it immediately; poll GET /runs/{job_id}. One run at a time: the
+    same request while a job is active joins it, a different one is rejected with 409 (job_id in detail).
+    """
+    params = (req or RunRequest()).model_dump()
+    job, created = get_job_manager().submit(params)
+    if not created and params_key(job["params"]) != params_key(params):
+        raise HTTPException(
+            status_code=409,
+            detail={"message": "Another run is in progress", "code": "RUN_ACTIVE", "job_id": job["job_id"]},
+        )
+    log.info("POST /run: job_id=%s status=%s coalesced=%s", job["job_id"], job["status"], not created)
+    return {**job, "coalesced": not created}
+
+
+@router.get("/runs", response_model=list[JobResponse])
+def list_runs(limit: int = Query(20, ge=1, le=200)):
+    """Run history, newest first."""
+    return get_job_manager().recent(limit)
 
 
 @router.get("/runs/latest")
 def get_latest_run():
-    """Return last run summary (full, including platform_results)."""
-    global _last_summary
-    if _last_summary is None:
+    """Return the summary of the last successful run (full, including platform_results)."""
+    summary = get_job_manager().history.latest_summary()
+    if summary is None:
         raise HTTPException(status_code=404, detail={"message": "No run yet", "code": "NO_RUN"})
-    return _last_summary.model_dump(mode="json")
+    return summary
+
+
+@router.get("/runs/{job_id}", response_model=JobResponse)
+def get_run(job_id: str):
+    """Live status of a job; summary once it succeeded."""
+    return _job_or_404(get_job_manager().status(job_id))
+
+
+@router.delete("/runs/{job_id}", response_model=JobResponse)
+def cancel_run(job_id: str):
+    """Cancel a queued or running job."""
+    job = _job_or_404(get_job_manager().cancel(job_id))
+    if job["status"] != CANCELLED:
+        raise HTTPException(
+            status_code=409, detail={"message": f"Run already {job['status']}", "code": "RUN_FINISHED"}
+        )
+    log.info("DELETE /runs/%s: cancelled", job_id)
+    return job
 
 
 @router.get("/outputs", response_model=OutputsResponse)
@@ -76,7 +117,7 @@ def list_outputs():
         return OutputsResponse(files=[])
     files = []
     for f in sorted(out_dir.iterdir(), key=lambda x: -x.stat().st_mtime):
-        if not f.is_file():
+        if not f.is_file() or f.name.endswith(".rescored.jsonl"):
             continue
         if f.suffix in (".xlsx", ".jsonl") and (f.name.startswith("leads_") or f.name.startswith("rejected_")):
             files.append(OutputFile(name=f.name, path=str(f)))
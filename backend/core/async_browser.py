@@ -0,0 +1,280 @@
+"""
+Async Playwright engine - fetch a listing's detail pages N at a time with per-domain limits.
+Inside browser_pool() the Chromium behind it is the pool's AsyncBrowser, launched once per run
+(per worker process) and shared by every connector; each engine only opens its own context.
+"""
+
+import asyncio
+import random
+import threading
+from collections import defaultdict
+from typing import Any, Awaitable, Callable
+from urllib.parse import urlparse
+
+from core.browser import USER_AGENTS, ResourceBlocker, get_active_pool, page_cache
+from core.config import get_config
+from core.logging import log_error, log_message
+from core.stop_conditions import StopState, check_platform_stop, record_items_scanned
+
+try:
+    from playwright.async_api import async_playwright
+except ImportError:
+    async_playwright = None
+
+
+def async_available() -> bool:
+    return async_playwright is not None
+
+
+def _domain(url: str) -> str:
+    try:
+        return urlparse(url).netloc.lower()
+    except Exception:
+        return ""
+
+
+class AsyncBrowser:
+    """
+    Chromium driven from a background event-loop thread (async Playwright objects stay on their loop).
+    new_context() relaunches the browser when it disconnected or has served browser_max_contexts
+    contexts, like BrowserPool does for the sync browsers. One per run via BrowserPool.async_browser().
+    """
+
+    def __init__(self, config: dict | None = None):
+        self.cfg = config or get_config()
+        self.max_contexts = self.cfg.get("browser_max_contexts", 50)
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._pw: Any = None
+        self._browser: Any = None
+        self._contexts = 0
+
+    def start(self) -> "AsyncBrowser":
+        if async_playwright is None:
+            raise RuntimeError("Install playwright: pip install playwright && playwright install chromium")
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self.loop.run_forever, name="async-browser", daemon=True)
+            self._thread.start()
+        return self
+
+    def call(self, coro: Awaitable, timeout: float | None = None) -> Any:
+        """Run coro on the browser's loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def _healthy(self) -> bool:
+        try:
+            return self._browser.is_connected()
+        except Exception:
+            return False
+
+    async def _close_browser(self) -> None:
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+
+    async def _relaunch(self, reason: str) -> None:
+        if self._browser is not None:
+            log_message("async browser recycling", reason=reason)
+            await self._close_browser()
+        if self._pw is None:
+            self._pw = await async_playwright().start()
+        self._browser = await self._pw.chromium.launch(
+            headless=self.cfg.get("headless", True), slow_mo=self.cfg.get("slow_mo", 0)
+        )
+        self._contexts = 0
+
+    async def _context(self) -> Any:
+        return await self._browser.new_context(
+            viewport=dict(self.cfg.get("viewport") or {"width": 1280, "height": 720}),
+            user_agent=random.choice(USER_AGENTS),
+            ignore_https_errors=True,
+        )
+
+    async def new_context(self, platform: str = "", allow_resources: tuple[str, ...] = ()) -> Any:
+        """Fresh context (default timeout, resource blocking) from a healthy browser; caller closes it."""
+        if self._browser is None:
+            await self._relaunch("start")
+        elif not self._healthy():
+            await self._relaunch("disconnected")
+        elif self.max_contexts and self._contexts >= self.max_contexts:
+            await self._relaunch("max_contexts")
+        try:
+            ctx = await self._context()
+        except Exception as e:
+            log_error("async browser new_context failed", error=str(e))
+            await self._relaunch("new_context_failed")
+            ctx = await self._context()
+        self._contexts += 1
+        ctx.set_default_timeout(self.cfg.get("page_timeout", 30000))
+        rules = self.cfg.get("block_resources") or {}
+        if rules.get("enabled"):
+            blocker = ResourceBlocker(rules, platform, allow_resources)
+            await ctx.route("**/*", blocker.handle_async)
+        return ctx
+
+    async def _close(self) -> None:
+        await self._close_browser()
+        if self._pw is not None:
+            try:
+                await self._pw.stop()
+            except Exception:
+                pass
+            self._pw = None
+
+    def close(self) -> None:
+        if self.loop is None:
+            return
+        try:
+            self.call(self._close(), timeout=30)
+        except Exception:
+            pass
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        if self._thread:
+            self._thread.join(timeout=5)
+        self.loop.close()
+        self.loop = None
+        self._thread = None
+
+
+class AsyncPageEngine:
+    """
+    Detail-page fetcher on an AsyncBrowser's event-loop thread. run() fetches URLs concurrently
+    (concurrent_pages overall, per_domain_concurrency per host) and calls on_result(url, data)
+    for each, serialized under a lock. StopState is checked before every page, so the usual
+    stop conditions apply across tasks; the calling thread blocks until the batch is done.
+    The browser is the active browser_pool()'s; outside a pool the engine launches its own.
+    """
+
+    def __init__(
+        self,
+        config: dict | None,
+        platform: str,
+        state: StopState,
+        allow_resources: tuple[str, ...] = (),
+        concurrency: int | None = None,
+        retries: int = 1,
+    ):
+        self.cfg = config or get_config()
+        self.platform = platform
+        self.state = state
+        self.allow_resources = allow_resources
+        self.concurrency = max(1, concurrency or self.cfg.get("concurrent_pages", 4))
+        self.per_domain = max(1, self.cfg.get("per_domain_concurrency", 3))
+        self.timeout = self.cfg.get("page_timeout", 30000)
+        self.retries = retries
+        self._browser: AsyncBrowser | None = None
+        self._owned = False  # browser launched for this engine alone (no active pool)
+        self._ctx: Any = None
+
+    def __enter__(self) -> "AsyncPageEngine":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def start(self) -> "AsyncPageEngine":
+        if async_playwright is None:
+            raise RuntimeError("Install playwright: pip install playwright && playwright install chromium")
+        if self._ctx is not None:
+            return self
+        pool = get_active_pool()
+        self._owned = pool is None
+        self._browser = AsyncBrowser(self.cfg) if self._owned else pool.async_browser()
+        try:
+            self._browser.start()
+            self._ctx = self._call(self._browser.new_context(self.platform, self.allow_resources))
+        except Exception:
+            self.close()
+            raise
+        return self
+
+    def _call(self, coro: Awaitable, timeout: float | None = None) -> Any:
+        return self._browser.call(coro, timeout)
+
+    async def _close_context(self) -> None:
+        if self._ctx is not None:
+            try:
+                await self._ctx.close()
+            except Exception:
+                pass
+            self._ctx = None
+
+    def close(self) -> None:
+        if self._browser is None:
+            return
+        if self._browser.loop is not None:
+            try:
+                self._call(self._close_context(), timeout=30)
+            except Exception:
+                pass
+        if self._owned:
+            self._browser.close()
+        self._browser = None
+        self._ctx = None
+
+    async def _fetch(self, url: str, extract: Callable[[Any, str], Awaitable[Any]]) -> Any:
+        cached = page_cache(url, self.platform, self.cfg)
+        for attempt in range(self.retries + 1):
+            page = None
+            try:
+                page = await self._ctx.new_page()
+                if cached is not None:
+                    await page.route(cached.matches, cached.handle_async)
+                await page.goto(url, wait_until="domcontentloaded", timeout=self.timeout)
+                return await extract(page, url)
+            except Exception as e:
+                log_error("async visit_page failed", url=url, attempt=attempt, error=str(e))
+                if attempt < self.retries:
+                    await asyncio.sleep(2 ** attempt)
+            finally:
+                if page is not None:
+                    try:
+                        await page.close()
+                    except Exception:
+                        pass
+        return None
+
+    async def _run(
+        self,
+        urls: list[str],
+        extract: Callable[[Any, str], Awaitable[Any]],
+        on_result: Callable[[str, Any], None],
+    ) -> int:
+        lock = asyncio.Lock()
+        pages = asyncio.Semaphore(self.concurrency)
+        domains: dict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(self.per_domain))
+        lo = self.cfg.get("random_delay_ms_min", 200)
+        hi = self.cfg.get("random_delay_ms_max", 900)
+        done = 0
+        stopped = False
+
+        async def one(url: str) -> None:
+            nonlocal done, stopped
+            async with domains[_domain(url)], pages:
+                async with lock:
+                    if stopped or check_platform_stop(self.state, self.cfg, self.platform)[0]:
+                        stopped = True
+                        return
+                    record_items_scanned(self.state, 1)
+                await asyncio.sleep(random.randint(lo, hi) / 1000.0)
+                data = await self._fetch(url, extract)
+                async with lock:
+                    done += 1
+                    on_result(url, data)
+
+        await asyncio.gather(*(one(u) for u in urls))
+        return done
+
+    def run(
+        self,
+        urls: list[str],
+        extract: Callable[[Any, str], Awaitable[Any]],
+        on_result: Callable[[str, Any], None],
+    ) -> int:
+        """Fetch urls concurrently; on_result(url, extract(...) or None) per visited page. Returns pages visited."""
+        self.start()
+        return self._call(self._run(urls, extract, on_result))
@@ -1,12 +1,16 @@
-"""Shared Playwright browser launcher - timeouts, retry, user-agent."""
+"""Shared Playwright browser launcher - timeouts, retry, user-agent, run-scoped browser pool."""
 
 import random
+import threading
 import time
 from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import Any, Generator
+from urllib.parse import urlparse
 
 from core.config import get_config
-from core.logging import log_error
+from core.logging import log_error, log_message
+from storage.http_cache import HttpCache, cache_key, get_http_cache
 
 try:
     from playwright.sync_api import Browser, BrowserContext, Page, sync_playwright
@@ -22,28 +26,342 @@ USER_AGENTS = [
 ]
 
 
+# Rough transfer size per aborted request type (bytes) - used for the bytes-saved estimate
+_AVG_RESOURCE_BYTES = {
+    "image": 30_000,
+    "media": 300_000,
+    "font": 35_000,
+    "stylesheet": 20_000,
+    "script": 25_000,
+}
+_DEFAULT_RESOURCE_BYTES = 5_000
+
+
+@dataclass
+class BlockStats:
+    requests_blocked: int = 0
+    bytes_saved: int = 0
+
+
+_stats_lock = threading.Lock()
+_block_stats: dict[str, BlockStats] = {}
+
+
+def pop_block_stats(platform: str) -> BlockStats:
+    """Return and reset blocked-request counters for a platform."""
+    with _stats_lock:
+        return _block_stats.pop(platform, None) or BlockStats()
+
+
+class ResourceBlocker:
+    """Route handler that aborts heavy subresources and tracker hosts; parsers only read text."""
+
+    def __init__(self, rules: dict, platform: str = "", allow: tuple[str, ...] | list[str] = ()):
+        allowed = set(allow) | set((rules.get("allow") or {}).get(platform) or [])
+        self.types = set(rules.get("types") or []) - allowed
+        self.hosts = tuple(h.lower() for h in rules.get("hosts") or [])
+        self.platform = platform
+
+    def blocks(self, resource_type: str, url: str) -> bool:
+        if resource_type == "document":
+            return False
+        if resource_type in self.types:
+            return True
+        if self.hosts:
+            host = urlparse(url).netloc.lower().split(":")[0]
+            return any(host == h or host.endswith("." + h) for h in self.hosts)
+        return False
+
+    def _record(self, resource_type: str) -> None:
+        with _stats_lock:
+            st = _block_stats.setdefault(self.platform, BlockStats())
+            st.requests_blocked += 1
+            st.bytes_saved += _AVG_RESOURCE_BYTES.get(resource_type, _DEFAULT_RESOURCE_BYTES)
+
+    def handle(self, route: Any) -> None:
+        req = route.request
+        try:
+            if self.blocks(req.resource_type, req.url):
+                self._record(req.resource_type)
+                route.abort()
+            else:
+                route.continue_()
+        except Exception:
+            pass
+
+    async def handle_async(self, route: Any) -> None:
+        """Same as handle() for playwright.async_api contexts."""
+        req = route.request
+        try:
+            if self.blocks(req.resource_type, req.url):
+                self._record(req.resource_type)
+                await route.abort()
+            else:
+                await route.continue_()
+        except Exception:
+            pass
+
+    def install(self, ctx: "BrowserContext") -> None:
+        ctx.route("**/*", self.handle)
+
+
+def _install_blocker(ctx: "BrowserContext", cfg: dict, platform: str, allow: tuple[str, ...]) -> None:
+    rules = cfg.get("block_resources") or {}
+    if rules.get("enabled"):
+        ResourceBlocker(rules, platform, allow).install(ctx)
+
+
+class PageCache:
+    """
+    Route handler for one page's document request: fresh cache entry -> fulfilled locally;
+    stale -> conditional fetch (304 refreshes the entry); otherwise fetched and stored.
+    """
+
+    def __init__(self, cache: HttpCache, url: str, platform: str):
+        self.cache = cache
+        self.url = url
+        self.platform = platform
+        self.key = cache_key(url)
+
+    def matches(self, url: str) -> bool:
+        return cache_key(url) == self.key
+
+    def _fulfill_args(self, entry: Any) -> dict:
+        return {"status": entry.status, "headers": {"content-type": entry.content_type}, "body": entry.body}
+
+    def _lookup(self, route: Any) -> tuple[Any, dict | None]:
+        """(entry, None) to fulfill from cache, else (stale entry or None, headers for route.fetch)."""
+        entry = self.cache.get(self.url)
+        if entry is not None and entry.is_fresh(self.cache.ttl_for(self.platform)):
+            return entry, None
+        return entry, {**route.request.headers, **(entry.validators() if entry is not None else {})}
+
+    def _store(self, resp: Any, body: bytes) -> None:
+        ctype = resp.headers.get("content-type", "")
+        if resp.status == 200 and ("html" in ctype or "json" in ctype):
+            self.cache.put(
+                self.url, self.platform, resp.status, ctype, body,
+                etag=resp.headers.get("etag"), last_modified=resp.headers.get("last-modified"),
+            )
+
+    def handle(self, route: Any) -> None:
+        try:
+            entry, headers = self._lookup(route)
+            if headers is None:
+                route.fulfill(**self._fulfill_args(entry))
+                return
+            resp = route.fetch(headers=headers)
+            if resp.status == 304 and entry is not None:
+                self.cache.touch(self.url)
+                route.fulfill(**self._fulfill_args(entry))
+                return
+            self._store(resp, resp.body())
+            route.fulfill(response=resp)
+        except Exception as e:
+            log_error("page cache route failed", url=self.url, error=str(e))
+            try:
+                route.continue_()
+            except Exception:
+                pass
+
+    async def handle_async(self, route: Any) -> None:
+        try:
+            entry, headers = self._lookup(route)
+            if headers is None:
+                await route.fulfill(**self._fulfill_args(entry))
+                return
+            resp = await route.fetch(headers=headers)
+            if resp.status == 304 and entry is not None:
+                self.cache.touch(self.url)
+                await route.fulfill(**self._fulfill_args(entry))
+                return
+            self._store(resp, await resp.body())
+            await route.fulfill(response=resp)
+        except Exception as e:
+            log_error("page cache route failed", url=self.url, error=str(e))
+            try:
+                await route.continue_()
+            except Exception:
+                pass
+
+
+def page_cache(url: str, platform: str, config: dict | None = None) -> PageCache | None:
+    """PageCache for url when scraper.http_cache is on and the platform's TTL is > 0."""
+    if not platform:
+        return None
+    cache = get_http_cache(config)
+    if cache is None or cache.ttl_for(platform) <= 0:
+        return None
+    return PageCache(cache, url, platform)
+
+
 def _get_playwright():
     if sync_playwright is None:
         raise RuntimeError("Install playwright: pip install playwright && playwright install chromium")
     return sync_playwright().start()
 
 
+def _launch(p: Any, cfg: dict) -> "Browser":
+    return p.chromium.launch(headless=cfg.get("headless", True), slow_mo=cfg.get("slow_mo", 0))
+
+
+def _new_context(browser: "Browser", cfg: dict) -> "BrowserContext":
+    ctx = browser.new_context(
+        viewport=dict(cfg.get("viewport") or {"width": 1280, "height": 720}),
+        user_agent=random.choice(USER_AGENTS),
+        ignore_https_errors=True,
+    )
+    ctx.set_default_timeout(cfg.get("page_timeout", 30000))
+    return ctx
+
+
+class BrowserPool:
+    """
+    Long-lived Chromium processes shared by every connector in a run.
+    Each connector gets a fresh BrowserContext (isolated cookies/storage); browsers that
+    crashed or disconnected are relaunched, and each browser is recycled after
+    browser_max_contexts contexts to keep memory bounded.
+    Sync Playwright objects are bound to the creating thread - use one pool per thread.
+    async_browser() is the run's async Chromium for AsyncPageEngine, launched on first use.
+    """
+
+    def __init__(self, config: dict | None = None, size: int | None = None):
+        self.cfg = config or get_config()
+        self.size = max(1, size or self.cfg.get("browser_pool_size", 1))
+        self.max_contexts = self.cfg.get("browser_max_contexts", 50)
+        self.playwright: Any = None
+        self._slots: list[dict] = []
+        self._next = 0
+        self._async: Any = None
+
+    def start(self) -> "BrowserPool":
+        if self.playwright is None:
+            self.playwright = _get_playwright()
+        return self
+
+    def _healthy(self, slot: dict) -> bool:
+        try:
+            return slot["browser"].is_connected()
+        except Exception:
+            return False
+
+    def _close_slot(self, slot: dict) -> None:
+        try:
+            slot["browser"].close()
+        except Exception:
+            pass
+
+    def _relaunch(self, i: int, reason: str) -> dict:
+        if i < len(self._slots):
+            log_message("browser_pool recycling browser", slot=i, reason=reason)
+            self._close_slot(self._slots[i])
+        slot = {"browser": _launch(self.playwright, self.cfg), "contexts": 0}
+        if i < len(self._slots):
+            self._slots[i] = slot
+        else:
+            self._slots.append(slot)
+        return slot
+
+    def _acquire(self) -> tuple[int, dict]:
+        self.start()
+        i = self._next % self.size
+        self._next += 1
+        if i >= len(self._slots):
+            return i, self._relaunch(i, "start")
+        slot = self._slots[i]
+        if not self._healthy(slot):
+            return i, self._relaunch(i, "disconnected")
+        if self.max_contexts and slot["contexts"] >= self.max_contexts:
+            return i, self._relaunch(i, "max_contexts")
+        return i, slot
+
+    def new_context(self) -> "BrowserContext":
+        """Fresh context from a healthy browser; retries once on a browser that died mid-call."""
+        i, slot = self._acquire()
+        try:
+            ctx = _new_context(slot["browser"], self.cfg)
+        except Exception as e:
+            log_error("browser_pool new_context failed", slot=i, error=str(e))
+            slot = self._relaunch(i, "new_context_failed")
+            ctx = _new_context(slot["browser"], self.cfg)
+        slot["contexts"] += 1
+        return ctx
+
+    def async_browser(self) -> Any:
+        """The run's core.async_browser.AsyncBrowser (closed with the pool)."""
+        if self._async is None:
+            from core.async_browser import AsyncBrowser
+
+            self._async = AsyncBrowser(self.cfg)
+        return self._async
+
+    def close(self) -> None:
+        if self._async is not None:
+            self._async.close()
+            self._async = None
+        for slot in self._slots:
+            self._close_slot(slot)
+        self._slots = []
+        if self.playwright is not None:
+            try:
+                self.playwright.stop()
+            except Exception:
+                pass
+            self.playwright = None
+
+
+_local = threading.local()
+
+
+def get_active_pool() -> BrowserPool | None:
+    return getattr(_local, "pool", None)
+
+
 @contextmanager
-def browser_context(config: dict | None = None) -> Generator[tuple[Any, BrowserContext], None, None]:
-    """Yield (playwright, context). Caller closes pages/context; we close browser and playwright."""
+def browser_pool(config: dict | None = None, size: int | None = None) -> Generator[BrowserPool, None, None]:
+    """Run-scoped pool: every browser_context() on this thread reuses its browsers until exit."""
+    pool = BrowserPool(config, size)
+    prev = get_active_pool()
+    _local.pool = pool
+    try:
+        yield pool
+    finally:
+        _local.pool = prev
+        pool.close()
+
+
+@contextmanager
+def browser_context(
+    config: dict | None = None,
+    platform: str = "",
+    allow_resources: tuple[str, ...] = (),
+) -> Generator[tuple[Any, BrowserContext], None, None]:
+    """
+    Yield (playwright, context). Caller closes pages; we close the context.
+    Inside browser_pool() the context comes from the shared browsers; otherwise we launch
+    (and close) a dedicated browser and playwright.
+    When scraper.block_resources is enabled, blocked requests are counted under `platform`;
+    allow_resources re-enables resource types for this context.
+    """
     cfg = config or get_config()
-    headless = cfg.get("headless", True)
-    viewport = cfg.get("viewport") or {"width": 1280, "height": 720}
+    pool = get_active_pool()
+    if pool is not None:
+        ctx = pool.new_context()
+        _install_blocker(ctx, cfg, platform, allow_resources)
+        try:
+            yield pool.playwright, ctx
+        finally:
+            try:
+                ctx.close()
+            except Exception:
+                pass
+        return
     p = _get_playwright()
     try:
-        browser = p.chromium.launch(headless=headless, slow_mo=cfg.get("slow_mo", 0))
+        browser = _launch(p, cfg)
         try:
-            ctx = browser.new_context(
-                viewport=viewport,
-                user_agent=random.choice(USER_AGENTS),
-                ignore_https_errors=True,
-            )
-            ctx.set_default_timeout(cfg.get("page_timeout", 30000))
+            ctx = _new_context(browser, cfg)
+            _install_blocker(ctx, cfg, platform, allow_resources)
             yield p, ctx
         finally:
             browser.close()
@@ -56,13 +374,21 @@ def visit_page(
     url: str,
     timeout: int | None = None,
     retries: int = 2,
+    config: dict | None = None,
+    platform: str = "",
 ) -> Page | None:
-    """Open URL with retries and exponential backoff. Returns Page or None."""
-    cfg = get_config()
+    """
+    Open URL with retries and exponential backoff. Returns Page or None.
+    With a platform, the document comes from / goes to the on-disk cache (storage.http_cache).
+    """
+    cfg = config or get_config()
     to = timeout or cfg.get("page_timeout", 30000)
+    cached = page_cache(url, platform, cfg)
     for attempt in range(retries + 1):
         try:
             page = ctx.new_page()
+            if cached is not None:
+                page.route(cached.matches, cached.handle)
             page.goto(url, wait_until="domcontentloaded", timeout=to)
             return page
         except Exception as e:
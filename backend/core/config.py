@@ -1,7 +1,17 @@
-"""Load config from backend/config.yaml + env."""
+"""
+Load config from backend/config.yaml + env into a frozen, cached snapshot.
+config.yaml is re-parsed only when its mtime/size or the SCRAPER_* environment changes;
+those are re-checked at most once per _RECHECK_SECONDS (reload_config() forces it).
+"""
 
 import os
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
 from pathlib import Path
+from time import monotonic
+from types import MappingProxyType
+from typing import Any, Iterator
 
 try:
     import yaml
@@ -9,57 +19,195 @@ except ImportError:
     yaml = None
 
 _BACKEND_ROOT = Path(__file__).resolve().parent.parent
+_CONFIG_PATH = _BACKEND_ROOT / "config.yaml"
+_ENV_PREFIX = "SCRAPER_"
+
+
+def _freeze(v: Any) -> Any:
+    if isinstance(v, dict):
+        return MappingProxyType({k: _freeze(x) for k, x in v.items()})
+    if isinstance(v, (list, tuple)):
+        return tuple(_freeze(x) for x in v)
+    return v
+
+
+@dataclass(frozen=True)
+class ScraperConfig(Mapping):
+    """
+    Immutable config snapshot. Typed attributes (cfg.page_timeout) and the old dict-style access
+    (cfg.get("page_timeout", 30000), cfg["output_dir"]) both work.
+    Every scalar field can be overridden with SCRAPER_<FIELD_NAME>.
+    """
+
+    max_runtime_per_platform: int = 240
+    max_pages_per_platform: int = 30
+    max_items_per_platform: int = 800
+    no_new_leads_limit: int = 8
+    min_items_to_scan_before_early_stop: int = 150
+    watchdog_timeout: int = 60
+    global_max_runtime: int = 900
+    workers: int = 1
+    worker_kill_grace: int = 30
+    months_lookback: int = 6
+    headless: bool = True
+    page_timeout: int = 30000
+    slow_mo: int = 0
+    viewport: Mapping = field(default_factory=lambda: _freeze({"width": 1280, "height": 720}))
+    browser_pool_size: int = 1
+    browser_max_contexts: int = 50
+    block_resources: Mapping = field(
+        default_factory=lambda: _freeze({"enabled": False, "types": [], "hosts": [], "allow": {}})
+    )
+    concurrent_pages: int = 4
+    per_domain_concurrency: int = 3
+    http_fast_path: bool = True
+    http_timeout: int = 15
+    http_cache: Mapping = field(
+        default_factory=lambda: _freeze({"enabled": False, "ttl_seconds": {}, "immutable_after_days": 30})
+    )
+    seen_index: Mapping = field(default_factory=lambda: _freeze({"enabled": False}))
+    lead_store: Mapping = field(default_factory=lambda: _freeze({"enabled": False}))
+    near_dedupe: Mapping = field(default_factory=lambda: _freeze({"enabled": False}))
+    run_journal: Mapping = field(default_factory=lambda: _freeze({"enabled": False}))
+    search_keywords: tuple[str, ...] = ()
+    platforms_enabled: Mapping = field(default_factory=lambda: _freeze({}))
+    random_delay_ms_min: int = 200
+    random_delay_ms_max: int = 900
+    per_domain_cap: int = 15
+    output_dir: Path = _BACKEND_ROOT / "outputs"
+    xlsx_prefix: str = "leads_"
+    jsonl_prefix: str = "leads_"
+    parquet_archive: bool = False
+    archive_dir: Path = _BACKEND_ROOT / "outputs" / "archive"
+    # Changes whenever a new snapshot is built - key for caches derived from config
+    version: int = 0
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        return (f.name for f in fields(self))
+
+    def __len__(self) -> int:
+        return len(fields(self))
+
+    __hash__ = object.__hash__
+
+
+_SCALARS = {f.name: f.type for f in fields(ScraperConfig) if f.type in (int, bool, str)}
 
 
 def _load_yaml() -> dict:
-    path = _BACKEND_ROOT / "config.yaml"
-    if not path.exists() or yaml is None:
+    if not _CONFIG_PATH.exists() or yaml is None:
         return {}
-    with open(path) as f:
+    with open(_CONFIG_PATH) as f:
         return yaml.safe_load(f) or {}
 
 
-def get_config() -> dict:
-    cfg = _load_yaml()
-    scraper = cfg.get("scraper") or {}
-    output = cfg.get("output") or {}
+def _env_overlay() -> dict[str, str]:
+    return {k: v for k, v in os.environ.items() if k.startswith(_ENV_PREFIX)}
 
-    # Env overrides (SCRAPER_*)
-    def env_int(key: str, default: int) -> int:
-        v = os.environ.get(f"SCRAPER_{key.upper()}")
-        return int(v) if v is not None else scraper.get(key, default)
 
-    def env_bool(key: str, default: bool) -> bool:
-        v = os.environ.get(f"SCRAPER_{key.upper()}")
-        if v is not None:
-            return v.lower() in ("1", "true", "yes")
-        return scraper.get(key, default)
-
-    return {
-        "max_runtime_per_platform": env_int("max_runtime_per_platform", 240),
-        "max_pages_per_platform": env_int("max_pages_per_platform", 30),
-        "max_items_per_platform": env_int("max_items_per_platform", 800),
-        "no_new_leads_limit": env_int("no_new_leads_limit", 8),
-        "min_items_to_scan_before_early_stop": env_int("min_items_to_scan_before_early_stop", 150),
-        "watchdog_timeout": env_int("watchdog_timeout", 60),
-        "global_max_runtime": env_int("global_max_runtime", 900),
-        "months_lookback": env_int("months_lookback", 6),
-        "headless": env_bool("headless", True),
-        "page_timeout": scraper.get("page_timeout", 30000),
-        "slow_mo": scraper.get("slow_mo", 0),
-        "viewport": scraper.get("viewport") or {"width": 1280, "height": 720},
-        "search_keywords": scraper.get("search_keywords") or [],
-        "platforms_enabled": scraper.get("platforms") or {},
-        "random_delay_ms_min": scraper.get("random_delay_ms_min", 200),
-        "random_delay_ms_max": scraper.get("random_delay_ms_max", 900),
-        "per_domain_cap": scraper.get("per_domain_cap", 15),
-        "output_dir": _BACKEND_ROOT / (output.get("dir") or "outputs"),
-        "xlsx_prefix": output.get("xlsx_prefix") or "leads_",
-        "jsonl_prefix": output.get("jsonl_prefix") or "leads_",
+def _coerce(kind: type, raw: str) -> Any:
+    if kind is bool:
+        return raw.lower() in ("1", "true", "yes")
+    return kind(raw)
+
+
+def _build(raw: dict, env: dict[str, str], version: int) -> ScraperConfig:
+    scraper = raw.get("scraper") or {}
+    output = raw.get("output") or {}
+    values: dict[str, Any] = {
+        name: scraper[name] for name in _SCALARS if scraper.get(name) is not None
     }
+    block = scraper.get("block_resources") or {}
+    cache = dict(scraper.get("http_cache") or {})
+    seen = dict(scraper.get("seen_index") or {})
+    store = dict(scraper.get("lead_store") or {})
+    near = dict(scraper.get("near_dedupe") or {})
+    journal = dict(scraper.get("run_journal") or {})
+    values.update(
+        viewport=_freeze(scraper.get("viewport") or {"width": 1280, "height": 720}),
+        block_resources={
+            "enabled": bool(block.get("enabled", False)),
+            "types": list(block.get("types") or []),
+            "hosts": list(block.get("hosts") or []),
+            "allow": dict(block.get("allow") or {}),
+        },
+        http_cache={"ttl_seconds": {}, "immutable_after_days": 30, **cache, "enabled": bool(cache.get("enabled"))},
+        seen_index={**seen, "enabled": bool(seen.get("enabled"))},
+        lead_store={**store, "enabled": bool(store.get("enabled"))},
+        near_dedupe={"threshold": 0.7, **near, "enabled": bool(near.get("enabled"))},
+        run_journal={**journal, "enabled": bool(journal.get("enabled"))},
+        search_keywords=tuple(scraper.get("search_keywords") or ()),
+        platforms_enabled=_freeze(scraper.get("platforms") or {}),
+        output_dir=_BACKEND_ROOT / (output.get("dir") or "outputs"),
+        xlsx_prefix=output.get("xlsx_prefix") or "leads_",
+        jsonl_prefix=output.get("jsonl_prefix") or "leads_",
+        parquet_archive=bool(output.get("parquet_archive", False)),
+        archive_dir=_BACKEND_ROOT / (output.get("archive_dir") or "outputs/archive"),
+    )
+
+    # Env overlay (SCRAPER_*): every scalar field, plus on/off switches for the mapping sections
+    for name, kind in _SCALARS.items():
+        v = env.get(_ENV_PREFIX + name.upper())
+        if v is not None:
+            values[name] = _coerce(kind, v)
+    for section in ("block_resources", "http_cache", "seen_index", "lead_store", "near_dedupe", "run_journal"):
+        v = env.get(_ENV_PREFIX + section.upper())
+        if v is not None:
+            values[section]["enabled"] = _coerce(bool, v)
+        values[section] = _freeze(values[section])
+    return ScraperConfig(**values, version=version)
+
+
+_RECHECK_SECONDS = 1.0
+
+_lock = threading.Lock()
+_cached: tuple[tuple, ScraperConfig] | None = None
+_checked_at = 0.0
+_version = 0
+
+
+def _cache_key() -> tuple:
+    try:
+        st = _CONFIG_PATH.stat()
+        file_key: tuple = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        file_key = (None, None)
+    return file_key + tuple(sorted(_env_overlay().items()))
+
+
+def get_config() -> ScraperConfig:
+    """Current snapshot; rebuilt only when config.yaml (mtime/size) or SCRAPER_* env changed."""
+    global _cached, _checked_at, _version
+    cached = _cached
+    now = monotonic()
+    if cached is not None and now - _checked_at < _RECHECK_SECONDS:
+        return cached[1]
+    key = _cache_key()
+    with _lock:
+        _checked_at = now
+        if _cached is not None and _cached[0] == key:
+            return _cached[1]
+        _version += 1
+        cfg = _build(_load_yaml(), _env_overlay(), _version)
+        _cached = (key, cfg)
+        return cfg
+
+
+def reload_config() -> ScraperConfig:
+    """Drop the cached snapshot and re-read config.yaml + env now (e.g. after setting SCRAPER_* in-process)."""
+    global _cached
+    with _lock:
+        _cached = None
+    return get_config()
 
 
-def get_platforms_to_run() -> list[str]:
-    cfg = get_config()
+def get_platforms_to_run(config: ScraperConfig | None = None) -> list[str]:
+    cfg = config or get_config()
     enabled = cfg.get("platforms_enabled") or {}
     return [k for k, v in enabled.items() if v]
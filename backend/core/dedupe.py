@@ -1,51 +1,94 @@
-"""Deduplicate by normalized email and (platform, post_url); fuzzy name+url."""
+"""
+Deduplicate by normalized email and (platform, post_url); fuzzy name+url.
+URLs compare by core.url_canon.canonical_key, so every spelling of a post is the same URL.
+DedupeEngine keeps a hash index per rule, so each add() is O(1) and it can run online
+as leads arrive; dedupe_leads is the batch wrapper (first occurrence is the record,
+later duplicates are merged into it).
+"""
+
+from typing import Any, Iterable, NamedTuple
 
 from core.email_extract import normalize_email
-from core.models import Lead
+from core.merge import merged
+from core.models import Lead, LeadRecord, as_given, as_record
+from core.url_canon import canonical_key
+
 
+class DedupeResult(NamedTuple):
+    accepted: bool
+    duplicate_of: LeadRecord | None = None  # current record the lead was folded into
+    reason: str = ""  # "email" | "platform_url" | "name_url"
+    position: int = -1  # slot in DedupeEngine.accepted holding the (possibly merged) record
 
-def _normalize_url(url: str) -> str:
-    u = (url or "").strip().lower()
-    if u.endswith("/"):
-        u = u[:-1]
-    return u
 
+class DedupeEngine:
+    """
+    Rules, in order: an email already seen; a (platform, url) already seen; the same
+    client_name + url as an accepted lead. Email and (platform, url) keys are claimed
+    even when a later rule rejects the lead. With merge (default) a duplicate is folded
+    into the accepted record per core.merge.MERGE_POLICY (a merged copy replaces it; inputs
+    are never modified); without it the first lead wins unchanged.
+    """
 
-def dedupe_leads(leads: list[Lead]) -> list[Lead]:
-    seen_emails: set[str] = set()
-    seen_platform_url: set[tuple[str, str]] = set()
-    out: list[Lead] = []
+    def __init__(self, merge: bool = True, policy: dict[str, str] | None = None):
+        self.merge = merge
+        self.policy = policy
+        # Indexes hold positions in self.accepted, so a merged record can replace its slot
+        self._emails: dict[str, int] = {}
+        self._platform_urls: dict[tuple[str, str], int] = {}
+        self._name_urls: dict[tuple[str, str], int] = {}  # accepted leads only
+        self.accepted: list[LeadRecord] = []
 
-    for lead in leads:
+    def _duplicate(self, pos: int, lead: LeadRecord, reason: str, claims: list[tuple[dict, Any]]) -> DedupeResult:
+        for index, key in claims:
+            index[key] = pos
+        if self.merge:
+            self.accepted[pos] = merged(self.accepted[pos], lead, self.policy)
+        return DedupeResult(False, self.accepted[pos], reason, pos)
+
+    def add(self, lead: LeadRecord | Lead) -> DedupeResult:
+        lead = as_record(lead)
         email_key = normalize_email(lead.email) if lead.email else ""
-        url_key = _normalize_url(lead.post_url)
+        url_key = canonical_key(lead.post_url)
         platform = (lead.platform or "").strip().lower()
+        claims: list[tuple[dict, Any]] = []
 
-        # Dedupe by email (keep first)
-        if email_key and email_key in seen_emails:
-            continue
         if email_key:
-            seen_emails.add(email_key)
+            pos = self._emails.get(email_key)
+            if pos is not None:
+                return self._duplicate(pos, lead, "email", claims)
+            claims.append((self._emails, email_key))
 
-        # Dedupe by (platform, post_url)
         if platform and url_key:
             key = (platform, url_key)
-            if key in seen_platform_url:
-                continue
-            seen_platform_url.add(key)
-
-        # Fuzzy: same client_name + very similar url (same base)
-        if lead.client_name and url_key:
-            skip = False
-            for existing in out:
-                en = (existing.client_name or "").strip().lower()
-                cn = (lead.client_name or "").strip().lower()
-                if en and cn and en == cn and _normalize_url(existing.post_url) == url_key:
-                    skip = True
-                    break
-            if skip:
-                continue
-
-        out.append(lead)
-
-    return out
+            pos = self._platform_urls.get(key)
+            if pos is not None:
+                return self._duplicate(pos, lead, "platform_url", claims)
+            claims.append((self._platform_urls, key))
+
+        name = (lead.client_name or "").strip().lower()
+        if name and url_key:
+            pos = self._name_urls.get((name, url_key))
+            if pos is not None:
+                return self._duplicate(pos, lead, "name_url", claims)
+            claims.append((self._name_urls, (name, url_key)))
+
+        pos = len(self.accepted)
+        for index, key in claims:
+            index[key] = pos
+        self.accepted.append(lead)
+        return DedupeResult(True, position=pos)
+
+    def add_many(self, leads: Iterable[LeadRecord | Lead]) -> list[LeadRecord]:
+        """Records accepted from this batch, in input order (merged with any later duplicates)."""
+        start = len(self.accepted)
+        for lead in leads:
+            self.add(lead)
+        return self.accepted[start:]
+
+
+def dedupe_leads(leads: list[LeadRecord] | list[Lead], merge: bool = True) -> list[LeadRecord] | list[Lead]:
+    """Deduped (and merged) leads in input order; API Leads in, API Leads out."""
+    leads = list(leads)
+    records = [as_record(l) for l in leads]
+    return as_given(DedupeEngine(merge=merge).add_many(records), records, leads)
@@ -1,7 +1,10 @@
 """Rule-based project description summary - no LLM. Max 400 chars."""
 
 import re
-from core.requirement_scoring import REQUIREMENT_KEYWORDS, BUDGET_PAT
+from core.requirement_scoring import REQUIREMENT_KEYWORDS, BUDGET_PAT, INTENT_WORDS, get_matcher
+
+_KW_SET = frozenset(k.lower() for k in REQUIREMENT_KEYWORDS)
+_INTENT_SET = frozenset(INTENT_WORDS)
 
 
 def summarize_project(text: str | None, max_chars: int = 400) -> str:
@@ -14,19 +17,16 @@ def summarize_project(text: str | None, max_chars: int = 400) -> str:
     # Prefer sentences with keywords or budget
     sentences = re.split(r"[.!?]\s+", text)
     scored: list[tuple[int, str]] = []
-    kw_set = set(k.lower() for k in REQUIREMENT_KEYWORDS)
+    matcher, _ = get_matcher()
     for s in sentences:
         s = s.strip()
         if not s:
             continue
-        sc = 0
-        low = s.lower()
-        for kw in kw_set:
-            if kw in low:
-                sc += 2
+        found = matcher.found(s.lower())
+        sc = 2 * len(found & _KW_SET)
         if BUDGET_PAT.search(s):
             sc += 3
-        if any(w in low for w in ("need", "looking", "hire", "build", "want", "seeking")):
+        if found & _INTENT_SET:
             sc += 1
         scored.append((sc, s))
 
@@ -1,59 +1,207 @@
-"""Export leads to XLSX and JSONL."""
+"""
+Export leads to XLSX and JSONL.
+Streaming: leads may be any iterable (generator included); XLSX uses an openpyxl write-only
+worksheet (rows appended and flushed to a temp file, never held as cells), and
+export_leads writes both files in one pass. Memory stays flat in the row count.
+export_parquet appends a run to the columnar archive (outputs/archive/run_date=/platform=/);
+storage.archive reads it back with predicate pushdown.
+"""
 
-import json
+import os
+from contextlib import suppress
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterable
 
 from core.config import get_config
-from core.models import Lead
+from core.models import Lead, LeadRecord, as_record
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
 
-def _output_dir() -> Path:
-    cfg = get_config()
+HEADERS = [
+    "client_name", "post_url", "email", "project_description",
+    "platform", "post_date", "post_text_snippet", "company", "source_type",
+    "confidence_score", "email_source", "keywords_matched", "location", "source_urls",
+]
+
+
+def _output_dir(config: dict | None = None) -> Path:
+    cfg = config or get_config()
     d = Path(cfg["output_dir"])
     d.mkdir(parents=True, exist_ok=True)
     return d
 
 
-def _timestamp() -> str:
+def file_timestamp() -> str:
     return datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
 
 
-def export_xlsx(leads: list[Lead]) -> str:
-    """Write leads to XLSX; return path."""
+def _xlsx_sheet(title: str, headers: list[str]):
+    """(workbook, worksheet) in write-only mode with a bold header row appended."""
     try:
         import openpyxl
+        from openpyxl.cell import WriteOnlyCell
         from openpyxl.styles import Font
     except ImportError:
         raise RuntimeError("pip install openpyxl")
-    cfg = get_config()
-    prefix = cfg.get("xlsx_prefix") or "leads_"
-    path = _output_dir() / f"{prefix}{_timestamp()}.xlsx"
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Leads"
-    headers = [
-        "client_name", "post_url", "email", "project_description",
-        "platform", "post_date", "post_text_snippet", "company", "source_type",
-        "confidence_score", "email_source", "keywords_matched", "location",
-    ]
-    for col, h in enumerate(headers, 1):
-        ws.cell(row=1, column=col, value=h)
-        ws.cell(row=1, column=col).font = Font(bold=True)
-    for row, lead in enumerate(leads, 2):
-        row_data = lead.to_row()
-        for col, h in enumerate(headers, 1):
-            ws.cell(row=row, column=col, value=row_data.get(h, ""))
-    wb.save(path)
-    return str(path)
-
-
-def export_jsonl(leads: list[Lead]) -> str:
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet(title)
+    bold = Font(bold=True)
+    header = []
+    for h in headers:
+        cell = WriteOnlyCell(ws, value=h)
+        cell.font = bold
+        header.append(cell)
+    ws.append(header)
+    return wb, ws
+
+
+def export_leads(
+    leads: Iterable[LeadRecord | Lead],
+    config: dict | None = None,
+    xlsx: bool = True,
+    jsonl: bool = True,
+    timestamp: str | None = None,
+) -> tuple[str, str]:
+    """
+    Write leads to XLSX and/or JSONL in a single pass; return (xlsx_path, jsonl_path), "" when skipped.
+    Both files are written next to their final names and moved into place when complete (removed on
+    failure), so passing the timestamp of a live file (core.pipeline) replaces it atomically.
+    """
+    cfg = config or get_config()
+    out = _output_dir(cfg)
+    ts = timestamp or file_timestamp()
+    xlsx_path = out / f"{cfg.get('xlsx_prefix') or 'leads_'}{ts}.xlsx" if xlsx else None
+    jsonl_path = jsonl_file(ts, cfg) if jsonl else None
+    xlsx_tmp = xlsx_path.with_name(xlsx_path.name + ".tmp") if xlsx_path else None
+    jsonl_tmp = jsonl_path.with_name(jsonl_path.name + ".tmp") if jsonl_path else None
+    wb, ws = _xlsx_sheet("Leads", HEADERS) if xlsx_path else (None, None)
+    f = open(jsonl_tmp, "w", encoding="utf-8") if jsonl_tmp else None
+    try:
+        try:
+            for lead in leads:
+                lead = as_record(lead)
+                if ws is not None:
+                    row = lead.to_row()
+                    ws.append([row.get(h, "") for h in HEADERS])
+                if f is not None:
+                    f.write(lead.to_json() + "\n")
+            if wb is not None:
+                wb.save(xlsx_tmp)
+        finally:
+            if f is not None:
+                f.close()
+    except BaseException:
+        if ws is not None and not ws.closed:
+            with suppress(Exception):
+                ws.close()  # end the sheet's row stream; the workbook is never saved
+        for tmp in (xlsx_tmp, jsonl_tmp):
+            if tmp is not None:
+                tmp.unlink(missing_ok=True)
+        raise
+    if xlsx_tmp is not None:
+        os.replace(xlsx_tmp, xlsx_path)
+    if jsonl_tmp is not None:
+        os.replace(jsonl_tmp, jsonl_path)
+    return str(xlsx_path or ""), str(jsonl_path or "")
+
+
+def jsonl_file(timestamp: str, config: dict | None = None) -> Path:
+    """Path export_leads uses for the JSONL of this timestamp."""
+    cfg = config or get_config()
+    return _output_dir(cfg) / f"{cfg.get('jsonl_prefix') or 'leads_'}{timestamp}.jsonl"
+
+
+def export_xlsx(leads: Iterable[LeadRecord | Lead], config: dict | None = None) -> str:
+    """Write leads to XLSX; return path."""
+    return export_leads(leads, config, jsonl=False)[0]
+
+
+def export_jsonl(leads: Iterable[LeadRecord | Lead], config: dict | None = None) -> str:
     """Write leads to JSONL; return path."""
-    cfg = get_config()
-    prefix = cfg.get("jsonl_prefix") or "leads_"
-    path = _output_dir() / f"{prefix}{_timestamp()}.jsonl"
-    with open(path, "w") as f:
+    return export_leads(leads, config, xlsx=False)[1]
+
+
+ARCHIVE_BATCH_ROWS = 50_000
+
+
+def archive_schema():
+    """Columns stored in each archive file; run_date and platform live in the partition path."""
+    category = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ("run_id", pa.string()),
+        ("client_name", pa.string()),
+        ("post_url", pa.string()),
+        ("email", pa.string()),
+        ("project_description", pa.string()),
+        ("post_date", pa.string()),  # ISO; string order is date order
+        ("post_text_snippet", pa.string()),
+        ("company", pa.string()),
+        ("source_type", category),
+        ("confidence_score", pa.int16()),
+        ("email_source", category),
+        ("keywords_matched", pa.string()),
+        ("location", pa.string()),
+        ("source_urls", pa.list_(pa.string())),
+    ])
+
+
+def _archive_batch(rows: list[LeadRecord], run_id: str, schema) -> "pa.RecordBatch":
+    cols: dict[str, list] = {name: [] for name in schema.names}
+    for lead in rows:
+        r = lead.to_row()
+        for name in schema.names:
+            if name == "run_id":
+                cols[name].append(run_id)
+            elif name == "source_urls":
+                cols[name].append(list(lead.source_urls))
+            else:
+                cols[name].append(r[name])
+    return pa.RecordBatch.from_arrays(
+        [pa.array(cols[f.name], type=f.type) for f in schema], schema=schema
+    )
+
+
+def export_parquet(
+    leads: Iterable[LeadRecord],
+    run_id: str,
+    config: dict | None = None,
+    run_date: str | None = None,
+) -> list[str]:
+    """Append a run to the Parquet archive, one file per platform:
+    <archive_dir>/run_date=YYYY-MM-DD/platform=<name>/<run_id>.parquet. Returns the files written."""
+    if pa is None:
+        raise RuntimeError("pip install pyarrow")
+    cfg = config or get_config()
+    root = Path(cfg.get("archive_dir") or Path(cfg["output_dir"]) / "archive")
+    day = run_date or datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    schema = archive_schema()
+    writers: dict[str, "pq.ParquetWriter"] = {}
+    pending: dict[str, list[LeadRecord]] = {}
+    paths: dict[str, Path] = {}
+
+    def flush(platform: str) -> None:
+        if platform not in writers:
+            d = root / f"run_date={day}" / f"platform={platform}"
+            d.mkdir(parents=True, exist_ok=True)
+            paths[platform] = d / f"{run_id}.parquet"
+            writers[platform] = pq.ParquetWriter(paths[platform], schema, compression="zstd")
+        writers[platform].write_batch(_archive_batch(pending.pop(platform), run_id, schema))
+
+    try:
         for lead in leads:
-            f.write(json.dumps(lead.model_dump(mode="json")) + "\n")
-    return str(path)
+            platform = (lead.platform or "unknown").strip().lower() or "unknown"
+            pending.setdefault(platform, []).append(lead)
+            if len(pending[platform]) >= ARCHIVE_BATCH_ROWS:
+                flush(platform)
+        for platform in list(pending):
+            flush(platform)
+    finally:
+        for w in writers.values():
+            w.close()
+    return [str(p) for p in paths.values()]
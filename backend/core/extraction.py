@@ -0,0 +1,47 @@
+"""
+Declarative DOM extraction - a platform's fields read in one page.evaluate.
+A spec maps field -> {"selectors": [tried in order, first match wins], "attr": optional attribute};
+without "attr" the field is the element's innerText. Missing fields come back as None.
+"""
+
+from typing import Any, Awaitable, Callable
+
+EXTRACT_JS = """
+(spec) => {
+  const out = {};
+  for (const [name, field] of Object.entries(spec)) {
+    let value = null;
+    for (const sel of field.selectors || []) {
+      let el = null;
+      try { el = document.querySelector(sel); } catch (e) {}
+      if (!el) continue;
+      value = field.attr ? el.getAttribute(field.attr) : (el.innerText || "");
+      break;
+    }
+    out[name] = value;
+  }
+  return out;
+}
+"""
+
+Spec = dict[str, dict[str, Any]]
+
+
+def extract_fields(page: Any, spec: Spec) -> dict[str, str | None]:
+    """Run spec on a sync Playwright page; one browser round trip."""
+    return page.evaluate(EXTRACT_JS, spec) or {}
+
+
+async def extract_fields_async(page: Any, spec: Spec) -> dict[str, str | None]:
+    return await page.evaluate(EXTRACT_JS, spec) or {}
+
+
+def fields_extractor(spec: Spec) -> Callable[[Any, str], Awaitable[dict[str, str | None]]]:
+    """extract callback for AsyncPageEngine.run()."""
+    async def extract(page: Any, url: str) -> dict[str, str | None]:
+        return await extract_fields_async(page, spec)
+    return extract
+
+
+def field_text(fields: dict[str, str | None], name: str) -> str:
+    return (fields.get(name) or "").strip()
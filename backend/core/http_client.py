@@ -0,0 +1,240 @@
+"""
+Pooled HTTP tier for JSON and static HTML - keep-alive, HTTP/2 (when h2 is installed), gzip.
+Connectors try it before opening a browser tab; None from get_json/get_html means
+"use the browser". A host that answers with a block status (401/403/407/429/503) carrying a
+bot-check interstitial is skipped for the rest of the process so later requests go straight to the
+browser. 429/503 without one are transient: retried with backoff, then that one URL falls back.
+With a platform given, responses are served from / stored in storage.http_cache.
+"""
+
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Any
+from urllib.parse import urljoin, urlparse
+
+from core.browser import USER_AGENTS
+from core.config import get_config
+from core.logging import log_error, log_message
+from storage.http_cache import CachedResponse, HttpCache, get_http_cache
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401 - enables http2=True in httpx
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+BLOCK_STATUSES = {401, 403, 407, 429, 503}
+TRANSIENT_STATUSES = {429, 503}
+# Bot-check interstitials, not words an ordinary page contains (a page loading reCAPTCHA says "captcha")
+BLOCK_MARKERS = (
+    "cf-chl", "cf_chl_opt", "are you a robot", "unusual traffic from your computer",
+    "<title>just a moment", "<title>attention required", "px-captcha", "ddos-guard",
+)
+MAX_RETRY_AFTER = 10.0
+
+
+def _interstitial(r: Any) -> bool:
+    try:
+        head = r.text[:5000].lower()
+    except Exception:
+        return False
+    return any(m in head for m in BLOCK_MARKERS)
+
+
+def _retry_delay(r: Any, attempt: int, backoff: float) -> float:
+    try:
+        return min(float(r.headers.get("retry-after", "")), MAX_RETRY_AFTER)
+    except ValueError:
+        return backoff * 2 ** attempt
+
+
+class HttpClient:
+    """One pooled httpx.Client per process; thread-safe for concurrent GETs."""
+
+    def __init__(
+        self,
+        timeout: float = 15.0,
+        transport: Any = None,
+        cache: HttpCache | None = None,
+        retries: int = 1,
+        backoff: float = 1.0,
+    ):
+        if httpx is None:
+            raise RuntimeError("Install httpx: pip install 'httpx[http2]'")
+        self._client = httpx.Client(
+            http2=_HTTP2 and transport is None,
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0),
+            headers={
+                "User-Agent": random.choice(USER_AGENTS),
+                "Accept-Language": "en-US,en;q=0.9",
+            },
+            transport=transport,
+        )
+        self.cache = cache
+        self.retries = retries
+        self.backoff = backoff
+        self._blocked: set[str] = set()
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        self._client.close()
+
+    def is_blocked(self, url: str) -> bool:
+        return urlparse(url).netloc.lower() in self._blocked
+
+    def _mark_blocked(self, url: str, reason: str) -> None:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            if host in self._blocked:
+                return
+            self._blocked.add(host)
+        log_message("http fast path blocked; using browser for host", host=host, reason=reason)
+
+    def _cached(self, url: str, entry: CachedResponse) -> Any:
+        return httpx.Response(
+            entry.status,
+            headers={"content-type": entry.content_type},
+            content=entry.body,
+            request=httpx.Request("GET", url),
+        )
+
+    def _get(self, url: str, accept: str, platform: str) -> tuple[Any | None, bool]:
+        """(response, served_from_cache). Fresh cache entries skip the network; stale ones are revalidated."""
+        entry = self.cache.get(url) if self.cache is not None and platform else None
+        if entry is not None and entry.is_fresh(self.cache.ttl_for(platform)):
+            return self._cached(url, entry), True
+        if self.is_blocked(url):
+            return None, False
+        headers = {"Accept": accept, **(entry.validators() if entry is not None else {})}
+        for attempt in range(self.retries + 1):
+            try:
+                r = self._client.get(url, headers=headers)
+            except Exception as e:
+                log_error("http get failed", url=url, error=str(e))
+                return None, False
+            if r.status_code in BLOCK_STATUSES and _interstitial(r):
+                self._mark_blocked(url, f"status {r.status_code} interstitial")
+                return None, False
+            if r.status_code not in TRANSIENT_STATUSES or attempt == self.retries:
+                break
+            time.sleep(_retry_delay(r, attempt, self.backoff))
+        if r.status_code == 304 and entry is not None:
+            self.cache.touch(url)
+            return self._cached(url, entry), True
+        if not r.is_success:
+            return None, False
+        return r, False
+
+    def _store(self, url: str, platform: str, r: Any) -> None:
+        if self.cache is not None and platform:
+            self.cache.put(
+                url, platform, r.status_code, r.headers.get("content-type", ""), r.content,
+                etag=r.headers.get("etag"), last_modified=r.headers.get("last-modified"),
+            )
+
+    def get(self, url: str, accept: str = "*/*", platform: str = "") -> Any | None:
+        """httpx.Response for a usable 2xx answer (possibly from cache), else None (error, block, non-2xx)."""
+        return self._get(url, accept, platform)[0]
+
+    def get_json(self, url: str, platform: str = "") -> Any | None:
+        r, cached = self._get(url, "application/json", platform)
+        if r is None:
+            return None
+        try:
+            data = r.json()
+        except (json.JSONDecodeError, ValueError):
+            return None  # empty, truncated or an HTML gate page: this URL goes to the browser, the host stays on HTTP
+        if not cached:
+            self._store(url, platform, r)
+        return data
+
+    def get_html(self, url: str, platform: str = "") -> str | None:
+        r, cached = self._get(url, "text/html,application/xhtml+xml", platform)
+        if r is None or "html" not in r.headers.get("content-type", "html"):
+            return None
+        if _interstitial(r):
+            return None  # challenge served as 200: this page goes to the browser, the host stays on HTTP
+        text = r.text
+        if not cached:
+            self._store(url, platform, r)
+        return text
+
+
+_client: HttpClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_http_client(config: dict | None = None) -> HttpClient | None:
+    """Shared client, or None when the fast path is disabled (scraper.http_fast_path) or httpx is missing."""
+    global _client
+    cfg = config or get_config()
+    if not cfg.get("http_fast_path", True) or httpx is None:
+        return None
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient(timeout=cfg.get("http_timeout", 15), cache=get_http_cache(cfg))
+        return _client
+
+
+def close_http_client() -> None:
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+@dataclass
+class Link:
+    href: str
+    classes: frozenset[str] = frozenset()
+    # classes of every ancestor element, for "li.b_algo a"-style matches
+    parent_classes: frozenset[str] = field(default_factory=frozenset)
+
+
+_VOID = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+
+class _LinkParser(HTMLParser):
+    def __init__(self, base_url: str):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.links: list[Link] = []
+        self._stack: list[tuple[str, frozenset[str]]] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        a = dict(attrs)
+        classes = frozenset((a.get("class") or "").split())
+        if tag == "a" and a.get("href"):
+            parents = frozenset(c for _, cs in self._stack for c in cs)
+            self.links.append(Link(urljoin(self.base_url, a["href"]), classes, parents))
+        if tag not in _VOID:
+            self._stack.append((tag, classes))
+
+    def handle_endtag(self, tag: str) -> None:
+        for i in range(len(self._stack) - 1, -1, -1):
+            if self._stack[i][0] == tag:
+                del self._stack[i:]
+                return
+
+
+def parse_links(html: str, base_url: str) -> list[Link]:
+    """Every <a href> in document order, made absolute against base_url."""
+    p = _LinkParser(base_url)
+    try:
+        p.feed(html)
+        p.close()
+    except Exception:
+        pass
+    return p.links
@@ -0,0 +1,40 @@
+"""Multi-keyword substring matcher - every keyword present in a text from one automaton pass."""
+
+from typing import Iterable
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """
+    Same answers as `kw in text` for each keyword. With pyahocorasick installed the keywords are
+    compiled into one Aho-Corasick automaton (single scan, overlapping matches included); without
+    it, falls back to one C-level substring scan per keyword - still faster than any pure-Python
+    multi-pattern scan at this keyword count.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: tuple[str, ...] = tuple(dict.fromkeys(k.lower() for k in keywords if k))
+        self._automaton = None
+        if ahocorasick is not None and self.keywords:
+            a = ahocorasick.Automaton()
+            for k in self.keywords:
+                a.add_word(k, k)
+            a.make_automaton()
+            self._automaton = a
+
+    def found(self, text: str) -> set[str]:
+        """Keywords occurring anywhere in text (text must already be lowercase)."""
+        if not text:
+            return set()
+        if self._automaton is not None:
+            return {k for _, k in self._automaton.iter(text)}
+        return {k for k in self.keywords if k in text}
+
+    def matches(self, text: str) -> list[str]:
+        """Found keywords in the order they were given."""
+        hits = self.found(text)
+        return [k for k in self.keywords if k in hits]
@@ -0,0 +1,93 @@
+"""
+Merge policy for duplicate leads - fold a duplicate into the kept record field by field
+instead of dropping it. MERGE_POLICY maps each LeadRecord field to a strategy in STRATEGIES;
+fields not listed keep the record's value (platform, post_url, source_type).
+merged() returns a new record, so inputs never change under the caller (an API Lead given as
+`record` comes back as a Lead).
+"""
+
+from dataclasses import replace
+from typing import Any, Callable
+
+from core.models import EmailSource, Lead, LeadRecord, as_record
+
+
+def prefer_non_empty(kept: Any, other: Any) -> Any:
+    return kept if kept else other
+
+
+def longest(kept: str, other: str) -> str:
+    return other if len(other or "") > len(kept or "") else kept
+
+
+def max_value(kept: int, other: int) -> int:
+    return max(kept or 0, other or 0)
+
+
+def earliest(kept: str | None, other: str | None) -> str | None:
+    """Earliest ISO date; empty values never win."""
+    if not kept:
+        return other
+    if not other:
+        return kept
+    return min(kept, other)
+
+
+def union_csv(kept: str, other: str) -> str:
+    """Comma-separated union, first spelling and order kept, case-insensitive."""
+    out: list[str] = []
+    seen: set[str] = set()
+    for item in f"{kept or ''},{other or ''}".split(","):
+        item = item.strip()
+        if item and item.lower() not in seen:
+            seen.add(item.lower())
+            out.append(item)
+    return ", ".join(out)
+
+
+STRATEGIES: dict[str, Callable[[Any, Any], Any]] = {
+    "prefer_non_empty": prefer_non_empty,
+    "longest": longest,
+    "max": max_value,
+    "earliest": earliest,
+    "union": union_csv,
+}
+
+MERGE_POLICY: dict[str, str] = {
+    "client_name": "prefer_non_empty",
+    "company": "prefer_non_empty",
+    "location": "prefer_non_empty",
+    "project_description": "longest",
+    "post_text_snippet": "longest",
+    "post_date": "earliest",
+    "confidence_score": "max",
+    "keywords_matched": "union",
+}
+
+
+def merged(record: LeadRecord | Lead, other: LeadRecord | Lead, policy: dict[str, str] | None = None) -> LeadRecord | Lead:
+    """record with other folded in - a new record (inputs are not modified), or record itself if nothing changed."""
+    if isinstance(record, Lead):
+        kept = as_record(record)
+        out = merged(kept, other, policy)
+        return record if out is kept else out.to_lead()
+    other = as_record(other)
+    updates: dict[str, Any] = {}
+    for name, strategy in (policy or MERGE_POLICY).items():
+        kept = getattr(record, name)
+        value = STRATEGIES[strategy](kept, getattr(other, name))
+        if value != kept:
+            updates[name] = value
+    # email and its provenance travel together
+    if not record.email and other.email:
+        updates["email"] = other.email
+        updates["email_source"] = other.email_source
+    elif record.email_source == EmailSource.NONE and other.email_source != EmailSource.NONE and record.email == other.email:
+        updates["email_source"] = other.email_source
+    new_urls = [u for u in (other.post_url, *other.source_urls) if u and u != record.post_url]
+    if new_urls:
+        urls = list(record.source_urls)
+        urls.extend(u for u in dict.fromkeys(new_urls) if u not in urls)
+        if len(urls) != len(record.source_urls):
+            updates["source_urls"] = urls
+    return replace(record, **updates) if updates else record
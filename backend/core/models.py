@@ -1,10 +1,15 @@
-"""Pydantic models for leads and run metadata."""
+"""
+Lead and run models. LeadRecord is the record that flows through fetch, dedupe, store and
+export: a slotted dataclass, no validation, no per-instance __dict__. Lead is its Pydantic
+twin for the API boundary (to_lead / LeadRecord.from_lead convert).
+"""
 
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class SourceType(str, Enum):
@@ -25,8 +30,9 @@ class EmailSource(str, Enum):
     NONE = "none"
 
 
-class Lead(BaseModel):
-    """Single lead - required and recommended columns."""
+@dataclass(slots=True)
+class LeadRecord:
+    """Single lead - required and recommended columns. Internal; types are trusted, not validated."""
 
     client_name: str = ""
     post_url: str = ""
@@ -42,6 +48,8 @@ class Lead(BaseModel):
     email_source: EmailSource = EmailSource.NONE
     keywords_matched: str = ""  # comma-separated
     location: str = ""
+    # Other URLs carrying the same requirement (cross-posts folded in by core.near_dedupe)
+    source_urls: list[str] = field(default_factory=list)
 
     def to_row(self) -> dict[str, Any]:
         return {
@@ -58,15 +66,91 @@ class Lead(BaseModel):
             "email_source": self.email_source.value,
             "keywords_matched": self.keywords_matched,
             "location": self.location,
+            "source_urls": "\n".join(self.source_urls),
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """All fields, JSON-ready (enum values, source_urls as a list) - same shape as Lead.model_dump(mode="json")."""
+        return {
+            "client_name": self.client_name,
+            "post_url": self.post_url,
+            "email": self.email,
+            "project_description": self.project_description,
+            "platform": self.platform,
+            "post_date": self.post_date,
+            "post_text_snippet": self.post_text_snippet,
+            "company": self.company,
+            "source_type": self.source_type.value,
+            "confidence_score": self.confidence_score,
+            "email_source": self.email_source.value,
+            "keywords_matched": self.keywords_matched,
+            "location": self.location,
+            "source_urls": list(self.source_urls),
         }
 
+    def to_json(self) -> str:
+        """One JSONL line, byte-compatible with Lead.model_dump_json()."""
+        return _RECORD_JSON.dump_json(self).decode()
+
+    def to_lead(self) -> "Lead":
+        return Lead.model_construct(**{name: getattr(self, name) for name in LEAD_FIELDS})
+
+    @classmethod
+    def from_lead(cls, lead: "Lead") -> "LeadRecord":
+        values = {name: getattr(lead, name) for name in LEAD_FIELDS}
+        values["source_urls"] = list(lead.source_urls)
+        return cls(**values)
+
+
+LEAD_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(LeadRecord))
+# pydantic-core serializes the dataclass directly (no model instance, no validation)
+_RECORD_JSON = TypeAdapter(LeadRecord)
+
+
+class Lead(BaseModel):
+    """Single lead as exposed by the API; see LeadRecord for the internal record."""
+
+    client_name: str = ""
+    post_url: str = ""
+    email: str = ""
+    project_description: str = ""
+
+    platform: str = ""
+    post_date: str | None = None  # ISO
+    post_text_snippet: str = ""
+    company: str = ""
+    source_type: SourceType = SourceType.OTHER
+    confidence_score: int = 0  # 0-100
+    email_source: EmailSource = EmailSource.NONE
+    keywords_matched: str = ""  # comma-separated
+    location: str = ""
+    # Other URLs carrying the same requirement (cross-posts folded in by core.near_dedupe)
+    source_urls: list[str] = Field(default_factory=list)
+
+    def to_row(self) -> dict[str, Any]:
+        return LeadRecord.from_lead(self).to_row()
+
+
+def as_record(lead: LeadRecord | Lead) -> LeadRecord:
+    """The internal record for a lead; public helpers (dedupe, merge, export, lead store) accept API Leads too."""
+    return lead if isinstance(lead, LeadRecord) else LeadRecord.from_lead(lead)
+
+
+def as_given(out: list[LeadRecord], records: list[LeadRecord], given: list) -> list:
+    """out in the form the caller passed (records = as_record over given): API Leads come back as
+    Leads - the caller's own objects where a record went through unchanged."""
+    if not any(isinstance(l, Lead) for l in given):
+        return out
+    originals = {id(r): l for r, l in zip(records, given)}
+    return [originals[id(r)] if id(r) in originals else r.to_lead() for r in out]
+
 
 class PlatformResult(BaseModel):
     """Result of running one platform connector."""
 
     platform: str
     success: bool
-    leads: list[Lead] = Field(default_factory=list)
+    leads: list[LeadRecord] = Field(default_factory=list)  # kept as-is, not copied or re-validated
     pages_visited: int = 0
     items_scanned: int = 0
     leads_found: int = 0
@@ -74,6 +158,8 @@ class PlatformResult(BaseModel):
     time_taken_seconds: float = 0.0
     error: str | None = None
     stopped_reason: str = ""  # e.g. "no_new_leads", "max_pages", "timeout"
+    requests_blocked: int = 0  # subresources aborted by scraper.block_resources
+    bytes_saved: int = 0  # estimated from typical size per blocked resource type
 
 
 class RunSummary(BaseModel):
@@ -0,0 +1,147 @@
+"""
+Near-duplicate detection - the same requirement cross-posted under different URLs/usernames.
+Text -> word 3-gram shingles -> MinHash signature (one-permutation hashing, densified) ->
+LSH bands; leads sharing a band are candidates, confirmed by exact shingle Jaccard.
+Band keys are stable across processes, so the lead store can index them for history.
+"""
+
+import hashlib
+import re
+import struct
+from typing import Iterable
+
+from core.config import get_config
+from core.merge import merged
+from core.models import Lead, LeadRecord, as_given, as_record
+
+NUM_PERM = 32
+BANDS = 8  # 4 rows each: P(candidate) ~ 0.89 at Jaccard 0.7, ~ 0.99 at 0.8
+SHINGLE = 3
+MIN_TOKENS = 8  # shorter texts ("need a developer") are too generic to call duplicates
+MAX_BUCKET_CHECKS = 50  # per band bucket; a cluster only needs one confirmed link
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_MASK = (1 << 64) - 1
+
+
+def _h64(data: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+def lead_text(lead: LeadRecord) -> str:
+    # Snippet capped like LeadRecord.to_row so in-run and stored comparisons see the same text
+    return f"{lead.project_description} {(lead.post_text_snippet or '')[:500]}"
+
+
+def shingles(text: str, k: int = SHINGLE) -> frozenset[int]:
+    """Hashed word k-grams of the lowercased text; empty when it has fewer than MIN_TOKENS words."""
+    tokens = _TOKEN.findall((text or "").lower())
+    if len(tokens) < MIN_TOKENS:
+        return frozenset()
+    return frozenset(_h64(" ".join(tokens[i:i + k]).encode()) for i in range(len(tokens) - k + 1))
+
+
+def minhash(shingle_set: Iterable[int], num_perm: int = NUM_PERM) -> tuple[int, ...]:
+    """One hash per shingle, binned by h % num_perm, min per bin; empty bins borrow from the next one."""
+    bins: list[int | None] = [None] * num_perm
+    for h in shingle_set:
+        b, v = h % num_perm, h // num_perm
+        cur = bins[b]
+        if cur is None or v < cur:
+            bins[b] = v
+    if all(v is None for v in bins):
+        return ()
+    out = []
+    for i in range(num_perm):
+        d = 0
+        while bins[(i + d) % num_perm] is None:
+            d += 1
+        # Offset borrowed values so two empty bins do not agree by construction
+        out.append((bins[(i + d) % num_perm] + d * 0x9E3779B97F4A7C15) & _MASK)
+    return tuple(out)
+
+
+def band_keys(signature: tuple[int, ...], bands: int = BANDS) -> list[int]:
+    """One signed 64-bit key per band (fits an SQLite INTEGER)."""
+    if not signature:
+        return []
+    rows = len(signature) // bands
+    keys = []
+    for b in range(bands):
+        data = struct.pack(f"<{rows + 1}Q", b, *signature[b * rows:(b + 1) * rows])
+        keys.append(int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little", signed=True))
+    return keys
+
+
+def jaccard(a: frozenset[int], b: frozenset[int]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class UnionFind:
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, a: int, b: int) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+
+def near_duplicate_clusters(texts: list[str], threshold: float = 0.7) -> list[list[int]]:
+    """Groups of indices (ascending, groups ordered by first index) whose texts are near-duplicates."""
+    uf = UnionFind(len(texts))
+    buckets: dict[int, list[int]] = {}
+    sets: list[frozenset[int]] = []
+    for i, text in enumerate(texts):
+        s = shingles(text)
+        sets.append(s)
+        checked: set[int] = set()
+        for key in band_keys(minhash(s)):
+            bucket = buckets.setdefault(key, [])
+            for j in bucket[:MAX_BUCKET_CHECKS]:
+                if j not in checked:
+                    checked.add(j)
+                    if uf.find(i) != uf.find(j) and jaccard(s, sets[j]) >= threshold:
+                        uf.union(i, j)
+            bucket.append(i)
+    groups: dict[int, list[int]] = {}
+    for i in range(len(texts)):
+        groups.setdefault(uf.find(i), []).append(i)
+    return list(groups.values())
+
+
+def collapse_near_duplicates(
+    leads: list[LeadRecord] | list[Lead], threshold: float = 0.7
+) -> list[LeadRecord] | list[Lead]:
+    """One lead per cluster - the highest confidence_score (earliest on ties) with the others
+    merged into it (core.merge policy), so source_urls links every cross-post. API Leads in, API Leads out."""
+    given, leads = leads, [as_record(l) for l in leads]
+    out = []
+    for group in near_duplicate_clusters([lead_text(l) for l in leads], threshold):
+        if len(group) == 1:
+            out.append(leads[group[0]])
+            continue
+        best = max(group, key=lambda i: (leads[i].confidence_score, -i))
+        record = leads[best]
+        for i in group:
+            if i != best:
+                record = merged(record, leads[i])
+        out.append(record)
+    return as_given(out, leads, given)
+
+
+def near_dedupe_threshold(config: dict | None = None) -> float | None:
+    """Jaccard threshold from scraper.near_dedupe, or None when the stage is disabled."""
+    cfg = config or get_config()
+    opts = cfg.get("near_dedupe") or {}
+    if not opts.get("enabled"):
+        return None
+    return float(opts.get("threshold", 0.7))
@@ -0,0 +1,156 @@
+"""Run platform connectors in worker processes under one wall-clock deadline."""
+
+import multiprocessing as mp
+import queue
+from time import time
+from typing import Any, Callable, Iterator
+
+from core.browser import browser_pool
+from core.config import get_config
+from core.debug_candidates import save as save_rejected, set_enabled as set_debug_enabled
+from core.logging import log_message, setup_logging
+from core.models import LeadRecord, PlatformResult
+from core.run_context import RunContext
+
+
+def _worker(task_q, result_q, run: RunContext, debug_save_candidates: bool, stream: bool = False) -> None:
+    """
+    Worker process: own browser pool, pulls platform names until a None sentinel.
+    With stream each lead is sent as ("lead", platform, lead) the moment it is scraped.
+    """
+    from platforms.registry import get_connector
+
+    setup_logging()
+    set_debug_enabled(debug_save_candidates)
+    config = get_config()
+    with browser_pool(config):
+        while True:
+            name = task_q.get()
+            if name is None:
+                break
+            conn = get_connector(name) if not run.expired() else None
+            if not conn:
+                result_q.put(("skipped", name, None))
+                continue
+            result_q.put(("started", name, None))
+            try:
+                on_lead = (lambda lead, name=name: result_q.put(("lead", name, lead))) if stream else None
+                result = conn.run(run, on_lead=on_lead)
+            except Exception as e:
+                log_message("platform run failed", platform=name, error=str(e))
+                result = PlatformResult(platform=name, success=False, error=str(e), stopped_reason="exception")
+            result_q.put(("done", name, result))
+    if debug_save_candidates:
+        save_rejected()
+
+
+def _killed_result(name: str, started_at: float) -> PlatformResult:
+    return PlatformResult(
+        platform=name,
+        success=False,
+        time_taken_seconds=time() - started_at,
+        error="worker killed at global deadline",
+        stopped_reason="global_max_runtime",
+    )
+
+
+def _crashed_result(name: str, started_at: float) -> PlatformResult:
+    return PlatformResult(
+        platform=name,
+        success=False,
+        time_taken_seconds=time() - started_at,
+        error="worker process exited without a result",
+        stopped_reason="exception",
+    )
+
+
+def run_platforms_parallel(
+    names: list[str],
+    workers: int,
+    run: RunContext,
+    kill_grace: float = 30.0,
+    debug_save_candidates: bool = False,
+    on_lead: Callable[[LeadRecord], Any] | None = None,
+) -> Iterator[PlatformResult]:
+    """
+    Yield PlatformResults as workers finish them. `run` must be created with shared=True; its
+    deadline is enforced inside every connector. Platforms not started by the deadline are skipped;
+    workers still running at deadline + kill_grace are terminated and their platform is reported
+    as failed with stopped_reason "global_max_runtime", so the caller can always merge and export.
+    With on_lead, leads are streamed to it from the workers as they are scraped (results then carry
+    counts only), so a killed worker's leads up to that point are not lost: messages still queued when
+    the workers are stopped are drained before anything is reported as killed. Platforms whose
+    worker died before the deadline are reported with stopped_reason "exception".
+    """
+    deadline = run.deadline
+    ctx = mp.get_context("spawn")
+    task_q = ctx.Queue()
+    result_q = ctx.Queue()
+    n = max(1, min(workers, len(names)))
+    for name in names:
+        task_q.put(name)
+    for _ in range(n):
+        task_q.put(None)
+    procs = [
+        ctx.Process(target=_worker, args=(task_q, result_q, run, debug_save_candidates, on_lead is not None), daemon=True)
+        for _ in range(n)
+    ]
+    for p in procs:
+        p.start()
+
+    running: dict[str, float] = {}
+    pending = set(names)
+    crashed = False
+
+    def handle(kind: str, name: str, result: Any) -> PlatformResult | None:
+        """Apply one worker message; the PlatformResult to yield, if any."""
+        if kind == "started":
+            running[name] = time()
+        elif kind == "lead":
+            on_lead(result)
+        else:
+            running.pop(name, None)
+            pending.discard(name)
+            return result
+        return None
+
+    try:
+        while pending:
+            now = time()
+            if now >= deadline and not running:
+                log_message("global_max_runtime reached; skipping unstarted platforms", platforms=sorted(pending))
+                break
+            if now >= deadline + kill_grace:
+                log_message("global_max_runtime reached; killing workers", platforms=sorted(running))
+                break
+            try:
+                msg = result_q.get(timeout=1.0)
+            except queue.Empty:
+                if not any(p.is_alive() for p in procs):
+                    log_message("all workers exited with platforms pending", platforms=sorted(pending))
+                    crashed = True
+                    break
+                continue
+            result = handle(*msg)
+            if result is not None:
+                yield result
+    finally:
+        for p in procs:
+            if p.is_alive():
+                p.terminate()
+        for p in procs:
+            p.join(timeout=5)
+    # Messages the workers queued before they were stopped: leads and results are not lost
+    while True:
+        try:
+            msg = result_q.get_nowait()
+        except queue.Empty:
+            break
+        except Exception as e:  # a message cut short by terminate()
+            log_message("unreadable worker message dropped", error=str(e))
+            break
+        result = handle(*msg)
+        if result is not None:
+            yield result
+    for name, started_at in running.items():
+        yield _crashed_result(name, started_at) if crashed else _killed_result(name, started_at)
@@ -1,6 +1,7 @@
 """Robust parsing: multiple selector fallbacks, strip scripts/nav, normalize whitespace."""
 
 import re
+from html.parser import HTMLParser
 from typing import Any
 
 
@@ -24,39 +25,136 @@ def extract_text_with_fallbacks(page: Any, selectors: list[str], default: str =
     return default
 
 
-def extract_main_content(page: Any) -> str:
-    """Readability-style: prefer article/main/content, strip nav/footer."""
-    selectors = [
-        "article",
-        "main",
-        "[role='main']",
-        ".content",
-        ".post-content",
-        ".entry-content",
-        "#content",
-        ".main",
-        "body",
-    ]
-    for sel in selectors:
-        try:
-            el = page.query_selector(sel)
-            if el:
-                # drop script/style
-                for tag in page.query_selector_all(f"{sel} script, {sel} style, {sel} nav, {sel} footer"):
-                    try:
-                        tag.evaluate("e => e.remove()")
-                    except Exception:
-                        pass
-                t = (el.inner_text() or "").strip()
-                if len(t) > 100:
-                    return normalize_whitespace(t)
-        except Exception:
-            continue
+MAIN_SELECTORS = [
+    "article",
+    "main",
+    "[role='main']",
+    ".content",
+    ".post-content",
+    ".entry-content",
+    "#content",
+    ".main",
+    "body",
+]
+
+# One evaluate, no DOM mutation: walk each candidate's text nodes, skipping script/style/nav/footer
+# subtrees, and return the first candidate with > 100 chars (else body) plus the page title.
+MAIN_CONTENT_JS = """
+(selectors) => {
+  const SKIP = new Set(["SCRIPT", "STYLE", "NOSCRIPT", "TEMPLATE", "NAV", "FOOTER"]);
+  const textOf = (root) => {
+    if (!root) return "";
+    const parts = [];
+    const walker = document.createTreeWalker(root, NodeFilter.SHOW_ELEMENT | NodeFilter.SHOW_TEXT, {
+      acceptNode: (n) => n.nodeType === Node.ELEMENT_NODE
+        ? (SKIP.has(n.tagName) || n.hidden ? NodeFilter.FILTER_REJECT : NodeFilter.FILTER_SKIP)
+        : NodeFilter.FILTER_ACCEPT,
+    });
+    while (walker.nextNode()) parts.push(walker.currentNode.nodeValue);
+    return parts.join(" ").replace(/\\s+/g, " ").trim();
+  };
+  let text = "";
+  for (const sel of selectors) {
+    let el = null;
+    try { el = document.querySelector(sel); } catch (e) {}
+    const t = textOf(el);
+    if (t.length > 100) { text = t; break; }
+  }
+  if (!text) text = textOf(document.body);
+  const titleEl = document.querySelector("h1, .title, title");
+  const title = titleEl ? (titleEl.innerText || titleEl.textContent || "").trim() : "";
+  return { text, title };
+}
+"""
+
+
+_SKIP_TAGS = {"script", "style", "noscript", "template", "nav", "footer"}
+_VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+
+def _matches(sel: str, tag: str, attrs: dict) -> bool:
+    if sel.startswith("."):
+        return sel[1:] in (attrs.get("class") or "").split()
+    if sel.startswith("#"):
+        return attrs.get("id") == sel[1:]
+    if sel == "[role='main']":
+        return attrs.get("role") == "main"
+    return tag == sel
+
+
+class _MainContentParser(HTMLParser):
+    """MAIN_CONTENT_JS over raw HTML: first element per MAIN_SELECTORS entry, text minus skipped subtrees."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.buffers: dict[int, list[str]] = {}  # MAIN_SELECTORS index -> text parts
+        self.title_parts: list[str] = []
+        self.all_parts: list[str] = []  # body fallback for fragments without <body>
+        self._stack: list[tuple[str, bool, list[int], bool]] = []  # tag, skip, selector ids, is_title
+        self._title_done = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in _VOID_TAGS:
+            return
+        a = dict(attrs)
+        skip = tag in _SKIP_TAGS or "hidden" in a
+        opened = []
+        for i, sel in enumerate(MAIN_SELECTORS):
+            if i not in self.buffers and _matches(sel, tag, a):
+                self.buffers[i] = []
+                opened.append(i)
+        is_title = not self._title_done and (tag in ("h1", "title") or "title" in (a.get("class") or "").split())
+        if is_title:
+            self._title_done = True
+        self._stack.append((tag, skip, opened, is_title))
+
+    def handle_endtag(self, tag: str) -> None:
+        for i in range(len(self._stack) - 1, -1, -1):
+            if self._stack[i][0] == tag:
+                del self._stack[i:]
+                return
+
+    def handle_data(self, data: str) -> None:
+        in_title = any(t for _, _, _, t in self._stack)
+        if in_title and not any(tag in ("script", "style") for tag, _, _, _ in self._stack):
+            self.title_parts.append(data)
+        if any(skip for _, skip, _, _ in self._stack):
+            return
+        self.all_parts.append(data)
+        for _, _, opened, _ in self._stack:
+            for i in opened:
+                self.buffers[i].append(data)
+
+
+def main_content_from_html(html: str) -> tuple[str, str]:
+    """(main text, title) from raw HTML - same rules as extract_page_content, no browser."""
+    p = _MainContentParser()
     try:
-        body = page.query_selector("body")
-        return normalize_whitespace((body.inner_text() or "") if body else "")
+        p.feed(html or "")
+        p.close()
     except Exception:
-        return ""
+        pass
+    title = normalize_whitespace(" ".join(p.title_parts))
+    for i in range(len(MAIN_SELECTORS)):
+        text = normalize_whitespace(" ".join(p.buffers.get(i) or []))
+        if len(text) > 100:
+            return text, title
+    body = p.buffers.get(MAIN_SELECTORS.index("body"))
+    return normalize_whitespace(" ".join(body if body is not None else p.all_parts)), title
+
+
+def extract_page_content(page: Any) -> tuple[str, str]:
+    """(main text, title) in one browser round trip; the live DOM is left untouched."""
+    try:
+        data = page.evaluate(MAIN_CONTENT_JS, MAIN_SELECTORS) or {}
+    except Exception:
+        return "", ""
+    return normalize_whitespace(data.get("text")), (data.get("title") or "").strip()
+
+
+def extract_main_content(page: Any) -> str:
+    """Readability-style: prefer article/main/content, strip nav/footer."""
+    return extract_page_content(page)[0]
 
 
 def select_all_text(page: Any, selector: str) -> list[str]:
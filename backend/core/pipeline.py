@@ -0,0 +1,146 @@
+"""
+Streaming lead pipeline for one run. Connectors hand every lead to add() the moment it is scraped:
+canonicalize (clean post_url) -> dedupe online (DedupeEngine, merging duplicates) -> lead store
+(batched upserts; a background timer flushes a batch once its oldest lead is flush_seconds old, so a
+lull after a burst does not leave leads pending) -> live JSONL (appended and flushed per lead).
+finish() folds near-duplicate cross-posts and writes the final XLSX/JSONL; the merged JSONL replaces
+the live file. A run that dies part-way leaves every accepted lead in the store and the live file,
+and with a run journal every lead in the journal, from which replay() rebuilds the pipeline on resume.
+"""
+
+import threading
+from dataclasses import replace
+from time import time
+from typing import Iterable
+
+from core.config import get_config
+from core.dedupe import DedupeEngine
+from core.export import export_leads, file_timestamp, jsonl_file
+from core.logging import log_message
+from core.models import LeadRecord
+from core.near_dedupe import collapse_near_duplicates, near_dedupe_threshold
+from core.url_canon import clean_url
+from storage.lead_store import get_lead_store
+from storage.run_journal import RunJournal
+
+
+class LeadPipeline:
+    """One per run; connectors' on_lead is add(). finish() once, after the last platform."""
+
+    def __init__(
+        self,
+        run_id: str,
+        config: dict | None = None,
+        flush_every: int = 50,
+        flush_seconds: float = 5.0,
+        live_jsonl: bool = True,
+        journal: RunJournal | None = None,
+        timestamp: str | None = None,
+    ):
+        self.run_id = run_id
+        self.config = config or get_config()
+        self.flush_every = flush_every
+        self.flush_seconds = flush_seconds
+        self.engine = DedupeEngine()
+        self.store = get_lead_store(self.config)
+        self.journal = journal
+        self.received = 0
+        # An earlier attempt's timestamp (resume): its live JSONL is rewritten, replay() refills it
+        self.timestamp = timestamp or file_timestamp()
+        self._pending: dict[int, LeadRecord] = {}  # position in engine.accepted -> record not yet stored
+        self._pending_since = 0.0  # when the oldest pending record arrived
+        self._lock = threading.Lock()  # add() is called from the async engine's thread too
+        self._live = None
+        if live_jsonl:
+            self._live = open(jsonl_file(self.timestamp, self.config), "w" if timestamp else "a", encoding="utf-8")
+        self._stop = threading.Event()
+        self._timer = None
+        if flush_seconds > 0:
+            self._timer = threading.Thread(target=self._flush_loop, name=f"pipeline-flush-{run_id}", daemon=True)
+            self._timer.start()
+
+    def add(self, lead: LeadRecord) -> bool:
+        """Take one scraped lead; True if it is new to this run (False: merged into an earlier one)."""
+        return self._add(lead, journal=True)
+
+    def replay(self, leads: Iterable[LeadRecord]) -> int:
+        """Feed leads journaled by an earlier attempt of this run (not journaled again). Returns how many."""
+        n = 0
+        for lead in leads:
+            self._add(lead, journal=False)
+            n += 1
+        return n
+
+    def _add(self, lead: LeadRecord, journal: bool) -> bool:
+        url = clean_url(lead.post_url) if lead.post_url else ""
+        if url != lead.post_url:
+            lead = replace(lead, post_url=url)
+        with self._lock:
+            if journal and self.journal is not None:
+                self.journal.record_lead(self.run_id, lead)
+            self.received += 1
+            result = self.engine.add(lead)
+            if not self._pending:
+                self._pending_since = time()
+            self._pending[result.position] = self.engine.accepted[result.position]
+            if result.accepted and self._live is not None:
+                self._live.write(lead.to_json() + "\n")
+                self._live.flush()
+            if len(self._pending) >= self.flush_every or self._due():
+                self._flush()
+        return result.accepted
+
+    def _due(self) -> bool:
+        return bool(self._pending) and time() - self._pending_since >= self.flush_seconds
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(min(1.0, self.flush_seconds)):
+            with self._lock:
+                if self._due():
+                    self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        batch = list(self._pending.values())
+        self._pending.clear()
+        if self.store is None:
+            return
+        try:
+            self.store.upsert(batch, self.run_id)
+        except Exception as e:
+            log_message("Lead store write failed", error=str(e), leads=len(batch))
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    @property
+    def leads(self) -> list[LeadRecord]:
+        """Records accepted so far (duplicates merged in)."""
+        return self.engine.accepted
+
+    def finish(self, export: bool = True) -> tuple[list[LeadRecord], str, str]:
+        """Flush, fold near-duplicates and write the final exports. Returns (leads, xlsx_path, jsonl_path)."""
+        self._stop.set()
+        if self._timer is not None:
+            self._timer.join(timeout=5)
+        with self._lock:
+            self._flush()
+            if self._live is not None:
+                self._live.close()
+                self._live = None
+            leads = self.engine.accepted
+        threshold = near_dedupe_threshold(self.config)
+        if threshold:
+            before = len(leads)
+            leads = collapse_near_duplicates(leads, threshold)
+            log_message("Near-duplicate cross-posts folded", before=before, after=len(leads))
+        xlsx = jsonl = ""
+        if export:
+            try:
+                xlsx, jsonl = export_leads(leads, self.config, timestamp=self.timestamp)
+                log_message("Exported", xlsx=xlsx, jsonl=jsonl, count=len(leads))
+            except Exception as e:
+                log_message("Export failed", error=str(e))
+        return leads, xlsx, jsonl
@@ -4,6 +4,10 @@ from core.scoring import (
     score_requirement,
     should_save_lead,
     is_likely_requirement,
+    score_many,
+    ScoreResult,
+    get_matcher,
+    INTENT_WORDS,
     REQUIREMENT_KEYWORDS,
     URGENCY,
     BUDGET_PAT,
@@ -0,0 +1,86 @@
+"""Run context - one deadline, run_id and shared counters passed from the runner to every connector."""
+
+import math
+import multiprocessing as mp
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from time import time
+from typing import Any
+
+
+class LocalCounter:
+    """In-process stand-in for multiprocessing.Value (same .value / .get_lock() interface)."""
+
+    def __init__(self, value: int = 0):
+        self.value = value
+        self._lock = threading.Lock()
+
+    def get_lock(self) -> threading.Lock:
+        return self._lock
+
+
+def _new_run_id(ts: float) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y%m%dT%H%M%S")
+
+
+@dataclass
+class RunContext:
+    """
+    Created once per run. deadline is absolute (epoch seconds) so every stop check measures from
+    the start of the run. platforms_pending counts budgeted platforms not finished yet; their
+    fair share of the remaining time grows as others finish early.
+    """
+
+    run_id: str
+    started_at: float
+    deadline: float
+    slots: int = 1  # platforms running at once
+    platforms_pending: Any = field(default_factory=LocalCounter)
+    leads_found: Any = field(default_factory=LocalCounter)
+
+    @classmethod
+    def create(
+        cls,
+        global_max_runtime: float,
+        platforms: int,
+        slots: int = 1,
+        shared: bool = False,
+        run_id: str | None = None,
+    ) -> "RunContext":
+        """shared=True backs the counters with multiprocessing Values for worker processes."""
+        now = time()
+        if shared:
+            ctx = mp.get_context("spawn")
+            pending, leads = ctx.Value("i", platforms), ctx.Value("i", 0)
+        else:
+            pending, leads = LocalCounter(platforms), LocalCounter(0)
+        return cls(
+            run_id=run_id or _new_run_id(now),
+            started_at=now,
+            deadline=now + global_max_runtime,
+            slots=max(1, slots),
+            platforms_pending=pending,
+            leads_found=leads,
+        )
+
+    def remaining(self) -> float:
+        return max(0.0, self.deadline - time())
+
+    def expired(self) -> bool:
+        return time() >= self.deadline
+
+    def platform_budget(self, elapsed: float) -> float:
+        """
+        Seconds this platform may run in total: remaining run time (plus what it already used)
+        split evenly over the rounds of pending platforms, including itself.
+        """
+        rounds = max(1, math.ceil(max(1, self.platforms_pending.value) / self.slots))
+        return (self.remaining() + elapsed) / rounds
+
+    def platform_finished(self, leads: int, budgeted: bool = True) -> None:
+        with self.leads_found.get_lock():
+            self.leads_found.value += leads
+        if budgeted:
+            with self.platforms_pending.get_lock():
+                self.platforms_pending.value = max(0, self.platforms_pending.value - 1)
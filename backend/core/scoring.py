@@ -5,7 +5,11 @@ Export even if email missing when confidence >= 60.
 """
 
 import re
+from functools import lru_cache
+from typing import Iterable, NamedTuple
+
 from core.config import get_config
+from core.keyword_matcher import KeywordMatcher
 
 REQUIREMENT_KEYWORDS = [
     "looking for developer", "need an agency", "seeking freelancer", "build mvp",
@@ -16,34 +20,43 @@ REQUIREMENT_KEYWORDS = [
 ]
 URGENCY = ["asap", "urgent", "immediately", "as soon as", "quick", "fast"]
 BUDGET_PAT = re.compile(r"[\$₹€]\s*\d+|budget\s*:?\s*\d+|\d+\s*\$|\d+\s*usd", re.I)
+CONTACT_MARKERS = ["@", "email", " contact ", "mailto:"]
+DATE_MARKERS = ["202", "jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]
+# Sentence intent words used by description_summary
+INTENT_WORDS = ["need", "looking", "hire", "build", "want", "seeking"]
+
+
+@lru_cache(maxsize=8)
+def _build_matcher(search_keywords: tuple[str, ...]) -> tuple[KeywordMatcher, tuple[str, ...]]:
+    keywords = tuple(dict.fromkeys(k.lower() for k in list(search_keywords) + REQUIREMENT_KEYWORDS))
+    terms = keywords + tuple(URGENCY) + tuple(CONTACT_MARKERS) + tuple(DATE_MARKERS) + tuple(INTENT_WORDS)
+    return KeywordMatcher(terms), keywords
 
 
-def score_requirement(text: str | None) -> tuple[int, list[str]]:
+def get_matcher(config: dict | None = None) -> tuple[KeywordMatcher, tuple[str, ...]]:
     """
-    Returns (confidence_score 0-100, keywords_matched list).
-    Less strict: email +40, keywords +10 each (cap 40), budget +10, urgent +5, recent +5.
+    (matcher, requirement keywords) for the config's search_keywords. One compiled matcher per
+    keyword set covers keywords, urgency, contact and date markers; shared with summarize_project.
     """
-    if not text or not text.strip():
-        return 0, []
-    t = text.lower().strip()
+    cfg = config or get_config()
+    return _build_matcher(tuple(cfg.get("search_keywords") or ()))
+
+
+def _score(t: str, matcher: KeywordMatcher, keywords: tuple[str, ...]) -> tuple[int, list[str]]:
+    """Score already-lowercased, stripped text."""
     score = 0
     matched: list[str] = []
-    cfg = get_config()
-    keywords = (cfg.get("search_keywords") or []) + REQUIREMENT_KEYWORDS
-    keywords = list(dict.fromkeys(k.lower() for k in keywords))
+    found = matcher.found(t)
 
     # Email/contact in post: +40
-    if "@" in t or "email" in t or " contact " in t or "mailto:" in t:
+    if any(m in found for m in CONTACT_MARKERS):
         score += 40
         matched.append("contact")
 
     # Keywords: +10 each, cap 40 total from keywords
-    kw_score = 0
-    for kw in keywords:
-        if kw in t and kw_score < 40:
-            kw_score += 10
-            matched.append(kw)
-    score += min(40, kw_score)
+    kws = [kw for kw in keywords if kw in found][:4]
+    matched.extend(kws)
+    score += 10 * len(kws)
 
     # Budget: +10
     if BUDGET_PAT.search(t):
@@ -52,19 +65,30 @@ def score_requirement(text: str | None) -> tuple[int, list[str]]:
 
     # Urgency: +5
     for w in URGENCY:
-        if w in t:
+        if w in found:
             score += 5
             matched.append(w)
             break
 
     # Recent/date mention: +5
-    if "202" in t or "jan" in t or "feb" in t or "mar" in t or "apr" in t or "may" in t or "jun" in t or "jul" in t or "aug" in t or "sep" in t or "oct" in t or "nov" in t or "dec" in t:
+    if any(m in found for m in DATE_MARKERS):
         score += 5
         matched.append("recent")
 
     return min(100, score), list(dict.fromkeys(matched))
 
 
+def score_requirement(text: str | None, config: dict | None = None) -> tuple[int, list[str]]:
+    """
+    Returns (confidence_score 0-100, keywords_matched list).
+    Less strict: email +40, keywords +10 each (cap 40), budget +10, urgent +5, recent +5.
+    """
+    if not text or not text.strip():
+        return 0, []
+    matcher, keywords = get_matcher(config)
+    return _score(text.lower().strip(), matcher, keywords)
+
+
 def should_save_lead(
     text: str | None,
     has_email: bool,
@@ -91,6 +115,35 @@ def should_save_lead(
     return score >= 35
 
 
+class ScoreResult(NamedTuple):
+    score: int
+    matched: list[str]
+    save: bool
+
+
+def score_many(
+    texts: Iterable[str | None],
+    has_email: Iterable[bool] | None = None,
+    config: dict | None = None,
+) -> list[ScoreResult]:
+    """
+    Score a batch (e.g. a whole JSON listing) in one call. Same results as score_requirement +
+    should_save_lead per text; has_email defaults to "@" in text, as the parsers use.
+    The matcher and keyword list are resolved once for the batch.
+    """
+    matcher, keywords = get_matcher(config)
+    texts = list(texts)
+    emails = list(has_email) if has_email is not None else [bool(t and "@" in t) for t in texts]
+    out: list[ScoreResult] = []
+    for text, email in zip(texts, emails):
+        if not text or not text.strip():
+            out.append(ScoreResult(0, [], False))
+            continue
+        score, matched = _score(text.lower().strip(), matcher, keywords)
+        out.append(ScoreResult(score, matched, should_save_lead(text, email, score, matched)))
+    return out
+
+
 def is_likely_requirement(text: str | None, min_score: int = 20) -> bool:
     score, matched = score_requirement(text)
     if score < min_score:
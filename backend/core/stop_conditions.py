@@ -5,6 +5,7 @@ from time import time
 from typing import Callable
 
 from core.logging import log_message
+from core.run_context import RunContext
 
 
 @dataclass
@@ -17,6 +18,7 @@ class StopState:
     items_scanned: int = 0
     leads_count: int = 0
     global_start: float = field(default_factory=time)
+    run: RunContext | None = None  # run-wide deadline + fair share; None = standalone platform run
 
     def reset_for_platform(self) -> None:
         self.platform_start = time()
@@ -46,7 +48,13 @@ def check_platform_stop(
     watchdog = config.get("watchdog_timeout", 60)
     global_max = config.get("global_max_runtime", 900)
 
-    if now - state.global_start >= global_max:
+    if state.run is not None:
+        if now >= state.run.deadline:
+            log_message("global_max_runtime reached", platform=platform, run_id=state.run.run_id)
+            return True, "global_max_runtime"
+        # Never more than this platform's fair share of what is left of the run
+        max_runtime = min(max_runtime, state.run.platform_budget(now - state.platform_start))
+    elif now - state.global_start >= global_max:
         log_message("global_max_runtime reached", platform=platform)
         return True, "global_max_runtime"
 
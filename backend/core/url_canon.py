@@ -0,0 +1,177 @@
+"""
+URL canonicalization shared by dedupe, seen sets/index, the lead store and the response cache.
+clean_url: one spelling per fetchable resource - redirect wrappers unwrapped, tracking params and
+fragment dropped, host/scheme lowercased, query sorted. canonical_key: one key per post - known
+platforms reduce to their post id ("reddit:abc123", "hn:4242"), anything else to a lowercased
+clean_url without www / trailing slash.
+"""
+
+import base64
+import re
+from functools import lru_cache
+from typing import Callable
+from urllib.parse import parse_qs, parse_qsl, urlencode, urlsplit, urlunsplit
+
+TRACKING_PARAMS = {
+    "gclid", "fbclid", "msclkid", "yclid", "dclid", "igshid", "mc_cid", "mc_eid", "_ga",
+    "ref", "ref_src", "ref_source", "ref_url", "share_id", "si", "rdt", "context", "utm",
+}
+TRACKING_PREFIXES = ("utm_",)
+
+# (host suffix, path prefix) -> query param holding the real target
+REDIRECTS = {
+    ("duckduckgo.com", "/l/"): "uddg",
+    ("google.com", "/url"): "q",
+    ("out.reddit.com", "/"): "url",
+    ("bing.com", "/ck/a"): "u",
+}
+
+_REDDIT_POST = re.compile(r"^/(?:r/[^/]+/)?comments/([a-z0-9]+)", re.I)
+_REDDIT_SHORT = re.compile(r"^/([a-z0-9]+)/?$", re.I)
+_HN_API_ITEM = re.compile(r"^/api/v1/items/(\d+)")
+_CRAIGSLIST_POST = re.compile(r"/(\d{6,})\.html$")
+_GITHUB_ISSUE = re.compile(r"^/([^/]+)/([^/]+)/(issues|pull)/(\d+)")
+
+
+def _host_matches(host: str, suffix: str) -> bool:
+    return host == suffix or host.endswith("." + suffix)
+
+
+def _bing_target(value: str) -> str:
+    """Bing's u= is "a1" + base64url(target) without padding."""
+    if not value.startswith("a1"):
+        return value
+    raw = value[2:]
+    try:
+        return base64.urlsafe_b64decode(raw + "=" * (-len(raw) % 4)).decode()
+    except (ValueError, UnicodeDecodeError):
+        return value
+
+
+def unwrap(url: str, max_hops: int = 3) -> str:
+    """Target of search-engine / outbound redirect links (nested up to max_hops), else url."""
+    for _ in range(max_hops):
+        if "?" not in url:  # every wrapper carries its target in the query
+            return url
+        try:
+            parts = urlsplit(url.strip())
+        except ValueError:
+            return url
+        host = (parts.hostname or "").lower()
+        target = None
+        for (suffix, prefix), param in REDIRECTS.items():
+            if _host_matches(host, suffix) and parts.path.startswith(prefix):
+                values = parse_qs(parts.query).get(param)
+                if values:
+                    target = _bing_target(values[0]) if param == "u" else values[0]
+                break
+        if not target or not target.startswith(("http://", "https://")):
+            return url
+        url = target
+    return url
+
+
+def _is_tracking(name: str) -> bool:
+    n = name.lower()
+    return n in TRACKING_PARAMS or n.startswith(TRACKING_PREFIXES)
+
+
+def _clean_parts(url: str) -> tuple[str, str, str, str] | None:
+    """(scheme, host[:port], path, sorted query) of the unwrapped URL; None if unparsable."""
+    try:
+        parts = urlsplit(unwrap(url).strip())
+        port = parts.port
+    except ValueError:
+        return None
+    host = (parts.hostname or "").lower()
+    if port and (parts.scheme, port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{port}"
+    query = parts.query
+    if query:
+        params = [(k, v) for k, v in parse_qsl(query, keep_blank_values=True) if not _is_tracking(k)]
+        query = urlencode(sorted(params))
+    return parts.scheme.lower(), host, parts.path or "/", query
+
+
+def clean_url(url: str) -> str:
+    """Canonical spelling of the resource itself (safe as a response-cache key)."""
+    parts = _clean_parts(url)
+    if parts is None:
+        return url
+    return urlunsplit((*parts, ""))
+
+
+def _reddit(host: str, path: str, query: dict) -> str | None:
+    if host == "redd.it":
+        m = _REDDIT_SHORT.match(path)
+        return f"reddit:{m.group(1).lower()}" if m else None
+    if _host_matches(host, "reddit.com"):
+        m = _REDDIT_POST.match(path)
+        return f"reddit:{m.group(1).lower()}" if m else None
+    return None
+
+
+def _hackernews(host: str, path: str, query: dict) -> str | None:
+    if host == "news.ycombinator.com" and path.rstrip("/") == "/item" and query.get("id"):
+        return f"hn:{query['id'][0]}" if query["id"][0].isdigit() else None
+    if host == "hn.algolia.com":
+        m = _HN_API_ITEM.match(path)
+        if m:
+            return f"hn:{m.group(1)}"
+        story = query.get("story") or query.get("id")
+        return f"hn:{story[0]}" if story and story[0].isdigit() else None
+    return None
+
+
+def _craigslist(host: str, path: str, query: dict) -> str | None:
+    if _host_matches(host, "craigslist.org"):
+        m = _CRAIGSLIST_POST.search(path)
+        return f"craigslist:{m.group(1)}" if m else None
+    return None
+
+
+def _github(host: str, path: str, query: dict) -> str | None:
+    if host == "github.com":
+        m = _GITHUB_ISSUE.match(path)
+        if m:
+            owner, repo, _kind, number = m.groups()
+            # issues/N and pull/N share one number space per repo
+            return f"github:{owner.lower()}/{repo.lower()}#{number}"
+    return None
+
+
+# Host suffixes -> rule; a rule runs only for its hosts, the first non-None key wins
+PLATFORM_RULES: list[tuple[tuple[str, ...], Callable[[str, str, dict], str | None]]] = [
+    (("reddit.com", "redd.it"), _reddit),
+    (("news.ycombinator.com", "hn.algolia.com"), _hackernews),
+    (("craigslist.org",), _craigslist),
+    (("github.com",), _github),
+]
+
+
+@lru_cache(maxsize=65536)
+def canonical_key(url: str) -> str:
+    """Stable identity of the post behind url - every spelling of the same post gives the same key."""
+    if not url:
+        return ""
+    parts = _clean_parts(url)
+    if parts is None:
+        return url.strip().lower()
+    _scheme, host, path, query = parts
+    bare_host = host.split(":", 1)[0]
+    for suffixes, rule in PLATFORM_RULES:
+        if any(_host_matches(bare_host, sfx) for sfx in suffixes):
+            key = rule(bare_host, path, parse_qs(query) if query else {})
+            if key:
+                return key
+    host = host[4:] if host.startswith("www.") else host
+    return (host + path.rstrip("/") + (f"?{query}" if query else "")).lower()
+
+
+def add_if_new(seen: set[str], url: str) -> bool:
+    """True (and remember it) if no other spelling of url's post is in seen yet."""
+    key = canonical_key(url)
+    if key in seen:
+        return False
+    seen.add(key)
+    return True
@@ -71,7 +71,7 @@ def crawl_for_emails(
             page = visit_page_fn(ctx, path)
             if not page:
                 continue
-            text = extract_main_content(page) if hasattr(page, "query_selector") else (page.inner_text() or "")
+            text = extract_main_content(page)
             page.close()
             for e in extract_emails_from_page_text(text):
                 if e not in seen:
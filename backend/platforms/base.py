@@ -1,24 +1,75 @@
 """Base connector interface - all platform code lives in platforms/<name>/."""
 
+import random
 from abc import ABC, abstractmethod
-from datetime import datetime
-from time import time
-from typing import Any
+from datetime import datetime, timedelta, timezone
+from time import sleep, time
+from typing import Any, Callable, Iterator
 
-from core.browser import browser_context, visit_page
+from core.async_browser import AsyncPageEngine, async_available
+from core.browser import browser_context, pop_block_stats, visit_page
 from core.config import get_config
-from core.date_utils import get_cutoff_date, is_after_cutoff, to_iso
+from core.date_utils import get_cutoff_date, is_after_cutoff, parse_date_iso, to_iso
 from core.email_extract import extract_and_normalize
-from core.logging import log_platform_end, log_platform_start
-from core.models import Lead, PlatformResult, SourceType
+from core.extraction import Spec, extract_fields, fields_extractor
+from core.logging import log_message, log_platform_end, log_platform_start
+from core.models import LeadRecord, PlatformResult, SourceType
 from core.requirement_scoring import score_requirement
 from core.description_summary import summarize_project
-from core.stop_conditions import StopState, check_platform_stop, record_page_done
+from core.run_context import RunContext
+from core.stop_conditions import StopState, check_platform_stop, record_items_scanned, record_page_done
+from core.url_canon import add_if_new
+from storage.http_cache import get_http_cache
+from storage.run_journal import RunJournal, get_run_journal
+from storage.seen_index import FAILED, LEAD, REJECTED, get_seen_index
+
+
+class LeadSink:
+    """
+    Leads one connector run has produced. add() drops repeat spellings of a post (canonical key,
+    O(1)) and passes each new lead straight to on_lead (the run's LeadPipeline), so it is deduped,
+    stored and exported while the connector is still scraping. Leads are kept in .leads only when
+    there is no on_lead to hand them to.
+    """
+
+    def __init__(self, on_lead: Callable[[LeadRecord], Any] | None = None):
+        self.leads: list[LeadRecord] = []
+        self.count = 0
+        self._keys: set[str] = set()
+        self._on_lead = on_lead
+
+    def add(self, lead: LeadRecord) -> bool:
+        if not add_if_new(self._keys, lead.post_url):
+            return False
+        self.count += 1
+        if self._on_lead is None:
+            self.leads.append(lead)
+        else:
+            self._on_lead(lead)
+        return True
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[LeadRecord]:
+        return iter(self.leads)
 
 
 class BaseConnector(ABC):
     name: str = "base"
     source_type: SourceType = SourceType.OTHER
+    # Resource types this platform needs even when scraper.block_resources is on (e.g. "stylesheet")
+    allow_resources: tuple[str, ...] = ()
+    # Detail pages fetched at once by _visit_details (None -> scraper.concurrent_pages; 1 = serial)
+    max_concurrent_pages: int | None = None
+    # False for stubs: they finish instantly and must not shrink other platforms' share of the run
+    budgeted: bool = True
+    _engine: AsyncPageEngine | None = None
+    _cfg: dict | None = None  # config snapshot taken at the start of run()
+    _sink: LeadSink | None = None  # leads of the current run()
+    _journal: RunJournal | None = None  # run journal when run() is part of a journaled run_all
+    _run_id: str = ""
+    _records_seen = False  # run() whose leads are persisted (runner context or on_lead) - see _record_seen
 
     @abstractmethod
     def fetch(
@@ -26,19 +77,167 @@ class BaseConnector(ABC):
         cutoff_date: datetime | None = None,
         query_config: dict | None = None,
         state: StopState | None = None,
-    ) -> list[Lead]:
-        """Return list of leads. Use state to update pages_visited, items_scanned, and check _should_stop."""
+    ) -> list[LeadRecord]:
+        """
+        Return list of leads. Collect them with leads = self._lead_sink() and leads.add(lead), so each
+        lead streams to the runner as soon as it is found and survives a later exception.
+        Use state to update pages_visited, items_scanned, and check _should_stop.
+        state.run carries the RunContext (run deadline, run_id) when called from a runner.
+        """
         pass
 
+    def _lead_sink(self) -> LeadSink:
+        """The sink run() set up for this run (a private one when fetch() is called directly)."""
+        if self._sink is None:
+            self._sink = LeadSink()
+        return self._sink
+
     def _get_cutoff(self) -> datetime:
-        cfg = get_config()
+        cfg = self._config()
         return get_cutoff_date(cfg.get("months_lookback", 6))
 
     def _config(self) -> dict:
-        return get_config()
+        return self._cfg or get_config()
+
+    def _browser(self, config: dict | None = None):
+        """browser_context() with this platform's resource-blocking overrides and stats."""
+        return browser_context(config, platform=self.name, allow_resources=self.allow_resources)
 
     def _visit_page(self, ctx: Any, url: str, timeout: int | None = None):
-        return visit_page(ctx, url, timeout=timeout)
+        return visit_page(ctx, url, timeout=timeout, config=self._cfg, platform=self.name)
+
+    def _random_delay(self, config: dict) -> None:
+        lo = config.get("random_delay_ms_min", 200)
+        hi = config.get("random_delay_ms_max", 900)
+        sleep(random.randint(lo, hi) / 1000.0)
+
+    def _take_detail(self, lead: LeadRecord | None, leads: LeadSink, state: StopState, cutoff: datetime) -> bool:
+        """Add a parsed detail lead if new and inside the cutoff; record the page either way."""
+        if lead and lead.post_date:
+            d = parse_date_iso(lead.post_date)
+            self._settle_cached(lead.post_url, d)
+            if d and not is_after_cutoff(d, cutoff):
+                lead = None
+        taken = lead is not None and leads.add(lead)
+        self._record_page(state, 1 if taken else 0)
+        return taken
+
+    def _listing(self, stage: str, items: list, state: StopState) -> Iterator:
+        """
+        Iterate listing pages / queries of one stage. With a run journal the position is saved after
+        each item the loop body finishes, and a resumed run starts after the last finished item.
+        An item the loop breaks out of, or that a stop condition cut short, is not counted as finished.
+        """
+        journal = self._journal
+        start = journal.cursor(self._run_id, self.name, stage) if journal else 0
+        if start:
+            log_message("resuming listing", platform=self.name, stage=stage, skipped=min(start, len(items)))
+        for i in range(start, len(items)):
+            yield items[i]
+            if journal is not None and not self._should_stop(state)[0]:
+                journal.set_cursor(self._run_id, self.name, stage, i + 1)
+
+    def _record_processed(self, url: str) -> None:
+        """Journal a page this run has finished with (lead or rejected), so a resume skips it."""
+        if self._journal is not None:
+            self._journal.record_url(self._run_id, self.name, url)
+
+    def _record_seen(self, url: str, outcome: str) -> None:
+        """
+        Remember a post's outcome in the persistent seen index. Only runs whose leads are kept do so:
+        a post recorded by a throwaway run (run_platform.py without --export, smoke test) would be
+        skipped by every later run without ever reaching the lead store.
+        """
+        seen = get_seen_index(self._cfg) if self._records_seen else None
+        if seen is not None:
+            seen.record(url, self.name, outcome)
+
+    def _settle_cached(self, url: str, posted: datetime | None) -> None:
+        """Posts older than http_cache.immutable_after_days will not change: keep serving them from cache."""
+        opts = self._config().get("http_cache") or {}
+        cache = get_http_cache(self._cfg)
+        if cache is None or posted is None:
+            return
+        if posted.tzinfo is None:
+            posted = posted.replace(tzinfo=timezone.utc)
+        if datetime.now(timezone.utc) - posted > timedelta(days=opts.get("immutable_after_days", 30)):
+            cache.mark_immutable(url)
+
+    def _detail_engine(self, config: dict, state: StopState, concurrency: int) -> AsyncPageEngine | None:
+        if self._engine is None:
+            try:
+                self._engine = AsyncPageEngine(
+                    config, self.name, state, allow_resources=self.allow_resources, concurrency=concurrency
+                ).start()
+            except Exception as e:
+                log_message("async engine unavailable; detail pages run serially", platform=self.name, error=str(e))
+                self.max_concurrent_pages = 1
+                return None
+        self._engine.state = state
+        return self._engine
+
+    def _close_engine(self) -> None:
+        if self._engine is not None:
+            self._engine.close()
+            self._engine = None
+
+    def _visit_details(
+        self,
+        ctx: Any,
+        urls: list[str],
+        state: StopState,
+        parse: Callable[[dict, str, str], LeadRecord | None],
+        spec: Spec,
+        cutoff: datetime,
+        leads: LeadSink,
+        config: dict,
+    ) -> None:
+        """
+        Open detail pages, read `spec` from each in one evaluate and parse(fields, url, platform)
+        into `leads`. URLs already in the persistent seen index are skipped and outcomes recorded
+        (see _record_seen). With concurrent_pages > 1 the async engine fetches them N at a time;
+        otherwise pages are visited one by one on the sync context.
+        """
+        seen = get_seen_index(config)
+        if seen is not None:
+            new_urls = seen.filter_new(urls)
+            if len(new_urls) < len(urls):
+                log_message("skipping known posts", platform=self.name, skipped=len(urls) - len(new_urls))
+            urls = new_urls
+        if self._journal is not None:
+            urls = self._journal.filter_new(self._run_id, self.name, urls)
+
+        def take(url: str, fields: dict | None) -> None:
+            taken = self._take_detail(parse(fields, url, self.name) if fields else None, leads, state, cutoff)
+            self._record_seen(url, LEAD if taken else (REJECTED if fields else FAILED))
+            if fields:
+                self._record_processed(url)
+
+        concurrency = self.max_concurrent_pages or config.get("concurrent_pages", 1)
+        engine = None
+        if concurrency > 1 and len(urls) > 1 and async_available():
+            engine = self._detail_engine(config, state, concurrency)
+        if engine is not None:
+            engine.run(urls, fields_extractor(spec), take)
+            return
+
+        for url in urls:
+            if self._should_stop(state)[0]:
+                break
+            self._random_delay(config)
+            record_items_scanned(state, 1)
+            page = self._visit_page(ctx, url)
+            if not page:
+                self._record_page(state, 0)
+                self._record_seen(url, FAILED)
+                continue
+            try:
+                fields = extract_fields(page, spec)
+            except Exception as e:
+                log_message("detail extract failed", platform=self.name, url=url, error=str(e))
+                fields = None
+            page.close()
+            take(url, fields)
 
     def _should_stop(self, state: StopState) -> tuple[bool, str]:
         return check_platform_stop(state, self._config(), self.name)
@@ -50,7 +249,7 @@ class BaseConnector(ABC):
         return extract_and_normalize(text)
 
     def _score_and_summary(self, text: str | None) -> tuple[int, list[str], str]:
-        score, kws = score_requirement(text)
+        score, kws = score_requirement(text, self._cfg)
         summary = summarize_project(text)
         return score, kws, summary
 
@@ -60,32 +259,57 @@ class BaseConnector(ABC):
     def _is_after_cutoff(self, d: datetime | None) -> bool:
         return is_after_cutoff(d, self._get_cutoff())
 
-    def run(self) -> PlatformResult:
-        """Run connector with stop conditions and timing."""
+    def run(
+        self,
+        run_ctx: RunContext | None = None,
+        on_lead: Callable[[LeadRecord], Any] | None = None,
+    ) -> PlatformResult:
+        """
+        Run connector with stop conditions and timing. run_ctx makes stop checks honor the run deadline.
+        With on_lead each lead is handed over as it is scraped and the result carries no leads
+        (only counts); without it result.leads holds them. Leads found before an exception are kept.
+        """
         log_platform_start(self.name)
-        state = StopState(global_start=time())
+        pop_block_stats(self.name)
+        # One snapshot for the whole platform run, handed to fetch() and every stop check
+        self._cfg = get_config()
+        state = StopState(global_start=run_ctx.started_at if run_ctx else time(), run=run_ctx)
         state.reset_for_platform()
-        leads: list[Lead] = []
+        self._sink = sink = LeadSink(on_lead)
+        self._journal = get_run_journal(self._cfg) if run_ctx is not None else None
+        self._run_id = run_ctx.run_id if run_ctx is not None else ""
+        self._records_seen = run_ctx is not None or on_lead is not None
         error_msg: str | None = None
         stopped_reason = ""
 
         try:
-            leads = self.fetch(
+            fetched = self.fetch(
                 cutoff_date=self._get_cutoff(),
                 query_config=self._config(),
                 state=state,
             )
+            # Leads a connector returned without adding them to the sink stream now
+            for lead in fetched:
+                sink.add(lead)
         except Exception as e:
             error_msg = str(e)
             stopped_reason = "exception"
+        finally:
+            self._close_engine()
+            self._sink = None
+            self._journal = None
+            self._records_seen = False
 
         elapsed = time() - state.platform_start
+        blocked = pop_block_stats(self.name)
+        if run_ctx is not None:
+            run_ctx.platform_finished(len(sink), self.budgeted)
         log_platform_end(
             self.name,
             pages_visited=state.pages_visited,
             items_scanned=state.items_scanned,
-            leads_found=len(leads),
-            new_leads=len(leads),
+            leads_found=len(sink),
+            new_leads=len(sink),
             time_seconds=elapsed,
             error=error_msg,
             stopped_reason=stopped_reason or ("ok" if not error_msg else "error"),
@@ -93,12 +317,14 @@ class BaseConnector(ABC):
         return PlatformResult(
             platform=self.name,
             success=error_msg is None,
-            leads=leads,
+            leads=sink.leads,
             pages_visited=state.pages_visited,
             items_scanned=state.items_scanned,
-            leads_found=len(leads),
-            new_leads=len(leads),
+            leads_found=len(sink),
+            new_leads=len(sink),
             time_taken_seconds=elapsed,
             error=error_msg,
             stopped_reason=stopped_reason or "ok",
+            requests_blocked=blocked.requests_blocked,
+            bytes_saved=blocked.bytes_saved,
         )
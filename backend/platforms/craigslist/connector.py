@@ -4,15 +4,18 @@ import random
 import time
 from urllib.parse import urljoin
 
-from core.browser import browser_context, visit_page
+from core.browser import visit_page
 from core.config import get_config
-from core.date_utils import get_cutoff_date, is_after_cutoff, parse_date_iso
+from core.date_utils import get_cutoff_date
+from core.http_client import get_http_client, parse_links
 from core.logging import log_message
-from core.models import Lead, SourceType
+from core.models import LeadRecord, SourceType
 from core.stop_conditions import StopState, record_items_scanned
+from core.url_canon import add_if_new
 from platforms.base import BaseConnector
 
-from .parser import parse_post_page
+from .parser import lead_from_fields
+from .selectors import DETAIL_SPEC
 from .queries import get_search_urls
 
 
@@ -22,6 +25,17 @@ def _random_delay(config: dict) -> None:
     time.sleep(random.randint(lo, hi) / 1000.0)
 
 
+def _listing_hrefs_html(html: str, base_url: str, seen: set) -> list[str]:
+    """Post links from static search HTML (no-JS result list); empty when the page needs JS."""
+    hrefs = []
+    for link in parse_links(html, base_url):
+        if ("/cpg/" in link.href or "/jjj/" in link.href) and add_if_new(seen, link.href):
+            hrefs.append(link.href)
+            if len(hrefs) >= 50:
+                break
+    return hrefs
+
+
 class CraigslistConnector(BaseConnector):
     name = "craigslist"
     source_type = SourceType.MARKETPLACE
@@ -31,19 +45,29 @@ class CraigslistConnector(BaseConnector):
         cutoff_date=None,
         query_config=None,
         state: StopState | None = None,
-    ) -> list[Lead]:
+    ) -> list[LeadRecord]:
         config = query_config or get_config()
         state = state or StopState()
         cutoff = cutoff_date or get_cutoff_date(config.get("months_lookback", 6))
-        leads: list[Lead] = []
+        leads = self._lead_sink()
         seen: set[str] = set()
 
         try:
-            with browser_context(config) as (_pw, ctx):
-                for list_url in get_search_urls():
+            with self._browser(config) as (_pw, ctx):
+                http = get_http_client(config)
+                for list_url in self._listing("search", get_search_urls(), state):
                     if self._should_stop(state)[0]:
                         break
                     _random_delay(config)
+                    html = http.get_html(list_url, self.name) if http else None
+                    hrefs = _listing_hrefs_html(html, list_url, seen) if html else []
+                    if hrefs:
+                        record_items_scanned(state, len(hrefs))
+                        self._record_page(state, 0)
+                        self._visit_details(
+                            ctx, hrefs[:25], state, lead_from_fields, DETAIL_SPEC, cutoff, leads, config
+                        )
+                        continue
                     page = self._visit_page(ctx, list_url)
                     if not page:
                         self._record_page(state, 0)
@@ -53,34 +77,16 @@ class CraigslistConnector(BaseConnector):
                         hrefs = []
                         for a in links[:50]:
                             href = a.get_attribute("href")
-                            if href and ("/cpg/" in href or "/jjj/" in href) and href not in seen:
+                            if href and ("/cpg/" in href or "/jjj/" in href):
                                 full = urljoin("https://www.craigslist.org", href) if not href.startswith("http") else href
-                                seen.add(full)
-                                hrefs.append(full)
+                                if add_if_new(seen, full):
+                                    hrefs.append(full)
                         page.close()
                         record_items_scanned(state, len(hrefs))
                         self._record_page(state, 0)
-                        for post_url in hrefs[:25]:
-                            if self._should_stop(state)[0]:
-                                break
-                            _random_delay(config)
-                            record_items_scanned(state, 1)
-                            p2 = self._visit_page(ctx, post_url)
-                            if not p2:
-                                self._record_page(state, 0)
-                                continue
-                            lead = parse_post_page(p2, post_url, self.name)
-                            p2.close()
-                            if lead and lead.post_url not in {l.post_url for l in leads}:
-                                if lead.post_date:
-                                    d = parse_date_iso(lead.post_date)
-                                    if d and not is_after_cutoff(d, cutoff):
-                                        self._record_page(state, 0)
-                                        continue
-                                leads.append(lead)
-                                self._record_page(state, 1)
-                            else:
-                                self._record_page(state, 0)
+                        self._visit_details(
+                            ctx, hrefs[:25], state, lead_from_fields, DETAIL_SPEC, cutoff, leads, config
+                        )
                     except Exception as e:
                         log_message("craigslist listing error", url=list_url, error=str(e))
                         self._record_page(state, 0)
@@ -88,4 +94,4 @@ class CraigslistConnector(BaseConnector):
             log_message("craigslist connector error", error=str(e))
             raise
 
-        return leads
+        return leads.leads
@@ -2,17 +2,28 @@
 
 from core.date_utils import parse_date_iso, to_iso
 from core.email_extract import extract_and_normalize
-from core.models import Lead, EmailSource, SourceType
+from core.extraction import extract_fields, field_text
+from core.models import LeadRecord, EmailSource, SourceType
 from core.requirement_scoring import score_requirement, should_save_lead
 from core.description_summary import summarize_project
 
+from .selectors import DETAIL_SPEC
 
-def parse_post_page(page, post_url: str, platform: str = "craigslist") -> Lead | None:
+
+def parse_post_page(page, post_url: str, platform: str = "craigslist") -> LeadRecord | None:
+    """Extract lead from a Craigslist post page; DETAIL_SPEC is read in one evaluate."""
+    try:
+        fields = extract_fields(page, DETAIL_SPEC)
+    except Exception:
+        return None
+    return lead_from_fields(fields, post_url, platform)
+
+
+def lead_from_fields(fields: dict, post_url: str, platform: str = "craigslist") -> LeadRecord | None:
+    """Build Lead from the DETAIL_SPEC fields dict (no browser needed)."""
     try:
-        title_el = page.query_selector("#titletextonly, .postingtitle")
-        title = (title_el.inner_text() or "").strip() if title_el else ""
-        body_el = page.query_selector("#postingbody")
-        body = (body_el.inner_text() or "").strip() if body_el else ""
+        title = field_text(fields, "title")
+        body = field_text(fields, "body")
         text = f"{title}\n{body}".strip()
         if not text:
             return None
@@ -26,22 +37,17 @@ def parse_post_page(page, post_url: str, platform: str = "craigslist") -> Lead |
         email = emails[0] if emails else ""
         email_source = EmailSource.IN_POST if email else EmailSource.NONE
 
-        time_el = page.query_selector("time.date")
-        post_date = None
-        if time_el:
-            dt = time_el.get_attribute("datetime")
-            if dt:
-                post_date = dt.strip()[:25]
-            else:
-                rel = (time_el.inner_text() or "").strip()
-                from core.date_utils import parse_relative_date
-                d = parse_relative_date(rel)
-                post_date = to_iso(d) if d else None
+        post_date = field_text(fields, "datetime")[:25] or None
+        rel = field_text(fields, "time")
+        if not post_date and rel:
+            from core.date_utils import parse_relative_date
+            d = parse_relative_date(rel)
+            post_date = to_iso(d) if d else None
 
         snippet = (body or title)[:500]
         project_description = summarize_project(text)
 
-        return Lead(
+        return LeadRecord(
             client_name="Unknown",
             post_url=post_url,
             email=email,
@@ -5,3 +5,11 @@ POST_TITLE = "#titletextonly"
 POST_BODY = "#postingbody"
 POST_DATE = "time.date"
 POST_REPLY = ".reply-button"
+
+# Detail page fields, read in one page.evaluate (core.extraction); selectors tried in order
+DETAIL_SPEC = {
+    "title": {"selectors": ["#titletextonly", ".postingtitle"]},
+    "body": {"selectors": ["#postingbody"]},
+    "time": {"selectors": ["time.date"]},
+    "datetime": {"selectors": ["time.date"], "attr": "datetime"},
+}
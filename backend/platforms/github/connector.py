@@ -4,15 +4,17 @@ import random
 import time
 from urllib.parse import urljoin
 
-from core.browser import browser_context, visit_page
+from core.browser import visit_page
 from core.config import get_config
-from core.date_utils import get_cutoff_date, is_after_cutoff, parse_date_iso
+from core.date_utils import get_cutoff_date
 from core.logging import log_message
-from core.models import Lead, SourceType
+from core.models import LeadRecord, SourceType
 from core.stop_conditions import StopState, record_items_scanned
+from core.url_canon import add_if_new
 from platforms.base import BaseConnector
 
-from .parser import parse_issue_page
+from .parser import lead_from_fields
+from .selectors import DETAIL_SPEC
 from .queries import get_search_urls
 
 
@@ -31,16 +33,16 @@ class GitHubConnector(BaseConnector):
         cutoff_date=None,
         query_config=None,
         state: StopState | None = None,
-    ) -> list[Lead]:
+    ) -> list[LeadRecord]:
         config = query_config or get_config()
         state = state or StopState()
         cutoff = cutoff_date or get_cutoff_date(config.get("months_lookback", 6))
-        leads: list[Lead] = []
+        leads = self._lead_sink()
         seen_urls: set[str] = set()
 
         try:
-            with browser_context(config) as (_pw, ctx):
-                for search_url in get_search_urls()[:8]:
+            with self._browser(config) as (_pw, ctx):
+                for search_url in self._listing("search", get_search_urls()[:8], state):
                     if self._should_stop(state)[0]:
                         break
                     _random_delay(config)
@@ -53,34 +55,16 @@ class GitHubConnector(BaseConnector):
                         hrefs = []
                         for a in links:
                             href = a.get_attribute("href")
-                            if href and "/issues/" in href and href not in seen_urls:
+                            if href and "/issues/" in href:
                                 full = urljoin("https://github.com", href)
-                                seen_urls.add(full)
-                                hrefs.append(full)
+                                if add_if_new(seen_urls, full):
+                                    hrefs.append(full)
                         page.close()
                         record_items_scanned(state, len(hrefs))
                         self._record_page(state, 0)
-                        for issue_url in hrefs[:60]:
-                            if self._should_stop(state)[0]:
-                                break
-                            _random_delay(config)
-                            record_items_scanned(state, 1)
-                            p2 = self._visit_page(ctx, issue_url)
-                            if not p2:
-                                self._record_page(state, 0)
-                                continue
-                            lead = parse_issue_page(p2, issue_url, self.name)
-                            p2.close()
-                            if lead and lead.post_url not in {l.post_url for l in leads}:
-                                if lead.post_date:
-                                    d = parse_date_iso(lead.post_date)
-                                    if d and not is_after_cutoff(d, cutoff):
-                                        self._record_page(state, 0)
-                                        continue
-                                leads.append(lead)
-                                self._record_page(state, 1)
-                            else:
-                                self._record_page(state, 0)
+                        self._visit_details(
+                            ctx, hrefs[:60], state, lead_from_fields, DETAIL_SPEC, cutoff, leads, config
+                        )
                     except Exception as e:
                         log_message("github search error", url=search_url, error=str(e))
                         self._record_page(state, 0)
@@ -88,4 +72,4 @@ class GitHubConnector(BaseConnector):
             log_message("github connector error", error=str(e))
             raise
 
-        return leads
+        return leads.leads
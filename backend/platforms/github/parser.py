@@ -2,17 +2,28 @@
 
 from core.date_utils import parse_relative_date, to_iso
 from core.email_extract import extract_and_normalize
-from core.models import Lead, EmailSource, SourceType
+from core.extraction import extract_fields, field_text
+from core.models import LeadRecord, EmailSource, SourceType
 from core.requirement_scoring import score_requirement, should_save_lead
 from core.description_summary import summarize_project
 
+from .selectors import DETAIL_SPEC
 
-def parse_issue_page(page, issue_url: str, platform: str = "github") -> Lead | None:
+
+def parse_issue_page(page, issue_url: str, platform: str = "github") -> LeadRecord | None:
+    """Extract lead from a GitHub issue page; DETAIL_SPEC is read in one evaluate."""
+    try:
+        fields = extract_fields(page, DETAIL_SPEC)
+    except Exception:
+        return None
+    return lead_from_fields(fields, issue_url, platform)
+
+
+def lead_from_fields(fields: dict, issue_url: str, platform: str = "github") -> LeadRecord | None:
+    """Build Lead from the DETAIL_SPEC fields dict (no browser needed)."""
     try:
-        title_el = page.query_selector("h1 bdi, .gh-header-title")
-        title = (title_el.inner_text() or "").strip() if title_el else ""
-        body_el = page.query_selector(".comment-body.markdown-body, .js-comment-body")
-        body = (body_el.inner_text() or "").strip() if body_el else ""
+        title = field_text(fields, "title")
+        body = field_text(fields, "body")
         text = f"{title}\n{body}".strip()
         if not text:
             return None
@@ -26,24 +37,18 @@ def parse_issue_page(page, issue_url: str, platform: str = "github") -> Lead | N
         email = emails[0] if emails else ""
         email_source = EmailSource.IN_POST if email else EmailSource.NONE
 
-        time_el = page.query_selector("relative-time")
-        post_date = None
-        if time_el:
-            dt = time_el.get_attribute("datetime")
-            if dt:
-                post_date = dt.strip()[:25]
-            else:
-                rel = (time_el.inner_text() or "").strip()
-                d = parse_relative_date(rel)
-                post_date = to_iso(d) if d else None
+        post_date = field_text(fields, "datetime")[:25] or None
+        rel = field_text(fields, "time")
+        if not post_date and rel:
+            d = parse_relative_date(rel)
+            post_date = to_iso(d) if d else None
 
-        author_el = page.query_selector("a.author, [data-hovercard-type='user']")
-        client_name = (author_el.inner_text() or "").strip() if author_el else ""
+        client_name = field_text(fields, "author")
 
         snippet = (body or title)[:500]
         project_description = summarize_project(text)
 
-        return Lead(
+        return LeadRecord(
             client_name=client_name or "Unknown",
             post_url=issue_url,
             email=email,
@@ -6,3 +6,12 @@ ISSUE_BODY = ".comment-body.markdown-body"
 ISSUE_AUTHOR = "a.author"
 ISSUE_TIME = "relative-time"
 ISSUE_LINK = "a[data-hovercard-type='user']"
+
+# Detail page fields, read in one page.evaluate (core.extraction); selectors tried in order
+DETAIL_SPEC = {
+    "title": {"selectors": ["h1 bdi", ".gh-header-title"]},
+    "body": {"selectors": [".comment-body.markdown-body", ".js-comment-body"]},
+    "time": {"selectors": ["relative-time"]},
+    "datetime": {"selectors": ["relative-time"], "attr": "datetime"},
+    "author": {"selectors": ["a.author", "[data-hovercard-type='user']"]},
+}
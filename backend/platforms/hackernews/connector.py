@@ -4,16 +4,19 @@ import random
 import time
 from urllib.parse import urljoin
 
-from core.browser import browser_context, visit_page
+from core.browser import visit_page
 from core.config import get_config
-from core.date_utils import get_cutoff_date, is_after_cutoff, parse_date_iso
+from core.date_utils import get_cutoff_date
+from core.http_client import get_http_client, parse_links
 from core.logging import log_message
-from core.models import Lead, SourceType
+from core.models import LeadRecord, SourceType
 from core.stop_conditions import StopState, record_items_scanned
+from core.url_canon import add_if_new
 from platforms.base import BaseConnector
 
-from .parser import parse_item_page
-from .queries import get_listing_urls, get_algolia_search_urls
+from .parser import lead_from_fields
+from .selectors import DETAIL_SPEC
+from .queries import get_listing_urls, get_algolia_api_urls, get_algolia_search_urls
 
 
 def _random_delay(config: dict) -> None:
@@ -22,6 +25,28 @@ def _random_delay(config: dict) -> None:
     time.sleep(random.randint(lo, hi) / 1000.0)
 
 
+def _algolia_hrefs(data: dict, seen: set) -> list[str]:
+    hrefs = []
+    for hit in data.get("hits") or []:
+        item_id = hit.get("objectID") or hit.get("story_id")
+        if item_id:
+            full = f"https://news.ycombinator.com/item?id={item_id}"
+            if add_if_new(seen, full):
+                hrefs.append(full)
+    return hrefs
+
+
+def _collect_hrefs_html(html: str, base_url: str, seen: set) -> list[str]:
+    """_collect_hrefs over static listing HTML (fast path)."""
+    hrefs = []
+    for link in parse_links(html, base_url):
+        full = link.href
+        if "item?id=" in full or "news.ycombinator.com/item" in full or "titlelink" in link.classes:
+            if ("item?id=" in full or "ycombinator.com" in full) and add_if_new(seen, full):
+                hrefs.append(full)
+    return hrefs[:120]
+
+
 def _collect_hrefs(page, seen: set) -> list[str]:
     hrefs = []
     for sel in ["a[href*='item?id=']", "a[href*='news.ycombinator.com/item']", "a.titlelink"]:
@@ -30,10 +55,8 @@ def _collect_hrefs(page, seen: set) -> list[str]:
             href = a.get_attribute("href")
             if href:
                 full = urljoin("https://news.ycombinator.com", href) if not href.startswith("http") else href
-                if "item?id=" in full or "ycombinator.com" in full:
-                    if full not in seen:
-                        seen.add(full)
-                        hrefs.append(full)
+                if ("item?id=" in full or "ycombinator.com" in full) and add_if_new(seen, full):
+                    hrefs.append(full)
     return hrefs
 
 
@@ -46,20 +69,32 @@ class HackerNewsConnector(BaseConnector):
         cutoff_date=None,
         query_config=None,
         state: StopState | None = None,
-    ) -> list[Lead]:
+    ) -> list[LeadRecord]:
         config = query_config or get_config()
         state = state or StopState()
         cutoff = cutoff_date or get_cutoff_date(config.get("months_lookback", 6))
-        leads: list[Lead] = []
+        leads = self._lead_sink()
         seen: set[str] = set()
 
         try:
-            with browser_context(config) as (_pw, ctx):
-                # Algolia search first
-                for alg_url in get_algolia_search_urls()[:5]:
+            with self._browser(config) as (_pw, ctx):
+                http = get_http_client(config)
+                # Algolia search first (JSON API over HTTP, search page in the browser if that fails)
+                for alg_url, api_url in self._listing(
+                    "algolia", list(zip(get_algolia_search_urls()[:5], get_algolia_api_urls())), state
+                ):
                     if self._should_stop(state)[0]:
                         break
                     _random_delay(config)
+                    data = http.get_json(api_url, self.name) if http else None
+                    if isinstance(data, dict):
+                        hrefs = _algolia_hrefs(data, seen)
+                        record_items_scanned(state, len(hrefs))
+                        self._record_page(state, 0)
+                        self._visit_details(
+                            ctx, hrefs[:20], state, lead_from_fields, DETAIL_SPEC, cutoff, leads, config
+                        )
+                        continue
                     page = self._visit_page(ctx, alg_url)
                     if not page:
                         self._record_page(state, 0)
@@ -69,44 +104,34 @@ class HackerNewsConnector(BaseConnector):
                         hrefs = []
                         for a in links[:30]:
                             href = a.get_attribute("href")
-                            if href and "item" in href and href not in seen:
+                            if href and "item" in href:
                                 full = urljoin("https://hn.algolia.com", href) if not href.startswith("http") else href
-                                if "item?id=" in full or "ycombinator.com" in full:
-                                    seen.add(full)
+                                if ("item?id=" in full or "ycombinator.com" in full) and add_if_new(seen, full):
                                     hrefs.append(full)
                         page.close()
                         record_items_scanned(state, len(hrefs))
                         self._record_page(state, 0)
-                        for item_url in hrefs[:20]:
-                            if self._should_stop(state)[0]:
-                                break
-                            _random_delay(config)
-                            record_items_scanned(state, 1)
-                            p2 = self._visit_page(ctx, item_url)
-                            if not p2:
-                                self._record_page(state, 0)
-                                continue
-                            lead = parse_item_page(p2, item_url, self.name)
-                            p2.close()
-                            if lead and lead.post_url not in {l.post_url for l in leads}:
-                                if lead.post_date:
-                                    d = parse_date_iso(lead.post_date)
-                                    if d and not is_after_cutoff(d, cutoff):
-                                        self._record_page(state, 0)
-                                        continue
-                                leads.append(lead)
-                                self._record_page(state, 1)
-                            else:
-                                self._record_page(state, 0)
+                        self._visit_details(
+                            ctx, hrefs[:20], state, lead_from_fields, DETAIL_SPEC, cutoff, leads, config
+                        )
                     except Exception as e:
                         log_message("hn algolia error", url=alg_url, error=str(e))
                         self._record_page(state, 0)
 
                 # HN listing pages
-                for list_url in get_listing_urls():
+                for list_url in self._listing("listing", get_listing_urls(), state):
                     if self._should_stop(state)[0]:
                         break
                     _random_delay(config)
+                    html = http.get_html(list_url, self.name) if http else None
+                    hrefs = _collect_hrefs_html(html, list_url, seen) if html else []
+                    if hrefs:
+                        record_items_scanned(state, len(hrefs))
+                        self._record_page(state, 0)
+                        self._visit_details(
+                            ctx, hrefs[:25], state, lead_from_fields, DETAIL_SPEC, cutoff, leads, config
+                        )
+                        continue
                     page = self._visit_page(ctx, list_url)
                     if not page:
                         self._record_page(state, 0)
@@ -116,27 +141,9 @@ class HackerNewsConnector(BaseConnector):
                         page.close()
                         record_items_scanned(state, len(hrefs))
                         self._record_page(state, 0)
-                        for item_url in hrefs[:25]:
-                            if self._should_stop(state)[0]:
-                                break
-                            _random_delay(config)
-                            record_items_scanned(state, 1)
-                            p2 = self._visit_page(ctx, item_url)
-                            if not p2:
-                                self._record_page(state, 0)
-                                continue
-                            lead = parse_item_page(p2, item_url, self.name)
-                            p2.close()
-                            if lead and lead.post_url not in {l.post_url for l in leads}:
-                                if lead.post_date:
-                                    d = parse_date_iso(lead.post_date)
-                                    if d and not is_after_cutoff(d, cutoff):
-                                        self._record_page(state, 0)
-                                        continue
-                                leads.append(lead)
-                                self._record_page(state, 1)
-                            else:
-                                self._record_page(state, 0)
+                        self._visit_details(
+                            ctx, hrefs[:25], state, lead_from_fields, DETAIL_SPEC, cutoff, leads, config
+                        )
                     except Exception as e:
                         log_message("hn listing error", url=list_url, error=str(e))
                         self._record_page(state, 0)
@@ -144,4 +151,4 @@ class HackerNewsConnector(BaseConnector):
             log_message("hackernews connector error", error=str(e))
             raise
 
-        return leads
+        return leads.leads
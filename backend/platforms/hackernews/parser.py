@@ -3,19 +3,30 @@
 import re
 from core.date_utils import parse_relative_date, to_iso
 from core.email_extract import extract_and_normalize
-from core.models import Lead, EmailSource, SourceType
+from core.extraction import extract_fields, field_text
+from core.models import LeadRecord, EmailSource, SourceType
 from core.requirement_scoring import score_requirement, should_save_lead
 from core.description_summary import summarize_project
 
+from .selectors import DETAIL_SPEC
+
 MAILTO_RE = re.compile(r"mailto:([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})", re.I)
 
 
-def parse_item_page(page, item_url: str, platform: str = "hackernews") -> Lead | None:
+def parse_item_page(page, item_url: str, platform: str = "hackernews") -> LeadRecord | None:
+    """Extract lead from an HN item page; DETAIL_SPEC is read in one evaluate."""
+    try:
+        fields = extract_fields(page, DETAIL_SPEC)
+    except Exception:
+        return None
+    return lead_from_fields(fields, item_url, platform)
+
+
+def lead_from_fields(fields: dict, item_url: str, platform: str = "hackernews") -> LeadRecord | None:
+    """Build Lead from the DETAIL_SPEC fields dict (no browser needed)."""
     try:
-        title_el = page.query_selector(".title a, .fatitem .title")
-        title = (title_el.inner_text() or "").strip() if title_el else ""
-        body_el = page.query_selector(".toptext, .comment, .commtext")
-        body = (body_el.inner_text() or "").strip() if body_el else ""
+        title = field_text(fields, "title")
+        body = field_text(fields, "body")
         text = f"{title}\n{body}".strip()
         if not text:
             return None
@@ -34,20 +45,18 @@ def parse_item_page(page, item_url: str, platform: str = "hackernews") -> Lead |
         email = emails[0] if emails else ""
         email_source = EmailSource.IN_POST if email else EmailSource.NONE
 
-        time_el = page.query_selector(".age a")
         post_date = None
-        if time_el:
-            rel = (time_el.inner_text() or "").strip()
+        rel = field_text(fields, "time")
+        if rel:
             d = parse_relative_date(rel)
             post_date = to_iso(d) if d else None
 
-        author_el = page.query_selector(".hnuser")
-        client_name = (author_el.inner_text() or "").strip() if author_el else ""
+        client_name = field_text(fields, "author")
 
         snippet = (body or title)[:500]
         project_description = summarize_project(text)
 
-        return Lead(
+        return LeadRecord(
             client_name=client_name or "Unknown",
             post_url=item_url,
             email=email,
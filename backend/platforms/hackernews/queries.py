@@ -11,13 +11,23 @@ def get_listing_urls() -> list[str]:
     ]
 
 
+ALGOLIA_QUERIES = [
+    "who is hiring",
+    "hiring developer",
+    "looking for developer",
+    "hire freelancer",
+    "contract developer",
+]
+
+
 def get_algolia_search_urls() -> list[str]:
     """Algolia HN search - browser only."""
-    qs = [
-        "who is hiring",
-        "hiring developer",
-        "looking for developer",
-        "hire freelancer",
-        "contract developer",
+    return [f"https://hn.algolia.com/?q={quote_plus(q)}&sort=byDate" for q in ALGOLIA_QUERIES]
+
+
+def get_algolia_api_urls() -> list[str]:
+    """Same searches on the Algolia JSON API (plain HTTP), index-aligned with get_algolia_search_urls."""
+    return [
+        f"https://hn.algolia.com/api/v1/search_by_date?query={quote_plus(q)}&tags=story&hitsPerPage=30"
+        for q in ALGOLIA_QUERIES
     ]
-    return [f"https://hn.algolia.com/?q={quote_plus(q)}&sort=byDate" for q in qs]
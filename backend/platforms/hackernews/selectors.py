@@ -4,3 +4,11 @@ STORY_LINK = "a.titlelink"
 MORE_LINK = "a.morelink"
 ITEM_ROW = "tr.athing"
 SUBTEXT = "span.subline"
+
+# Detail page fields, read in one page.evaluate (core.extraction); selectors tried in order
+DETAIL_SPEC = {
+    "title": {"selectors": [".title a", ".fatitem .title"]},
+    "body": {"selectors": [".toptext", ".comment", ".commtext"]},
+    "time": {"selectors": [".age a"]},
+    "author": {"selectors": [".hnuser"]},
+}
@@ -5,16 +5,19 @@ import random
 import time
 from urllib.parse import urljoin
 
-from core.browser import browser_context, visit_page
+from core.browser import visit_page
 from core.config import get_config
 from core.date_utils import get_cutoff_date, is_after_cutoff
+from core.http_client import get_http_client
 from core.logging import log_message
-from core.models import Lead, SourceType
+from core.models import LeadRecord, SourceType
 from core.stop_conditions import StopState, record_items_scanned
+from core.url_canon import add_if_new
 from platforms.base import BaseConnector
 
-from .parser import lead_from_json_post, parse_post_page
+from .parser import leads_from_json_posts, lead_from_fields
 from .queries import get_subreddit_urls, get_json_urls, SUBREDDITS
+from .selectors import DETAIL_SPEC
 
 
 def _random_delay(config: dict) -> None:
@@ -32,38 +35,40 @@ class RedditConnector(BaseConnector):
         cutoff_date=None,
         query_config=None,
         state: StopState | None = None,
-    ) -> list[Lead]:
+    ) -> list[LeadRecord]:
         config = query_config or get_config()
         state = state or StopState()
         cutoff = cutoff_date or get_cutoff_date(config.get("months_lookback", 6))
-        leads: list[Lead] = []
-        seen_ids: set[str] = set()
+        leads = self._lead_sink()
+        seen: set[str] = set()  # canonical post keys - JSON and HTML spellings of a post collide
 
         try:
-            with browser_context(config) as (_pw, ctx):
-                # 1) Try JSON endpoints via page.goto (browser fetches .json, we read body)
-                for json_url in get_json_urls(limit=100)[:10]:
+            with self._browser(config) as (_pw, ctx):
+                # 1) JSON endpoints: plain HTTP first, page.goto (browser reads the .json body) if blocked
+                http = get_http_client(config)
+                for json_url in self._listing("json", get_json_urls(limit=100)[:10], state):
                     if self._should_stop(state)[0]:
                         break
                     _random_delay(config)
                     try:
-                        page = ctx.new_page()
-                        page.goto(json_url, wait_until="domcontentloaded", timeout=15000)
-                        raw = page.evaluate("() => document.body ? document.body.innerText : ''")
-                        page.close()
-                        if not raw or not raw.strip():
-                            continue
-                        data = json.loads(raw)
+                        data = http.get_json(json_url, self.name) if http else None
+                        if data is None:
+                            page = ctx.new_page()
+                            page.goto(json_url, wait_until="domcontentloaded", timeout=15000)
+                            raw = page.evaluate("() => document.body ? document.body.innerText : ''")
+                            page.close()
+                            if not raw or not raw.strip():
+                                continue
+                            data = json.loads(raw)
                         children = data.get("data", {}).get("children", [])
                         record_items_scanned(state, len(children))
                         new_from_page = 0
+                        posts = []
                         for child in children:
                             post = child.get("data", {})
-                            post_id = post.get("id")
-                            if post_id and post_id in seen_ids:
+                            permalink = post.get("permalink") or (f"/comments/{post['id']}/" if post.get("id") else "")
+                            if permalink and not add_if_new(seen, urljoin("https://www.reddit.com", permalink)):
                                 continue
-                            if post_id:
-                                seen_ids.add(post_id)
                             created = post.get("created_utc")
                             if created:
                                 from datetime import datetime, timezone
@@ -73,9 +78,9 @@ class RedditConnector(BaseConnector):
                                         continue
                                 except (TypeError, ValueError):
                                     pass
-                            lead = lead_from_json_post(post, self.name)
-                            if lead and lead.post_url not in {l.post_url for l in leads}:
-                                leads.append(lead)
+                            posts.append(post)
+                        for lead in leads_from_json_posts(posts, self.name):
+                            if lead and leads.add(lead):
                                 new_from_page += 1
                         self._record_page(state, new_from_page)
                     except Exception as e:
@@ -84,7 +89,7 @@ class RedditConnector(BaseConnector):
 
                 # 2) HTML fallback: listing pages then detail
                 if len(leads) < 50:
-                    for list_url in get_subreddit_urls()[:5]:
+                    for list_url in self._listing("listing", get_subreddit_urls()[:5], state):
                         if self._should_stop(state)[0]:
                             break
                         _random_delay(config)
@@ -99,31 +104,12 @@ class RedditConnector(BaseConnector):
                                 href = a.get_attribute("href")
                                 if href and "/comments/" in href:
                                     full = urljoin("https://www.reddit.com", href)
-                                    if full not in {l.post_url for l in leads}:
+                                    if add_if_new(seen, full):
                                         hrefs.append(full)
                             page.close()
-                            for post_url in hrefs[:30]:
-                                if self._should_stop(state)[0]:
-                                    break
-                                _random_delay(config)
-                                record_items_scanned(state, 1)
-                                p2 = self._visit_page(ctx, post_url)
-                                if not p2:
-                                    self._record_page(state, 0)
-                                    continue
-                                lead = parse_post_page(p2, post_url, self.name)
-                                p2.close()
-                                if lead and lead.post_url not in {l.post_url for l in leads}:
-                                    if lead.post_date:
-                                        from core.date_utils import parse_date_iso
-                                        d = parse_date_iso(lead.post_date)
-                                        if d and not is_after_cutoff(d, cutoff):
-                                            self._record_page(state, 0)
-                                            continue
-                                    leads.append(lead)
-                                    self._record_page(state, 1)
-                                else:
-                                    self._record_page(state, 0)
+                            self._visit_details(
+                                ctx, hrefs[:30], state, lead_from_fields, DETAIL_SPEC, cutoff, leads, config
+                            )
                         except Exception as e:
                             log_message("reddit listing error", url=list_url, error=str(e))
                             self._record_page(state, 0)
@@ -131,4 +117,4 @@ class RedditConnector(BaseConnector):
             log_message("reddit connector error", error=str(e))
             raise
 
-        return leads
+        return leads.leads
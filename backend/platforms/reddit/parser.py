@@ -1,31 +1,35 @@
 """Extract lead from Reddit post (HTML page or JSON)."""
 
 from datetime import datetime, timezone
-from typing import Any
 
 from core.date_utils import to_iso
 from core.email_extract import extract_and_normalize
-from core.models import Lead, EmailSource, SourceType
+from core.extraction import extract_fields, field_text
+from core.models import LeadRecord, EmailSource, SourceType
 from core.debug_candidates import is_enabled, record_rejected
-from core.requirement_scoring import score_requirement, should_save_lead
+from core.requirement_scoring import score_many, score_requirement, should_save_lead
 from core.description_summary import summarize_project
 
+from .selectors import DETAIL_SPEC
 
-def lead_from_json_post(post: dict, platform: str = "reddit") -> Lead | None:
-    """Build Lead from Reddit API-style post dict (from .json endpoint)."""
+
+def _json_post_text(post: dict) -> tuple[str, str, str]:
+    title = (post.get("title") or "").strip()
+    selftext = (post.get("selftext") or "").strip()
+    return title, selftext, f"{title}\n{selftext}".strip()
+
+
+def _lead_from_scored(post: dict, score: int, kws: list[str], save: bool, platform: str) -> LeadRecord | None:
     try:
-        title = (post.get("title") or "").strip()
-        selftext = (post.get("selftext") or "").strip()
-        text = f"{title}\n{selftext}".strip()
+        title, selftext, text = _json_post_text(post)
         url = f"https://www.reddit.com{(post.get('permalink') or '')}"
         if not text:
             if is_enabled():
                 record_rejected(url, title[:200], "no_requirement_keywords")
             return None
 
-        score, kws = score_requirement(text)
         has_email = "@" in text
-        if not should_save_lead(text, has_email, score, kws) and score < 20 and not has_email:
+        if not save and score < 20 and not has_email:
             if is_enabled():
                 record_rejected(url, text[:500], "no_requirement_keywords")
             return None
@@ -50,7 +54,7 @@ def lead_from_json_post(post: dict, platform: str = "reddit") -> Lead | None:
         snippet = (selftext or title)[:500]
         project_description = summarize_project(text)
 
-        return Lead(
+        return LeadRecord(
             client_name=author,
             post_url=post_url,
             email=email,
@@ -69,17 +73,40 @@ def lead_from_json_post(post: dict, platform: str = "reddit") -> Lead | None:
         return None
 
 
-def parse_post_page(
-    page: Any,
-    post_url: str,
-    platform: str = "reddit",
-) -> Lead | None:
-    """Extract lead from a Reddit post detail page (HTML)."""
+def lead_from_json_post(post: dict, platform: str = "reddit") -> LeadRecord | None:
+    """Build Lead from Reddit API-style post dict (from .json endpoint)."""
+    try:
+        text = _json_post_text(post)[2]
+        score, kws = score_requirement(text)
+        save = should_save_lead(text, "@" in text, score, kws)
+    except Exception:
+        return None
+    return _lead_from_scored(post, score, kws, save, platform)
+
+
+def leads_from_json_posts(posts: list[dict], platform: str = "reddit") -> list[LeadRecord | None]:
+    """lead_from_json_post for a whole listing; posts are scored in one score_many batch."""
+    texts = [_json_post_text(p)[2] for p in posts]
+    return [
+        _lead_from_scored(post, r.score, r.matched, r.save, platform)
+        for post, r in zip(posts, score_many(texts))
+    ]
+
+
+def parse_post_page(page, post_url: str, platform: str = "reddit") -> LeadRecord | None:
+    """Extract lead from a Reddit post detail page (HTML); DETAIL_SPEC is read in one evaluate."""
     try:
-        title_el = page.query_selector("h1, [data-testid='post-title']")
-        title = (title_el.inner_text() or "").strip() if title_el else ""
-        body_el = page.query_selector("[data-testid='post-content'] .md, .usertext-body .md, [data-adclicklocation='text']")
-        body = (body_el.inner_text() or "").strip() if body_el else ""
+        fields = extract_fields(page, DETAIL_SPEC)
+    except Exception:
+        return None
+    return lead_from_fields(fields, post_url, platform)
+
+
+def lead_from_fields(fields: dict, post_url: str, platform: str = "reddit") -> LeadRecord | None:
+    """Build Lead from the DETAIL_SPEC fields dict (no browser needed)."""
+    try:
+        title = field_text(fields, "title")
+        body = field_text(fields, "body")
         text = f"{title}\n{body}".strip()
         if not text:
             return None
@@ -94,24 +121,18 @@ def parse_post_page(
         email_source = EmailSource.IN_POST if email else EmailSource.NONE
 
         from core.date_utils import parse_relative_date
-        time_el = page.query_selector("time")
-        post_date = None
-        if time_el:
-            dt = time_el.get_attribute("datetime")
-            if dt:
-                post_date = dt.strip()[:25]
-            else:
-                rel = (time_el.inner_text() or "").strip()
-                d = parse_relative_date(rel)
-                post_date = to_iso(d) if d else None
-
-        author_el = page.query_selector("a[href*='/user/']")
-        client_name = (author_el.inner_text() or "").strip() if author_el else ""
+        post_date = field_text(fields, "datetime")[:25] or None
+        rel = field_text(fields, "time")
+        if not post_date and rel:
+            d = parse_relative_date(rel)
+            post_date = to_iso(d) if d else None
+
+        client_name = field_text(fields, "author")
 
         snippet = (body or title)[:500]
         project_description = summarize_project(text)
 
-        return Lead(
+        return LeadRecord(
             client_name=client_name or "Unknown",
             post_url=post_url,
             email=email,
@@ -10,3 +10,12 @@ POST_PERMALINK = "a[data-testid='comments-page-link-navigation']"
 # Fallbacks for different Reddit layouts
 POST_LINKS_FALLBACK = "a[href*='/r/forhire/comments/'], a[href*='/r/hiring/comments/'], a[href*='/r/slavelabour/comments/']"
 LISTING_ITEMS = "shreddit-post, [data-testid='post-container'], thing"
+
+# Detail page fields, read in one page.evaluate (core.extraction); selectors tried in order
+DETAIL_SPEC = {
+    "title": {"selectors": ["h1", "[data-testid='post-title']"]},
+    "body": {"selectors": ["[data-testid='post-content'] .md", ".usertext-body .md", "[data-adclicklocation='text']"]},
+    "time": {"selectors": ["time"]},
+    "datetime": {"selectors": ["time"], "attr": "datetime"},
+    "author": {"selectors": ["a[href*='/user/']"]},
+}
@@ -3,17 +3,25 @@
 import random
 import time
 from collections import defaultdict
-from urllib.parse import quote_plus, urlparse
+from urllib.parse import quote_plus, urljoin, urlparse
 
-from core.browser import browser_context, visit_page
+from core.browser import visit_page
 from core.config import get_config
+from core.http_client import get_http_client, parse_links
 from core.logging import log_message
-from core.models import Lead, SourceType
+from core.models import LeadRecord, SourceType
+from core.parsing_utils import main_content_from_html
 from core.queries_global import DISCOVERY_QUERIES
 from core.stop_conditions import StopState, record_items_scanned
-from platforms.base import BaseConnector
+from core.url_canon import add_if_new, unwrap
+from platforms.base import BaseConnector, LeadSink
+from storage.seen_index import FAILED, LEAD, REJECTED, get_seen_index
 
-from .parser import parse_generic_page
+from .parser import lead_from_content, parse_generic_page
+
+
+# Static HTML shorter than this is treated as a JS shell and re-fetched in the browser
+MIN_STATIC_TEXT = 200
 
 
 def _domain(url: str) -> str:
@@ -32,6 +40,13 @@ def _random_delay(config: dict) -> None:
 def _search_ddg(ctx, query: str, config: dict) -> list[str]:
     """DuckDuckGo HTML - less blocking."""
     url = "https://html.duckduckgo.com/html/?q=" + quote_plus(query)
+    http = get_http_client(config)
+    html = http.get_html(url, "search_discovery") if http else None
+    if html:
+        hrefs = [unwrap(l.href) for l in parse_links(html, url) if "result__a" in l.classes]
+        hrefs = [h for h in hrefs if h.startswith("http") and "duckduckgo" not in h][:25]
+        if hrefs:
+            return hrefs
     page = visit_page(ctx, url, timeout=config.get("page_timeout", 30000))
     if not page:
         return []
@@ -39,8 +54,8 @@ def _search_ddg(ctx, query: str, config: dict) -> list[str]:
         links = page.query_selector_all("a.result__a")
         hrefs = []
         for a in links[:25]:
-            href = a.get_attribute("href")
-            if href and "duckduckgo" not in href:
+            href = unwrap(urljoin(url, a.get_attribute("href") or ""))
+            if href.startswith("http") and "duckduckgo" not in href:
                 hrefs.append(href)
         page.close()
         return hrefs
@@ -54,6 +69,14 @@ def _search_ddg(ctx, query: str, config: dict) -> list[str]:
 
 def _search_bing(ctx, query: str, config: dict) -> list[str]:
     url = "https://www.bing.com/search?q=" + quote_plus(query)
+    http = get_http_client(config)
+    html = http.get_html(url, "search_discovery") if http else None
+    if html:
+        # Result links may be bing.com/ck/a click-tracking wrappers around the real URL
+        hrefs = [unwrap(l.href) for l in parse_links(html, url) if "b_algo" in l.parent_classes]
+        hrefs = [h for h in hrefs if h.startswith("http") and "bing" not in h and "microsoft" not in h][:25]
+        if hrefs:
+            return hrefs
     page = visit_page(ctx, url, timeout=config.get("page_timeout", 30000))
     if not page:
         return []
@@ -61,7 +84,7 @@ def _search_bing(ctx, query: str, config: dict) -> list[str]:
         links = page.query_selector_all("li.b_algo a[href^='http']")
         hrefs = []
         for a in links[:25]:
-            href = a.get_attribute("href")
+            href = unwrap(a.get_attribute("href") or "")
             if href and "bing" not in href and "microsoft" not in href:
                 hrefs.append(href)
         page.close()
@@ -80,11 +103,11 @@ def _search_google(ctx, query: str, config: dict) -> list[str]:
     if not page:
         return []
     try:
-        links = page.query_selector_all("div#search a[href^='http']")
+        links = page.query_selector_all("div#search a[href^='http'], div#search a[href^='/url']")
         hrefs = []
         for a in links[:25]:
-            href = a.get_attribute("href")
-            if href and "google" not in href and "youtube" not in href:
+            href = unwrap(urljoin(url, a.get_attribute("href") or ""))
+            if href.startswith("http") and "google" not in href and "youtube" not in href:
                 hrefs.append(href)
         page.close()
         return hrefs
@@ -100,23 +123,33 @@ class SearchDiscoveryConnector(BaseConnector):
     name = "search_discovery"
     source_type = SourceType.SEARCH
 
+    def _take_result(self, url: str, lead: LeadRecord | None, leads: LeadSink, state: StopState) -> None:
+        taken = False
+        if lead and (lead.confidence_score >= 20 or lead.email) and leads.add(lead):
+            self._record_page(state, 1)
+            taken = True
+        self._record_seen(url, LEAD if taken else REJECTED)
+        self._record_processed(url)
+
     def fetch(
         self,
         cutoff_date=None,
         query_config=None,
         state: StopState | None = None,
-    ) -> list[Lead]:
+    ) -> list[LeadRecord]:
         config = query_config or get_config()
         state = state or StopState()
         per_domain_cap = config.get("per_domain_cap", 15)
         domain_count: dict[str, int] = defaultdict(int)
-        leads: list[Lead] = []
+        leads = self._lead_sink()
         seen_urls: set[str] = set()
         queries = DISCOVERY_QUERIES[:25]
+        http = get_http_client(config)
+        seen = get_seen_index(config)
 
         try:
-            with browser_context(config) as (_pw, ctx):
-                for q in queries:
+            with self._browser(config) as (_pw, ctx):
+                for q in self._listing("queries", queries, state):
                     if self._should_stop(state)[0]:
                         break
                     _random_delay(config)
@@ -135,25 +168,32 @@ class SearchDiscoveryConnector(BaseConnector):
                         d = _domain(href)
                         if d and domain_count[d] >= per_domain_cap:
                             continue
-                        if href not in seen_urls:
-                            seen_urls.add(href)
+                        if add_if_new(seen_urls, href):
                             domain_count[d] += 1
                             capped.append(href)
                     self._record_page(state, 0)
+                    if seen is not None:
+                        capped = seen.filter_new(capped)
+                    if self._journal is not None:
+                        capped = self._journal.filter_new(self._run_id, self.name, capped)
                     for result_url in capped:
                         if self._should_stop(state)[0]:
                             break
                         _random_delay(config)
                         record_items_scanned(state, 1)
-                        p2 = visit_page(ctx, result_url)
+                        html = http.get_html(result_url, self.name) if http else None
+                        text, title = main_content_from_html(html) if html else ("", "")
+                        if len(text) >= MIN_STATIC_TEXT:
+                            lead = lead_from_content(text, title, result_url, self.name)
+                            self._take_result(result_url, lead, leads, state)
+                            continue
+                        # JS-rendered, blocked or unreachable over HTTP: render it in the browser
+                        p2 = visit_page(ctx, result_url, platform=self.name)
                         if not p2:
+                            self._record_seen(result_url, FAILED)
                             continue
                         try:
-                            lead = parse_generic_page(p2, result_url, self.name)
-                            if lead and lead.post_url not in {l.post_url for l in leads}:
-                                if lead.confidence_score >= 20 or lead.email:
-                                    leads.append(lead)
-                                    self._record_page(state, 1)
+                            self._take_result(result_url, parse_generic_page(p2, result_url, self.name), leads, state)
                         except Exception as e:
                             log_message("search_discovery parse error", url=result_url, error=str(e))
                         try:
@@ -164,4 +204,4 @@ class SearchDiscoveryConnector(BaseConnector):
             log_message("search_discovery connector error", error=str(e))
             raise
 
-        return leads
+        return leads.leads
@@ -2,18 +2,21 @@
 
 from core.debug_candidates import is_enabled, record_rejected
 from core.email_extract import extract_and_normalize
-from core.models import Lead, EmailSource, SourceType
-from core.parsing_utils import extract_main_content
+from core.models import LeadRecord, EmailSource, SourceType
+from core.parsing_utils import extract_page_content
 from core.requirement_scoring import score_requirement, should_save_lead
 from core.description_summary import summarize_project
 
 
-def parse_generic_page(page, page_url: str, platform: str = "search_discovery") -> Lead | None:
+def parse_generic_page(page, page_url: str, platform: str = "search_discovery") -> LeadRecord | None:
     """Extract from any page - body text, emails, requirement score. Save if score >= 20 or email."""
+    text, title = extract_page_content(page)
+    return lead_from_content(text, title, page_url, platform)
+
+
+def lead_from_content(text: str, title: str, page_url: str, platform: str = "search_discovery") -> LeadRecord | None:
+    """Build Lead from a page's main text and title."""
     try:
-        text = extract_main_content(page)
-        if not text:
-            text = (page.query_selector("body").inner_text() or "").strip() if page.query_selector("body") else ""
         text = (text or "")[:10000]
         if not text:
             if is_enabled():
@@ -31,13 +34,12 @@ def parse_generic_page(page, page_url: str, platform: str = "search_discovery")
         email = emails[0] if emails else ""
         email_source = EmailSource.IN_POST if email else EmailSource.NONE
 
-        title_el = page.query_selector("h1, .title, title")
-        title = (title_el.inner_text() or "").strip() if title_el else ""
+        title = (title or "").strip()
         client_name = title[:100] if title else "Unknown"
         snippet = text[:500]
         project_description = summarize_project(text)
 
-        return Lead(
+        return LeadRecord(
             client_name=client_name or "Unknown",
             post_url=page_url,
             email=email,
@@ -1,7 +1,7 @@
 """Stub connector - exits quickly when platform is blocked or has no public content."""
 
 from core.logging import log_message
-from core.models import Lead, SourceType
+from core.models import LeadRecord, SourceType
 from core.stop_conditions import StopState
 from platforms.base import BaseConnector
 
@@ -9,6 +9,8 @@ from platforms.base import BaseConnector
 class StubConnector(BaseConnector):
     """Best-effort public mode; exits quickly with clear reason."""
 
+    budgeted = False
+
     def __init__(self, platform_name: str):
         self.name = platform_name
         self.source_type = SourceType.OTHER
@@ -18,7 +20,7 @@ class StubConnector(BaseConnector):
         cutoff_date=None,
         query_config=None,
         state: StopState | None = None,
-    ) -> list[Lead]:
+    ) -> list[LeadRecord]:
         log_message(
             "platform stub: best-effort public mode, exiting",
             platform=self.name,
@@ -1,5 +1,4 @@
 """Upwork - stub: requires login for job list; best-effort exit."""
-from core.models import Lead
 from core.stop_conditions import StopState
 from platforms.stub_connector import StubConnector
 
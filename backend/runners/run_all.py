@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 """
-Run all enabled platforms sequentially.
-Merge + dedupe -> export XLSX + JSONL -> print summary.
-Usage: python backend/runners/run_all.py [--debug-save-candidates]
+Run all enabled platforms sequentially, or in parallel worker processes with --workers N.
+Leads stream from connectors into a LeadPipeline (online dedupe -> lead store -> live JSONL) as they are
+scraped; at the end near-duplicate cross-posts are folded and the final XLSX + JSONL written -> print summary.
+With the run journal on (scraper.run_journal), --resume <run_id> continues a killed run: finished platforms
+are skipped, listings restart at the journaled position, processed pages are not revisited and the leads
+already scraped are replayed into the final dedupe/export.
+Usage: python backend/runners/run_all.py [--debug-save-candidates] [--workers N] [--resume RUN_ID]
 """
 
 import argparse
@@ -16,68 +20,130 @@ _BACKEND = Path(__file__).resolve().parent.parent
 if str(_BACKEND) not in sys.path:
     sys.path.insert(0, str(_BACKEND))
 
+from core.browser import browser_pool
 from core.config import get_config, get_platforms_to_run
-from core.dedupe import dedupe_leads
 from core.debug_candidates import set_enabled as set_debug_enabled, save as save_rejected
-from core.export import export_xlsx, export_jsonl
+from core.export import export_parquet
 from core.logging import setup_logging, log_message
-from core.models import Lead, RunSummary, PlatformResult
+from core.models import RunSummary, PlatformResult
+from core.parallel import run_platforms_parallel
+from core.pipeline import LeadPipeline
+from core.run_context import RunContext
 from platforms.registry import get_connector
+from storage.run_journal import RunJournal, get_run_journal
 
 
-def main(debug_save_candidates: bool = False) -> RunSummary:
+def _journal_result(journal: RunJournal | None, run_ctx: RunContext, result: PlatformResult) -> None:
+    """Mark a platform finished unless it failed or the run deadline cut it short (then a resume reruns it)."""
+    if journal is not None and result.success and not run_ctx.expired():
+        journal.platform_done(run_ctx.run_id, result)
+
+
+def main(
+    debug_save_candidates: bool = False,
+    workers: int | None = None,
+    resume: str | None = None,
+    run_id: str | None = None,
+) -> RunSummary:
+    """run_id names a new run (default: from the start time); resume continues a journaled one."""
     setup_logging()
     set_debug_enabled(debug_save_candidates)
     config = get_config()
-    platforms_to_run = get_platforms_to_run()
+    platforms_to_run = get_platforms_to_run(config)
     if not platforms_to_run:
         platforms_to_run = ["reddit", "github", "hackernews", "search_discovery", "craigslist"]
         log_message("No platforms enabled in config; using default 5", platforms=platforms_to_run)
 
-    global_start = time()
+    journal = get_run_journal(config)
+    done: dict[str, PlatformResult] = {}
+    if resume:
+        if journal is None or not journal.has_run(resume):
+            raise ValueError(f"No run journal for run_id {resume!r} (is scraper.run_journal enabled?)")
+        if journal.finished(resume):
+            raise ValueError(f"Run {resume!r} already finished; its journal has been pruned")
+        done = journal.completed(resume)
+        platforms_to_run = [name for name in platforms_to_run if name not in done]
+        log_message("resuming run", run_id=resume, finished=sorted(done), remaining=platforms_to_run)
+
     global_max = config.get("global_max_runtime", 900)
-    all_leads: list[Lead] = []
-    results: list[PlatformResult] = []
-
-    for name in platforms_to_run:
-        if time() - global_start >= global_max:
-            log_message("global_max_runtime reached; stopping")
-            break
-        conn = get_connector(name)
-        if not conn:
-            continue
-        try:
-            result = conn.run()
+    results: list[PlatformResult] = list(done.values())
+    workers = workers or config.get("workers", 1)
+    connectors = [(name, get_connector(name)) for name in platforms_to_run]
+    budgeted = sum(1 for _, conn in connectors if conn and conn.budgeted)
+    run_ctx = RunContext.create(
+        global_max, budgeted, slots=min(workers, max(1, budgeted)), shared=workers > 1, run_id=resume or run_id
+    )
+    global_start = run_ctx.started_at
+    log_message("run started", run_id=run_ctx.run_id, platforms=len(connectors), workers=workers)
+    # Leads stream in from connectors as they are scraped: deduped, stored and appended to the live JSONL
+    # A resume keeps the first attempt's file timestamp, so finish() replaces its partial leads_<ts> files
+    timestamp = journal.file_timestamp(resume) if resume else None
+    pipeline = LeadPipeline(run_ctx.run_id, config, journal=journal, timestamp=timestamp)
+    if journal is not None:
+        journal.start_run(run_ctx.run_id, pipeline.timestamp)
+    if resume:
+        replayed = pipeline.replay(journal.leads(resume))
+        log_message("journaled leads replayed", run_id=resume, leads=replayed, unique=len(pipeline.leads))
+
+    if workers > 1:
+        # Each worker process has its own browser pool; results are merged as they complete
+        for result in run_platforms_parallel(
+            platforms_to_run,
+            workers,
+            run_ctx,
+            kill_grace=config.get("worker_kill_grace", 30),
+            debug_save_candidates=debug_save_candidates,
+            on_lead=pipeline.add,
+        ):
             results.append(result)
-            all_leads.extend(result.leads)
+            _journal_result(journal, run_ctx, result)
+            log_message("platform merged", platform=result.platform, leads=result.leads_found)
+    else:
+        # One pool of long-lived browsers for the whole run; each connector gets a fresh context
+        with browser_pool(config):
+            for name, conn in connectors:
+                if run_ctx.expired():
+                    log_message("global_max_runtime reached; stopping")
+                    break
+                if not conn:
+                    continue
+                try:
+                    result = conn.run(run_ctx, on_lead=pipeline.add)
+                    results.append(result)
+                    _journal_result(journal, run_ctx, result)
+                except Exception as e:
+                    log_message("platform run failed", platform=name, error=str(e))
+                    results.append(
+                        PlatformResult(
+                            platform=name,
+                            success=False,
+                            leads=[],
+                            error=str(e),
+                            stopped_reason="exception",
+                        )
+                    )
+
+    merged, out_xlsx, out_jsonl = pipeline.finish()
+    if config.get("parquet_archive"):
+        # Partition by the run's first start, so a resumed run replaces its archive files instead of
+        # adding a second copy under a later run_date
+        started = journal.started_at(run_ctx.run_id) if journal is not None else None
+        run_date = datetime.fromtimestamp(started or global_start, tz=timezone.utc).strftime("%Y-%m-%d")
+        try:
+            files = export_parquet(merged, run_ctx.run_id, config, run_date=run_date)
+            log_message("Archived", files=len(files), count=len(merged))
         except Exception as e:
-            log_message("platform run failed", platform=name, error=str(e))
-            results.append(
-                PlatformResult(
-                    platform=name,
-                    success=False,
-                    leads=[],
-                    error=str(e),
-                    stopped_reason="exception",
-                )
-            )
-
-    merged = dedupe_leads(all_leads)
-    out_xlsx = ""
-    out_jsonl = ""
-    try:
-        out_xlsx = export_xlsx(merged)
-        out_jsonl = export_jsonl(merged)
-        log_message("Exported", xlsx=out_xlsx, jsonl=out_jsonl, count=len(merged))
-    except Exception as e:
-        log_message("Export failed", error=str(e))
+            log_message("Archive export failed", error=str(e))
+    if journal is not None:
+        # Last: a run killed before this point can still be resumed (finish_run prunes its journal)
+        journal.finish_run(run_ctx.run_id)
 
     finished = datetime.now(timezone.utc).isoformat()
     summary = RunSummary(
-        run_id=finished[:19].replace(":", "").replace("-", ""),
+        run_id=run_ctx.run_id,
         started_at=datetime.fromtimestamp(global_start, tz=timezone.utc).isoformat(),
         finished_at=finished,
-        total_leads=len(all_leads),
+        total_leads=pipeline.received,
         unique_leads_after_dedupe=len(merged),
         platforms_run=len(results),
         platforms_ok=sum(1 for r in results if r.success),
@@ -107,5 +173,7 @@ def main(debug_save_candidates: bool = False) -> RunSummary:
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--debug-save-candidates", action="store_true", help="Save first 50 rejected candidates to rejected_<ts>.jsonl")
+    parser.add_argument("--workers", type=int, default=None, help="Run platforms in N parallel worker processes (default: config workers)")
+    parser.add_argument("--resume", metavar="RUN_ID", default=None, help="Continue a killed run from its run journal")
     args = parser.parse_args()
-    main(debug_save_candidates=args.debug_save_candidates)
+    main(debug_save_candidates=args.debug_save_candidates, workers=args.workers, resume=args.resume)
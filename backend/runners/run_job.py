@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Job process for a scrape requested through the API (app.jobs.JobManager starts one per job).
+Runs runners.run_all.main with the job's params and records the outcome in the run history.
+SIGTERM (DELETE /runs/{id}) exits through run_all's cleanup - worker processes and browsers closed.
+Usage: python backend/runners/run_job.py JOB_ID
+"""
+
+import argparse
+import signal
+import sys
+from pathlib import Path
+
+_BACKEND = Path(__file__).resolve().parent.parent
+if str(_BACKEND) not in sys.path:
+    sys.path.insert(0, str(_BACKEND))
+
+from core.logging import log_message, setup_logging
+from storage.run_history import FAILED, SUCCEEDED, get_run_history
+
+
+def _terminate(signum, frame):
+    raise SystemExit(128 + signum)
+
+
+def run_job(job_id: str) -> int:
+    setup_logging()
+    history = get_run_history()
+    job = history.get(job_id)
+    if job is None:
+        log_message("unknown job", job_id=job_id)
+        return 2
+    signal.signal(signal.SIGTERM, _terminate)
+    params = job["params"]
+    log_message("job started", job_id=job_id, run_id=job["run_id"], params=params)
+    try:
+        from runners.run_all import main
+
+        summary = main(
+            debug_save_candidates=bool(params.get("debug_save_candidates")),
+            workers=params.get("workers"),
+            resume=params.get("resume"),
+            run_id=job["run_id"],
+        )
+    except Exception as e:
+        log_message("job failed", job_id=job_id, error=str(e))
+        history.finish(job_id, FAILED, error=str(e))
+        return 1
+    history.finish(job_id, SUCCEEDED, summary=summary.model_dump_json())
+    log_message("job finished", job_id=job_id, unique_leads=summary.unique_leads_after_dedupe)
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("job_id")
+    args = parser.parse_args()
+    sys.exit(run_job(args.job_id))
@@ -14,7 +14,7 @@ if str(_BACKEND) not in sys.path:
 
 from core.config import get_config, get_platforms_to_run
 from core.dedupe import dedupe_leads
-from core.export import export_xlsx, export_jsonl
+from core.export import export_leads
 from core.logging import setup_logging
 from platforms.registry import get_connector
 
@@ -42,8 +42,7 @@ def main():
 
     if args.export and result.leads:
         merged = dedupe_leads(result.leads)
-        xlsx = export_xlsx(merged)
-        jsonl = export_jsonl(merged)
+        xlsx, jsonl = export_leads(merged)
         print(f"Exported: {xlsx}, {jsonl}")
 
 
@@ -11,9 +11,10 @@ _BACKEND = Path(__file__).resolve().parent.parent
 if str(_BACKEND) not in sys.path:
     sys.path.insert(0, str(_BACKEND))
 
-from core.config import get_config
+from core.browser import browser_pool
+from core.config import reload_config
 from core.dedupe import dedupe_leads
-from core.export import export_xlsx, export_jsonl
+from core.export import export_leads
 from core.logging import setup_logging, log_message
 from platforms.registry import get_connector
 
@@ -26,26 +27,26 @@ def main():
     os.environ["SCRAPER_MAX_RUNTIME_PER_PLATFORM"] = "30"
     os.environ["SCRAPER_NO_NEW_LEADS_LIMIT"] = "1"
 
-    config = get_config()
+    config = reload_config()
     platforms = ["reddit", "search_discovery"]
     all_leads = []
-    for name in platforms:
-        log_message("smoke_test running", platform=name)
-        conn = get_connector(name)
-        if not conn:
-            continue
-        try:
-            result = conn.run()
-            all_leads.extend(result.leads)
-            log_message("smoke_test done", platform=name, leads=len(result.leads))
-        except Exception as e:
-            log_message("smoke_test error", platform=name, error=str(e))
+    with browser_pool(config):
+        for name in platforms:
+            log_message("smoke_test running", platform=name)
+            conn = get_connector(name)
+            if not conn:
+                continue
+            try:
+                result = conn.run()
+                all_leads.extend(result.leads)
+                log_message("smoke_test done", platform=name, leads=len(result.leads))
+            except Exception as e:
+                log_message("smoke_test error", platform=name, error=str(e))
 
     merged = dedupe_leads(all_leads)
     print(f"Smoke test: {len(all_leads)} raw, {len(merged)} after dedupe")
     try:
-        xlsx = export_xlsx(merged)
-        jsonl = export_jsonl(merged)
+        xlsx, jsonl = export_leads(merged)
         print(f"Outputs: {xlsx}, {jsonl}")
     except Exception as e:
         print("Export failed:", e)
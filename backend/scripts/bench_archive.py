@@ -0,0 +1,98 @@
+"""
+Benchmark: querying months of lead history - re-parsing every run's JSONL file (the old way)
+vs a filtered scan of the Parquet archive (partition pruning + column projection + pushdown).
+Builds one run per day for --days days, --per-run leads each, spread over a few platforms.
+Usage: python backend/scripts/bench_archive.py [--days 90] [--per-run 10000]
+"""
+import argparse
+import json
+import random
+import sys
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+from time import perf_counter
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.export import export_parquet
+from core.models import LeadRecord
+from storage.archive import read_leads
+
+PLATFORMS = ["reddit", "hackernews", "craigslist", "github", "search_discovery"]
+
+
+def synthetic_run(day: int, n: int, rng: random.Random) -> list[LeadRecord]:
+    return [
+        LeadRecord(
+            client_name=f"user{day}_{i}", post_url=f"https://example.com/{day}/{i}", platform=rng.choice(PLATFORMS),
+            email=f"u{i}@example.com" if rng.random() < 0.3 else "", post_date="2025-03-01T10:00:00",
+            project_description="Need a React Native developer for a fitness app, budget 5k " * 2,
+            post_text_snippet="Looking for someone to build an iOS and Android app. " * 4,
+            confidence_score=rng.randrange(100), keywords_matched="react native, mobile app",
+        )
+        for i in range(n)
+    ]
+
+
+def jsonl_query(files: list[Path], platform: str, since: str, min_score: int) -> int:
+    """Old way: parse every run file, filter in Python."""
+    hits = 0
+    for path in files:
+        if path.stem < since:
+            continue
+        with open(path) as f:
+            for line in f:
+                row = json.loads(line)
+                if row["platform"] == platform and row["confidence_score"] >= min_score:
+                    hits += 1
+    return hits
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--per-run", type=int, default=10_000)
+    args = parser.parse_args()
+    rng = random.Random(1)
+    start = date(2025, 1, 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        cfg = {"output_dir": Path(tmp)}
+        jsonl_dir = Path(tmp) / "jsonl"
+        jsonl_dir.mkdir()
+        t_write = 0.0
+        files = []
+        for d in range(args.days):
+            day = (start + timedelta(days=d)).isoformat()
+            leads = synthetic_run(d, args.per_run, rng)
+            path = jsonl_dir / f"{day}.jsonl"
+            path.write_text("".join(lead.to_json() + "\n" for lead in leads))
+            files.append(path)
+            t = perf_counter()
+            export_parquet(leads, f"run{d}", cfg, run_date=day)
+            t_write += perf_counter() - t
+        size = lambda p: sum(f.stat().st_size for f in Path(p).rglob("*") if f.is_file())
+        print(f"{args.days * args.per_run} leads over {args.days} runs: "
+              f"jsonl {size(jsonl_dir) / 1e6:.0f} MB, parquet {size(Path(tmp) / 'archive') / 1e6:.0f} MB "
+              f"(archive writes {t_write:.1f} s total)")
+
+        since = (start + timedelta(days=args.days // 3)).isoformat()
+        for label, kwargs in (
+            ("full history, one platform, score>=80", {"since": start.isoformat()}),
+            ("last 2/3 of history, one platform, score>=80", {"since": since}),
+        ):
+            t = perf_counter()
+            old = jsonl_query(files, "reddit", kwargs["since"], 80)
+            t_old = perf_counter() - t
+            t = perf_counter()
+            new = read_leads(platform="reddit", min_score=80, columns=["client_name", "post_url", "confidence_score"],
+                             config=cfg, **kwargs).num_rows
+            t_new = perf_counter() - t
+            assert old == new, (old, new)
+            print(f"{label:45s} {new:7d} rows: jsonl {t_old:6.2f} s | parquet {t_new:6.3f} s ({t_old / t_new:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Microbenchmark: config overhead per scraped page, uncached YAML parse vs cached snapshot.
+A page costs ~3 config reads (_should_stop, visit_page, score_requirement).
+Usage: python backend/scripts/bench_config.py [--pages 2000]
+"""
+import argparse
+import sys
+from pathlib import Path
+from time import perf_counter
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core import config as config_mod
+from core.stop_conditions import StopState, check_platform_stop
+
+READS_PER_PAGE = 3
+
+
+def _uncached():
+    """What every get_config() call cost before the snapshot cache."""
+    return config_mod._build(config_mod._load_yaml(), config_mod._env_overlay(), 0)
+
+
+def _per_page_us(get, pages: int) -> float:
+    state = StopState()
+    t = perf_counter()
+    for _ in range(pages):
+        for _ in range(READS_PER_PAGE - 1):
+            get()
+        check_platform_stop(state, get(), "bench")
+    return (perf_counter() - t) / pages * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=2000)
+    args = parser.parse_args()
+    config_mod.get_config()  # warm
+    before = _per_page_us(_uncached, args.pages)
+    after = _per_page_us(config_mod.get_config, args.pages)
+    print(f"pages: {args.pages}, config reads per page: {READS_PER_PAGE}")
+    print(f"before (parse config.yaml per read): {before:10.1f} us/page")
+    print(f"after  (cached snapshot):             {after:10.1f} us/page")
+    print(f"speedup: {before / after:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
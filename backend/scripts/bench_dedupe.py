@@ -0,0 +1,96 @@
+"""
+Benchmark: dedupe_leads on synthetic leads, old quadratic fuzzy pass vs indexed DedupeEngine
+(first-wins and with field merging).
+Leads mix repeated emails, repeated (platform, url) and same name+url on other platforms.
+Usage: python backend/scripts/bench_dedupe.py [--leads 100000] [--old-limit 10000]
+"""
+import argparse
+import random
+import sys
+from pathlib import Path
+from time import perf_counter
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.dedupe import dedupe_leads
+from core.email_extract import normalize_email
+from core.models import LeadRecord
+
+PLATFORMS = ["reddit", "hackernews", "craigslist", "github", "search_discovery"]
+
+
+def _normalize_url(url: str) -> str:
+    u = (url or "").strip().lower()
+    return u[:-1] if u.endswith("/") else u
+
+
+def _quadratic(leads: list[LeadRecord]) -> list[LeadRecord]:
+    """dedupe_leads before the engine: scans every accepted lead for the name+url rule."""
+    seen_emails: set[str] = set()
+    seen_platform_url: set[tuple[str, str]] = set()
+    out: list[LeadRecord] = []
+    for lead in leads:
+        email_key = normalize_email(lead.email) if lead.email else ""
+        url_key = _normalize_url(lead.post_url)
+        platform = (lead.platform or "").strip().lower()
+        if email_key and email_key in seen_emails:
+            continue
+        if email_key:
+            seen_emails.add(email_key)
+        if platform and url_key:
+            if (platform, url_key) in seen_platform_url:
+                continue
+            seen_platform_url.add((platform, url_key))
+        if lead.client_name and url_key:
+            cn = lead.client_name.strip().lower()
+            if any(
+                (e.client_name or "").strip().lower() == cn and cn and _normalize_url(e.post_url) == url_key
+                for e in out
+            ):
+                continue
+        out.append(lead)
+    return out
+
+
+def synthetic_leads(n: int, seed: int = 1) -> list[LeadRecord]:
+    rng = random.Random(seed)
+    leads = []
+    for i in range(n):
+        j = rng.randrange(max(1, int(n * 0.8)))  # ~20% collide on url / name
+        leads.append(LeadRecord(
+            client_name=f"User{j}" if rng.random() < 0.9 else "",
+            post_url=f"https://example.com/post/{j}" + ("/" if rng.random() < 0.3 else ""),
+            email=f"user{rng.randrange(n)}@Example.com" if rng.random() < 0.3 else "",
+            platform=rng.choice(PLATFORMS),
+        ))
+    return leads
+
+
+def _time(fn, leads) -> tuple[float, int]:
+    t = perf_counter()
+    out = fn(leads)
+    return perf_counter() - t, len(out)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--leads", type=int, default=100_000)
+    parser.add_argument("--old-limit", type=int, default=10_000, help="largest n to run the quadratic version on")
+    args = parser.parse_args()
+    for n in sorted({min(args.old_limit, args.leads), args.leads}):
+        leads = synthetic_leads(n)
+        new_s, new_n = _time(lambda ls: dedupe_leads(ls, merge=False), leads)
+        merge_s, _ = _time(dedupe_leads, leads)
+        line = f"n={n:>7}: engine {new_s * 1000:8.1f} ms, with merge {merge_s * 1000:8.1f} ms ({new_n} kept)"
+        if n <= args.old_limit:
+            old_s, old_n = _time(_quadratic, leads)
+            kept = [l.post_url for l in _quadratic(leads)]
+            assert kept == [l.post_url for l in dedupe_leads(leads)] == [l.post_url for l in dedupe_leads(leads, merge=False)]
+            line += f" | quadratic {old_s * 1000:10.1f} ms ({old_n} kept) | {old_s / new_s:.0f}x"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
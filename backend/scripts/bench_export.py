@@ -0,0 +1,92 @@
+"""
+Benchmark: XLSX + JSONL export, old in-memory Workbook (ws.cell per value) vs streaming export_leads.
+Each case runs in a fresh process so peak RSS (ru_maxrss) is per case; the streaming case
+feeds a generator, so leads are never all in memory either.
+Usage: python backend/scripts/bench_export.py [--rows 10000 100000 500000] [--old-limit 100000]
+"""
+import argparse
+import json
+import multiprocessing as mp
+import resource
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.export import HEADERS, export_leads
+from core.models import LeadRecord
+
+
+def synthetic_leads(n: int):
+    for i in range(n):
+        yield LeadRecord(
+            client_name=f"user{i}", post_url=f"https://www.reddit.com/r/forhire/comments/x{i}/", platform="reddit",
+            email=f"user{i}@example.com" if i % 3 == 0 else "", post_date="2025-03-01T10:00:00",
+            project_description="Need a React Native developer for a fitness app, budget 5k " * 2,
+            post_text_snippet="Looking for someone to build an iOS and Android app with Apple Health sync. " * 4,
+            confidence_score=i % 100, keywords_matched="react native, mobile app, budget",
+        )
+
+
+def _old_export(leads: list[LeadRecord], out: Path) -> None:
+    """export_xlsx + export_jsonl before streaming: every cell set on an in-memory Workbook."""
+    import openpyxl
+    from openpyxl.styles import Font
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for col, h in enumerate(HEADERS, 1):
+        ws.cell(row=1, column=col, value=h)
+        ws.cell(row=1, column=col).font = Font(bold=True)
+    for row, lead in enumerate(leads, 2):
+        row_data = lead.to_row()
+        for col, h in enumerate(HEADERS, 1):
+            ws.cell(row=row, column=col, value=row_data.get(h, ""))
+    wb.save(out / "old.xlsx")
+    with open(out / "old.jsonl", "w") as f:
+        for lead in leads:
+            f.write(json.dumps(lead.to_dict()) + "\n")
+
+
+def _case(mode: str, n: int, q) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        t = perf_counter()
+        if mode == "old":
+            _old_export(list(synthetic_leads(n)), Path(tmp))
+        else:
+            export_leads(synthetic_leads(n), {"output_dir": tmp})
+        took = perf_counter() - t
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        q.put((took, (peak - base) / 1024))
+
+
+def _run(mode: str, n: int) -> tuple[float, float]:
+    ctx = mp.get_context("spawn")
+    q = ctx.Queue()
+    p = ctx.Process(target=_case, args=(mode, n, q))
+    p.start()
+    result = q.get()
+    p.join()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 500_000])
+    parser.add_argument("--old-limit", type=int, default=100_000, help="largest n to run the in-memory version on")
+    args = parser.parse_args()
+    for n in args.rows:
+        new_t, new_mb = _run("stream", n)
+        line = f"rows={n:>7}: streaming {new_t:7.1f} s, +{new_mb:7.0f} MB peak RSS"
+        if n <= args.old_limit:
+            old_t, old_mb = _run("old", n)
+            line += f" | in-memory {old_t:7.1f} s, +{old_mb:7.0f} MB peak RSS"
+        print(line, flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark: the Pydantic Lead vs the slotted LeadRecord dataclass - memory per lead (tracemalloc,
+strings shared so only the record itself counts), construction throughput, and JSONL serialization.
+Usage: python backend/scripts/bench_lead_record.py [--leads 200000]
+"""
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.models import EmailSource, Lead, LeadRecord, SourceType
+
+KWARGS = dict(
+    client_name="someone", email="someone@example.com", platform="reddit",
+    project_description="Need a React Native developer for a fitness app",
+    post_date="2025-03-01T10:00:00", post_text_snippet="Looking for someone to build an iOS app",
+    source_type=SourceType.FORUM, confidence_score=70, email_source=EmailSource.IN_POST,
+    keywords_matched="react native,mobile app",
+)
+URLS = None
+
+
+def build(cls, n: int) -> list:
+    return [cls(post_url=URLS[i], **KWARGS) for i in range(n)]
+
+
+def per_lead_bytes(cls, n: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    leads = build(cls, n)
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del leads
+    return size / n
+
+
+def per_second(fn, n: int) -> float:
+    t = perf_counter()
+    fn()
+    return n / (perf_counter() - t)
+
+
+def main():
+    global URLS
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--leads", type=int, default=200_000)
+    args = parser.parse_args()
+    n = args.leads
+    URLS = [f"https://www.reddit.com/r/forhire/comments/x{i}/" for i in range(n)]
+    print(f"{n} leads")
+    for label, cls, dump in (
+        ("Lead (pydantic)", Lead, lambda l: l.model_dump_json()),
+        ("LeadRecord (slots)", LeadRecord, lambda l: l.to_json()),
+    ):
+        mem = per_lead_bytes(cls, n)
+        build_rate = per_second(lambda: build(cls, n), n)
+        leads = build(cls, n)
+        dump_rate = per_second(lambda: [dump(l) for l in leads], n)
+        print(f"{label:20s} {mem:6.0f} B/lead | construct {build_rate / 1e3:7.0f}k/s | jsonl {dump_rate / 1e3:5.0f}k/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark: /api/leads/search latency (FTS5 + bm25 + snippet) over a large synthetic lead store.
+Usage: python backend/scripts/bench_lead_search.py [--leads 300000]
+"""
+import argparse
+import random
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.models import LeadRecord
+from storage.lead_store import LeadStore
+
+WORDS = (
+    "need looking hire developer designer freelance contract website app mobile react native django "
+    "shopify wordpress python backend frontend ecommerce store redesign api integration budget urgent "
+    "startup mvp saas dashboard landing page seo marketing logo data scraping automation fix bug"
+).split()
+QUERIES = ["react native", "shopify", "developer", "\"landing page\" seo", "django api budget", "xyzzy"]
+
+
+def _leads(n: int, rng: random.Random):
+    for i in range(n):
+        text = " ".join(rng.choices(WORDS, k=rng.randint(12, 40)))
+        yield LeadRecord(
+            post_url=f"https://example.com/p/{i}", platform=rng.choice(["reddit", "hackernews", "craigslist"]),
+            project_description=text[:200], post_text_snippet=text, client_name=f"user{i}",
+            keywords_matched=", ".join(rng.sample(WORDS, 3)), confidence_score=rng.randint(0, 100),
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--leads", type=int, default=300_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = LeadStore(Path(tmp) / "leads.sqlite3")
+        t = perf_counter()
+        batch = []
+        for lead in _leads(args.leads, rng):
+            batch.append(lead)
+            if len(batch) == 5000:
+                store.upsert(batch, "bench")
+                batch = []
+        store.upsert(batch, "bench")
+        print(f"indexed {len(store)} leads in {perf_counter() - t:.1f}s")
+        for q in QUERIES:
+            store.search(q)
+            t = perf_counter()
+            for _ in range(args.repeat):
+                hits = store.search(q, limit=20)
+            print(f"{q!r:24} {(perf_counter() - t) / args.repeat * 1000:7.1f} ms  ({len(hits)} hits)")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
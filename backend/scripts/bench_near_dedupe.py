@@ -0,0 +1,57 @@
+"""
+Benchmark: near_duplicate_clusters on synthetic project texts with planted cross-posts.
+Reports time per lead (should stay flat as n grows - no pairwise pass) and recall of planted pairs.
+Usage: python backend/scripts/bench_near_dedupe.py [--leads 100000]
+"""
+import argparse
+import random
+import sys
+from pathlib import Path
+from time import perf_counter
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.near_dedupe import near_duplicate_clusters
+
+VOCAB = [f"w{i}" for i in range(5000)]
+
+
+def synthetic_texts(n: int, dup_rate: float, seed: int = 3) -> tuple[list[str], list[tuple[int, int]]]:
+    """Random 30-60 word posts; dup_rate of them are light edits (prefix + dropped word) of an earlier one."""
+    rng = random.Random(seed)
+    texts: list[str] = []
+    planted = []
+    for i in range(n):
+        if texts and rng.random() < dup_rate:
+            j = rng.randrange(len(texts))
+            words = texts[j].split()
+            del words[rng.randrange(len(words))]
+            texts.append("hiring " + " ".join(words))
+            planted.append((j, i))
+        else:
+            texts.append(" ".join(rng.choices(VOCAB, k=rng.randint(30, 60))))
+    return texts, planted
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--leads", type=int, default=100_000)
+    parser.add_argument("--dup-rate", type=float, default=0.1)
+    args = parser.parse_args()
+    for n in sorted({args.leads // 10, args.leads}):
+        texts, planted = synthetic_texts(n, args.dup_rate)
+        t = perf_counter()
+        groups = near_duplicate_clusters(texts)
+        took = perf_counter() - t
+        cluster = {i: g[0] for g in groups for i in g}
+        found = sum(cluster[a] == cluster[b] for a, b in planted)
+        print(
+            f"n={n:>8}: {took:6.2f} s ({took / n * 1e6:5.0f} us/lead), {len(groups)} clusters,"
+            f" planted pairs found {found}/{len(planted)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Re-score past JSONL outputs with the current keywords/scoring, in batches via score_many.
+Scores project_description + post_text_snippet: the full post text the original score came from is
+not stored, so rescored values are an estimate and not comparable with confidence_score.
+--write leaves the input alone and writes <name>.rescored.jsonl next to it: each original line,
+unchanged, plus rescored_confidence_score / rescored_keywords_matched. *.rescored.jsonl inputs are skipped.
+Usage: python backend/scripts/rescore_jsonl.py outputs/leads_*.jsonl [--write]
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from time import perf_counter
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.scoring import score_many
+
+
+RESCORED_SUFFIX = ".rescored.jsonl"
+
+
+def rescored_path(path: Path) -> Path:
+    return path.with_name(f"{path.stem}{RESCORED_SUFFIX}")
+
+
+def rescore(path: Path, write: bool) -> tuple[int, int, int]:
+    """Returns (rows, rows whose score changed, rows that would no longer be saved)."""
+    lines = [line for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+    rows = [json.loads(line) for line in lines]
+    texts = [f"{r.get('project_description') or ''}\n{r.get('post_text_snippet') or ''}" for r in rows]
+    results = score_many(texts, [bool(r.get("email")) or "@" in t for r, t in zip(rows, texts)])
+    changed = dropped = 0
+    out = []
+    for line, row, res in zip(lines, rows, results):
+        if res.score != row.get("confidence_score"):
+            changed += 1
+        if not res.save:
+            dropped += 1
+        extra = json.dumps(
+            {"rescored_confidence_score": res.score, "rescored_keywords_matched": ",".join(res.matched[:10])},
+            ensure_ascii=False, separators=(",", ":"),
+        )
+        sep = "," if row else ""
+        out.append(f"{line.rstrip()[:-1]}{sep}{extra[1:]}\n")  # original fields byte-for-byte, new ones appended
+    if write:
+        rescored_path(path).write_text("".join(out), encoding="utf-8")
+    return len(rows), changed, dropped
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("files", nargs="+", type=Path)
+    ap.add_argument("--write", action="store_true", help="write <name>.rescored.jsonl (input untouched)")
+    args = ap.parse_args()
+    t = perf_counter()
+    total = 0
+    for path in args.files:
+        if path.name.endswith(RESCORED_SUFFIX):
+            print(f"{path}: skipped (already a rescore output)")
+            continue
+        n, changed, dropped = rescore(path, args.write)
+        total += n
+        print(f"{path}: {n} rows, {changed} score changes, {dropped} below save threshold")
+        if args.write:
+            print(f"  -> {rescored_path(path)}")
+    print(f"{total} rows in {perf_counter() - t:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Reader for the Parquet lead archive written by core.export.export_parquet.
+Files sit under <archive_dir>/run_date=YYYY-MM-DD/platform=<name>/, so platform and date
+filters prune whole directories before any file is opened; min_score and the other column
+filters are pushed down to Parquet row-group statistics. Only the requested columns are read.
+"""
+
+from datetime import date
+from pathlib import Path
+
+from core.config import get_config
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+except ImportError:
+    pa = None
+    ds = None
+
+
+def _archive_root(config: dict | None = None) -> Path:
+    cfg = config or get_config()
+    return Path(cfg.get("archive_dir") or Path(cfg["output_dir"]) / "archive")
+
+
+def archive_dataset(config: dict | None = None) -> "ds.Dataset":
+    """The whole archive as one dataset; run_date and platform come from the partition path."""
+    if ds is None:
+        raise RuntimeError("pip install pyarrow")
+    partitioning = ds.partitioning(
+        pa.schema([("run_date", pa.string()), ("platform", pa.string())]), flavor="hive"
+    )
+    return ds.dataset(_archive_root(config), format="parquet", partitioning=partitioning)
+
+
+def _day(value: date | str) -> str:
+    return value.isoformat() if isinstance(value, date) else str(value)
+
+
+def lead_filter(
+    platform: str | list[str] | None = None,
+    since: date | str | None = None,
+    until: date | str | None = None,
+    min_score: int | None = None,
+    email_only: bool = False,
+):
+    """Filter expression for archive scans (None when unfiltered). since/until are inclusive run dates."""
+    if ds is None:
+        raise RuntimeError("pip install pyarrow")
+    parts = []
+    if platform:
+        names = [platform] if isinstance(platform, str) else list(platform)
+        parts.append(ds.field("platform").isin([p.strip().lower() for p in names]))
+    if since is not None:
+        parts.append(ds.field("run_date") >= _day(since))
+    if until is not None:
+        parts.append(ds.field("run_date") <= _day(until))
+    if min_score is not None:
+        parts.append(ds.field("confidence_score") >= min_score)
+    if email_only:
+        parts.append(ds.field("email") != "")
+    expr = None
+    for p in parts:
+        expr = p if expr is None else expr & p
+    return expr
+
+
+def read_leads(
+    platform: str | list[str] | None = None,
+    since: date | str | None = None,
+    until: date | str | None = None,
+    min_score: int | None = None,
+    email_only: bool = False,
+    columns: list[str] | None = None,
+    config: dict | None = None,
+) -> "pa.Table":
+    """Archived leads matching the filters as an Arrow table (.to_pylist() / .to_pandas() for rows)."""
+    if not _archive_root(config).exists():
+        raise FileNotFoundError(f"No lead archive at {_archive_root(config)}")
+    dataset = archive_dataset(config)
+    return dataset.to_table(
+        columns=columns,
+        filter=lead_filter(platform, since, until, min_score, email_only),
+    )
+
+
+def count_by_platform(since: date | str | None = None, until: date | str | None = None,
+                      config: dict | None = None) -> dict[str, int]:
+    """Lead counts per platform over a run-date range, reading only the platform column."""
+    table = read_leads(since=since, until=until, columns=["platform"], config=config)
+    counts = table.group_by("platform").aggregate([("platform", "count")])
+    return dict(zip(counts["platform"].to_pylist(), counts["platform_count"].to_pylist()))
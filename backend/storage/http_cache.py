@@ -0,0 +1,204 @@
+"""
+On-disk response cache (SQLite, zlib bodies) shared by the HTTP tier and visit_page.
+Keyed by canonical URL; per-platform TTL; stale entries with an ETag/Last-Modified are
+revalidated with a conditional request; size-bounded by least-recently-used eviction.
+Entries marked immutable (old posts that will not change) never expire.
+"""
+
+import sqlite3
+import threading
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from time import time
+from core.config import get_config
+from core.url_canon import clean_url
+
+_BACKEND_ROOT = Path(__file__).resolve().parent.parent
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    platform TEXT NOT NULL DEFAULT '',
+    status INTEGER NOT NULL,
+    content_type TEXT NOT NULL DEFAULT '',
+    etag TEXT,
+    last_modified TEXT,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    immutable INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS responses_lru ON responses (accessed_at);
+-- Running total of body sizes, kept by triggers so put() checks the bound in O(1) (from every process)
+CREATE TABLE IF NOT EXISTS stats (id INTEGER PRIMARY KEY CHECK (id = 0), total INTEGER NOT NULL);
+INSERT OR IGNORE INTO stats (id, total) SELECT 0, COALESCE(SUM(size), 0) FROM responses;
+CREATE TRIGGER IF NOT EXISTS responses_size_ins AFTER INSERT ON responses
+    BEGIN UPDATE stats SET total = total + new.size WHERE id = 0; END;
+CREATE TRIGGER IF NOT EXISTS responses_size_upd AFTER UPDATE OF size ON responses
+    BEGIN UPDATE stats SET total = total - old.size + new.size WHERE id = 0; END;
+CREATE TRIGGER IF NOT EXISTS responses_size_del AFTER DELETE ON responses
+    BEGIN UPDATE stats SET total = total - old.size WHERE id = 0; END;
+"""
+
+
+def cache_key(url: str) -> str:
+    """Per-resource key (core.url_canon.clean_url): not collapsed to the post id, since e.g.
+    old.reddit HTML and the .json of the same post are different responses."""
+    return clean_url(url)
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    status: int
+    content_type: str
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    stored_at: float
+    immutable: bool
+
+    def is_fresh(self, ttl: float) -> bool:
+        return self.immutable or time() - self.stored_at < ttl
+
+    def validators(self) -> dict[str, str]:
+        """Conditional-request headers, empty if the server gave no validator."""
+        h = {}
+        if self.etag:
+            h["If-None-Match"] = self.etag
+        if self.last_modified:
+            h["If-Modified-Since"] = self.last_modified
+        return h
+
+
+class HttpCache:
+    """Thread-safe; each process opens its own connection (WAL lets worker processes share the file)."""
+
+    def __init__(self, path: Path | str, max_bytes: int = 256 * 1024 * 1024, ttl: dict | None = None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttl = dict(ttl or {})
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def ttl_for(self, platform: str) -> float:
+        return float(self.ttl.get(platform, self.ttl.get("default", 0)) or 0)
+
+    def get(self, url: str) -> CachedResponse | None:
+        """Stored response (fresh or stale) and bump its LRU position."""
+        key = cache_key(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, content_type, body, etag, last_modified, stored_at, immutable"
+                " FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time(), key))
+            self._conn.commit()
+        status, ctype, body, etag, lm, stored_at, immutable = row
+        try:
+            body = zlib.decompress(body)
+        except zlib.error:
+            return None
+        return CachedResponse(url, status, ctype, body, etag, lm, stored_at, bool(immutable))
+
+    def get_fresh(self, url: str, platform: str) -> CachedResponse | None:
+        entry = self.get(url)
+        return entry if entry is not None and entry.is_fresh(self.ttl_for(platform)) else None
+
+    def put(
+        self,
+        url: str,
+        platform: str,
+        status: int,
+        content_type: str,
+        body: bytes,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a 200 response; no-op when the platform's TTL is 0 (caching off for it)."""
+        if status != 200 or self.ttl_for(platform) <= 0:
+            return
+        blob = zlib.compress(body, 6)
+        now = time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO responses (key, platform, status, content_type, etag, last_modified, body, size,"
+                " stored_at, accessed_at, immutable) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)"
+                " ON CONFLICT(key) DO UPDATE SET status=excluded.status, content_type=excluded.content_type,"
+                " etag=excluded.etag, last_modified=excluded.last_modified, body=excluded.body,"
+                " size=excluded.size, stored_at=excluded.stored_at, accessed_at=excluded.accessed_at",
+                (cache_key(url), platform, status, content_type, etag, last_modified, blob, len(blob), now, now),
+            )
+            self._conn.commit()
+            self._evict()
+
+    def touch(self, url: str) -> None:
+        """Revalidated (304): restart the TTL."""
+        now = time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?", (now, now, cache_key(url))
+            )
+            self._conn.commit()
+
+    def mark_immutable(self, url: str) -> None:
+        """Serve this URL from cache from now on (e.g. a post older than the lookback window)."""
+        with self._lock:
+            self._conn.execute("UPDATE responses SET immutable = 1 WHERE key = ?", (cache_key(url),))
+            self._conn.commit()
+
+    def _total(self) -> int:
+        return self._conn.execute("SELECT total FROM stats WHERE id = 0").fetchone()[0]
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._total()
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries until under 90% of max_bytes (lock held)."""
+        total = self._total()
+        if total <= self.max_bytes:
+            return
+        target = int(self.max_bytes * 0.9)
+        drop = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            if total <= target:
+                break
+            drop.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", drop)
+        self._conn.commit()
+
+
+_cache: HttpCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache(config: dict | None = None) -> HttpCache | None:
+    """Process-wide cache from scraper.http_cache, or None when disabled."""
+    global _cache
+    cfg = config or get_config()
+    opts = cfg.get("http_cache") or {}
+    if not opts.get("enabled"):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = HttpCache(
+                _BACKEND_ROOT / (opts.get("path") or "storage/cache/http_cache.sqlite3"),
+                max_bytes=int(opts.get("max_mb", 256)) * 1024 * 1024,
+                ttl=opts.get("ttl_seconds") or {},
+            )
+        return _cache
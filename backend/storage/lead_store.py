@@ -0,0 +1,372 @@
+"""
+SQLite lead store - every run upserts its deduped leads here; GET /api/leads queries it.
+One row per post (core.url_canon.canonical_key); indexed on platform, post_date, confidence_score and email.
+Pagination is keyset-based: the cursor encodes the last row's (sort value, id).
+An FTS5 index over the text columns (trigger-maintained) backs GET /api/leads/search.
+With near_threshold set, a new lead whose text near-duplicates a stored one (MinHash LSH bands
+in lead_bands, confirmed by shingle Jaccard) is folded into that row's source_urls instead.
+"""
+
+import base64
+import json
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import time
+from typing import Any, Iterable
+
+from core.config import get_config
+from core.email_extract import normalize_email
+from core.models import Lead, LeadRecord, as_record
+from core.near_dedupe import band_keys, jaccard, lead_text, minhash, near_dedupe_threshold, shingles
+from core.url_canon import canonical_key
+
+_BACKEND_ROOT = Path(__file__).resolve().parent.parent
+
+LEAD_COLUMNS = [
+    "client_name", "post_url", "email", "project_description", "platform", "post_date",
+    "post_text_snippet", "company", "source_type", "confidence_score", "email_source",
+    "keywords_matched", "location", "source_urls",
+]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS leads (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url_key TEXT NOT NULL UNIQUE,
+    client_name TEXT NOT NULL DEFAULT '',
+    post_url TEXT NOT NULL DEFAULT '',
+    email TEXT NOT NULL DEFAULT '',
+    email_norm TEXT NOT NULL DEFAULT '',
+    project_description TEXT NOT NULL DEFAULT '',
+    platform TEXT NOT NULL DEFAULT '',
+    post_date TEXT NOT NULL DEFAULT '',
+    post_text_snippet TEXT NOT NULL DEFAULT '',
+    company TEXT NOT NULL DEFAULT '',
+    source_type TEXT NOT NULL DEFAULT '',
+    confidence_score INTEGER NOT NULL DEFAULT 0,
+    email_source TEXT NOT NULL DEFAULT '',
+    keywords_matched TEXT NOT NULL DEFAULT '',
+    location TEXT NOT NULL DEFAULT '',
+    source_urls TEXT NOT NULL DEFAULT '',
+    run_id TEXT NOT NULL DEFAULT '',
+    first_seen_at REAL NOT NULL,
+    last_seen_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS leads_platform ON leads (platform, id);
+CREATE INDEX IF NOT EXISTS leads_post_date ON leads (post_date, id);
+CREATE INDEX IF NOT EXISTS leads_score ON leads (confidence_score, id);
+CREATE INDEX IF NOT EXISTS leads_email ON leads (email_norm);
+CREATE INDEX IF NOT EXISTS leads_last_seen ON leads (last_seen_at, id);
+CREATE TABLE IF NOT EXISTS lead_bands (
+    band INTEGER NOT NULL,
+    lead_id INTEGER NOT NULL,
+    PRIMARY KEY (band, lead_id)
+) WITHOUT ROWID;
+"""
+
+# Full-text index over the text columns; external content (no second copy of the text),
+# kept in sync by triggers so every upsert updates it incrementally
+FTS_COLUMNS = ["project_description", "post_text_snippet", "keywords_matched", "client_name"]
+# bm25 column weights, same order as FTS_COLUMNS
+FTS_WEIGHTS = (1.0, 0.6, 2.0, 1.5)
+
+_FTS_SCHEMA = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS leads_fts USING fts5(
+    {", ".join(FTS_COLUMNS)}, content='leads', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS leads_fts_ai AFTER INSERT ON leads BEGIN
+    INSERT INTO leads_fts (rowid, {", ".join(FTS_COLUMNS)}) VALUES (new.id, {", ".join("new." + c for c in FTS_COLUMNS)});
+END;
+CREATE TRIGGER IF NOT EXISTS leads_fts_ad AFTER DELETE ON leads BEGIN
+    INSERT INTO leads_fts (leads_fts, rowid, {", ".join(FTS_COLUMNS)})
+    VALUES ('delete', old.id, {", ".join("old." + c for c in FTS_COLUMNS)});
+END;
+CREATE TRIGGER IF NOT EXISTS leads_fts_au AFTER UPDATE ON leads BEGIN
+    INSERT INTO leads_fts (leads_fts, rowid, {", ".join(FTS_COLUMNS)})
+    VALUES ('delete', old.id, {", ".join("old." + c for c in FTS_COLUMNS)});
+    INSERT INTO leads_fts (rowid, {", ".join(FTS_COLUMNS)}) VALUES (new.id, {", ".join("new." + c for c in FTS_COLUMNS)});
+END;
+"""
+
+_TOKEN_RE = re.compile(r'"([^"]+)"|(\S+)')
+
+
+def fts_query(text: str) -> str:
+    """User search text -> FTS5 query: every word / "quoted phrase" must match; no operator injection."""
+    terms = []
+    for phrase, word in _TOKEN_RE.findall(text or ""):
+        t = (phrase or word).replace('"', " ").strip()
+        if t:
+            terms.append(f'"{t}"')
+    return " ".join(terms)
+
+
+SORTS = {"id", "post_date", "confidence_score", "last_seen_at"}
+
+
+@dataclass
+class LeadQuery:
+    platform: str | None = None
+    min_score: int | None = None
+    has_email: bool | None = None
+    email: str | None = None
+    since: str | None = None  # post_date >= (ISO prefix compare)
+    until: str | None = None
+    run_id: str | None = None
+    sort: str = "confidence_score"
+    order: str = "desc"
+    limit: int = 50
+    cursor: str | None = None
+
+
+@dataclass
+class LeadPage:
+    leads: list[dict] = field(default_factory=list)
+    next_cursor: str | None = None
+    total: int = 0
+
+
+def _encode_cursor(value: Any, row_id: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps([value, row_id]).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[Any, int]:
+    try:
+        value, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return value, int(row_id)
+    except Exception:
+        raise ValueError("invalid cursor") from None
+
+
+def _row(lead: LeadRecord, run_id: str, now: float) -> tuple:
+    r = lead.to_row()
+    return (
+        canonical_key(lead.post_url),
+        *(r[c] for c in LEAD_COLUMNS[:4]),
+        normalize_email(lead.email) if lead.email else "",
+        *(r[c] for c in LEAD_COLUMNS[4:]),
+        run_id,
+        now,
+        now,
+    )
+
+
+class LeadStore:
+    def __init__(self, path: Path | str, near_threshold: float | None = None):
+        self.path = Path(path)
+        self.near_threshold = near_threshold
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=10)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA + _FTS_SCHEMA)
+        if near_threshold and self._conn.execute("SELECT 1 FROM lead_bands LIMIT 1").fetchone() is None:
+            self._index_bands(self._conn.execute(
+                "SELECT id, project_description, post_text_snippet FROM leads"
+            ).fetchall())
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _index_bands(self, rows: Iterable[tuple[int, str, str]]) -> None:
+        """LSH band keys for (id, project_description, post_text_snippet) rows (lock held)."""
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO lead_bands (band, lead_id) VALUES (?, ?)",
+            (
+                (key, row_id)
+                for row_id, desc, snippet in rows
+                for key in band_keys(minhash(shingles(f"{desc} {snippet}")))
+            ),
+        )
+
+    def _fold_near_duplicates(self, leads: list[LeadRecord], run_id: str, now: float) -> list[LeadRecord]:
+        """Merge new leads that near-duplicate a stored lead into its source_urls; return the rest (lock held)."""
+        rest = []
+        for lead in leads:
+            if self._conn.execute("SELECT 1 FROM leads WHERE url_key = ?", (canonical_key(lead.post_url),)).fetchone():
+                rest.append(lead)  # known URL: plain refresh
+                continue
+            sh = shingles(lead_text(lead))
+            keys = band_keys(minhash(sh))
+            match = None
+            if keys:
+                candidates = self._conn.execute(
+                    "SELECT DISTINCT l.id, l.project_description, l.post_text_snippet, l.post_url, l.source_urls"
+                    f" FROM lead_bands b JOIN leads l ON l.id = b.lead_id WHERE b.band IN ({', '.join('?' * len(keys))})"
+                    " LIMIT 50",
+                    keys,
+                ).fetchall()
+                match = next(
+                    (c for c in candidates
+                     if jaccard(sh, shingles(f"{c['project_description']} {c['post_text_snippet']}")) >= self.near_threshold),
+                    None,
+                )
+            if match is None:
+                rest.append(lead)
+                continue
+            urls = [u for u in match["source_urls"].split("\n") if u]
+            for u in (lead.post_url, *lead.source_urls):
+                if u and u != match["post_url"] and u not in urls:
+                    urls.append(u)
+            self._conn.execute(
+                "UPDATE leads SET source_urls = ?, last_seen_at = ?, run_id = ? WHERE id = ?",
+                ("\n".join(urls), now, run_id, match["id"]),
+            )
+        return rest
+
+    def upsert(self, leads: Iterable[LeadRecord | Lead], run_id: str = "") -> int:
+        """Insert new leads, refresh known ones (keeps first_seen_at), fold near-duplicates. Returns leads written."""
+        now = time()
+        leads = [as_record(l) for l in leads if l.post_url]
+        with self._lock:
+            rest = self._fold_near_duplicates(leads, run_id, now) if self.near_threshold else leads
+            self._upsert_rows(rest, run_id, now)
+            self._conn.commit()
+        return len(leads)
+
+    def _upsert_rows(self, leads: list[LeadRecord], run_id: str, now: float) -> None:
+        rows = [_row(l, run_id, now) for l in leads]
+        cols = ["url_key", *LEAD_COLUMNS[:4], "email_norm", *LEAD_COLUMNS[4:], "run_id", "first_seen_at", "last_seen_at"]
+        updates = ", ".join(f"{c}=excluded.{c}" for c in cols if c not in ("url_key", "first_seen_at", "source_urls"))
+        # A refresh without cross-posts must not drop the ones folded in earlier
+        updates += ", source_urls=CASE WHEN excluded.source_urls = '' THEN source_urls ELSE excluded.source_urls END"
+        sql = (
+            f"INSERT INTO leads ({', '.join(cols)}) VALUES ({', '.join('?' * len(cols))})"
+            f" ON CONFLICT(url_key) DO UPDATE SET {updates}"
+        )
+        self._conn.executemany(sql, rows)
+        if self.near_threshold:
+            keys = [r[0] for r in rows]
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                self._index_bands(self._conn.execute(
+                    "SELECT id, project_description, post_text_snippet FROM leads"
+                    f" WHERE url_key IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall())
+
+    def query(self, q: LeadQuery) -> LeadPage:
+        if q.sort not in SORTS:
+            raise ValueError(f"sort must be one of {sorted(SORTS)}")
+        desc = q.order.lower() != "asc"
+        where: list[str] = []
+        args: list[Any] = []
+        if q.platform:
+            where.append("platform = ?")
+            args.append(q.platform.strip().lower())
+        if q.min_score is not None:
+            where.append("confidence_score >= ?")
+            args.append(q.min_score)
+        if q.has_email is not None:
+            where.append("email_norm != ''" if q.has_email else "email_norm = ''")
+        if q.email:
+            where.append("email_norm = ?")
+            args.append(q.email.strip().lower())
+        if q.since:
+            where.append("post_date >= ?")
+            args.append(q.since)
+        if q.until:
+            where.append("post_date != '' AND post_date <= ?")
+            args.append(q.until)
+        if q.run_id:
+            where.append("run_id = ?")
+            args.append(q.run_id)
+        filters = " AND ".join(where) or "1"
+
+        page_where, page_args = filters, list(args)
+        if q.cursor:
+            value, row_id = _decode_cursor(q.cursor)
+            op = "<" if desc else ">"
+            if q.sort == "id":
+                page_where += f" AND id {op} ?"
+                page_args.append(row_id)
+            else:
+                page_where += f" AND ({q.sort} {op} ? OR ({q.sort} = ? AND id {op} ?))"
+                page_args += [value, value, row_id]
+        direction = "DESC" if desc else "ASC"
+        limit = max(1, min(q.limit, 500))
+        with self._lock:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM leads WHERE {filters}", args).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT * FROM leads WHERE {page_where} ORDER BY {q.sort} {direction}, id {direction} LIMIT ?",
+                [*page_args, limit + 1],
+            ).fetchall()
+        more = len(rows) > limit
+        rows = rows[:limit]
+        out = [{k: r[k] for k in ("id", *LEAD_COLUMNS, "run_id", "first_seen_at", "last_seen_at")} for r in rows]
+        next_cursor = _encode_cursor(rows[-1][q.sort], rows[-1]["id"]) if more and rows else None
+        return LeadPage(leads=out, next_cursor=next_cursor, total=total)
+
+    def search(
+        self,
+        text: str,
+        limit: int = 20,
+        platform: str | None = None,
+        min_score: int | None = None,
+    ) -> list[dict]:
+        """bm25-ranked full-text matches (best first, over every match) with a highlighted snippet per lead."""
+        match = fts_query(text)
+        if not match:
+            return []
+        where = ["leads_fts MATCH ?"]
+        args: list[Any] = [match]
+        if platform:
+            where.append("l.platform = ?")
+            args.append(platform.strip().lower())
+        if min_score is not None:
+            where.append("l.confidence_score >= ?")
+            args.append(min_score)
+        # Join leads only when filtering on its columns; the bare FTS scan is much cheaper
+        source = "leads_fts JOIN leads l ON l.id = leads_fts.rowid" if len(where) > 1 else "leads_fts"
+        weights = ", ".join(str(w) for w in FTS_WEIGHTS)
+        rank_sql = (
+            f"SELECT leads_fts.rowid AS id, bm25(leads_fts, {weights}) AS rank"
+            f" FROM {source} WHERE {' AND '.join(where)} ORDER BY rank LIMIT ?"
+        )
+        with self._lock:
+            ranked = self._conn.execute(rank_sql, [*args, max(1, min(limit, 200))]).fetchall()
+            if not ranked:
+                return []
+            ids = [r["id"] for r in ranked]
+            marks = ", ".join("?" * len(ids))
+            # Snippets for the page only, not for every candidate
+            snippets = dict(self._conn.execute(
+                "SELECT rowid, snippet(leads_fts, -1, '[', ']', '…', 16) FROM leads_fts"
+                f" WHERE leads_fts MATCH ? AND rowid IN ({marks})",
+                [match, *ids],
+            ).fetchall())
+            rows = {r["id"]: r for r in self._conn.execute(f"SELECT * FROM leads WHERE id IN ({marks})", ids)}
+        return [
+            {**{k: rows[i][k] for k in ("id", *LEAD_COLUMNS, "run_id")}, "snippet": snippets.get(i, ""), "rank": rank}
+            for i, rank in ((r["id"], r["rank"]) for r in ranked)
+        ]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM leads").fetchone()[0]
+
+
+_store: LeadStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_lead_store(config: dict | None = None) -> LeadStore | None:
+    """Process-wide store from scraper.lead_store, or None when disabled."""
+    global _store
+    cfg = config or get_config()
+    opts = cfg.get("lead_store") or {}
+    if not opts.get("enabled"):
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = LeadStore(
+                _BACKEND_ROOT / (opts.get("path") or "storage/data/leads.sqlite3"),
+                near_threshold=near_dedupe_threshold(cfg),
+            )
+        return _store
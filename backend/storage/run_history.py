@@ -0,0 +1,163 @@
+"""
+Scrape jobs started through the API and their outcome, in SQLite so history survives API restarts
+and is shared by every API worker process. One row per job: params, status, the job process pid,
+run_id and, when finished, the RunSummary JSON. One full scrape at a time: while a job is
+queued/running create() returns it instead of adding another (checked and inserted in one write
+transaction); the API coalesces identical requests onto it and rejects different ones.
+"""
+
+import json
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from time import time
+from typing import Any
+
+_BACKEND_ROOT = Path(__file__).resolve().parent.parent
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+INTERRUPTED = "interrupted"  # job process gone without reporting (killed, host restart)
+ACTIVE = (QUEUED, RUNNING)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    key TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    pid INTEGER,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    error TEXT NOT NULL DEFAULT '',
+    summary TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status);
+CREATE INDEX IF NOT EXISTS jobs_created ON jobs (created_at);
+"""
+
+_COLUMNS = ["job_id", "key", "params", "status", "run_id", "pid", "created_at", "started_at", "finished_at", "error", "summary"]
+
+
+def params_key(params: dict[str, Any]) -> str:
+    """Identity of a request: same params (None-valued ones dropped) -> same key."""
+    return json.dumps({k: v for k, v in params.items() if v is not None}, sort_keys=True)
+
+
+def _job(row: tuple) -> dict[str, Any]:
+    job = dict(zip(_COLUMNS, row))
+    job["params"] = json.loads(job["params"])
+    job["summary"] = json.loads(job["summary"]) if job["summary"] else None
+    del job["key"]
+    return job
+
+
+class RunHistory:
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def create(self, params: dict[str, Any]) -> tuple[dict[str, Any], bool]:
+        """(job, created): the active job (whatever its params), or a new queued one."""
+        key = params_key(params)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    f"SELECT {', '.join(_COLUMNS)} FROM jobs WHERE status IN (?, ?) ORDER BY created_at LIMIT 1",
+                    ACTIVE,
+                ).fetchone()
+                if row is None:
+                    now = time()
+                    job_id = uuid.uuid4().hex[:12]
+                    stamp = datetime.fromtimestamp(now, tz=timezone.utc).strftime("%Y%m%dT%H%M%S")
+                    self._conn.execute(
+                        "INSERT INTO jobs (job_id, key, params, status, run_id, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                        (job_id, key, json.dumps(params), QUEUED, params.get("resume") or f"{stamp}-{job_id[:6]}", now),
+                    )
+                    row = self._conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+                    created = True
+                else:
+                    created = False
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return _job(row), created
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return _job(row) if row else None
+
+    def recent(self, limit: int = 20) -> list[dict[str, Any]]:
+        """Newest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [_job(r) for r in rows]
+
+    def active(self) -> list[dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM jobs WHERE status IN (?, ?)", ACTIVE
+            ).fetchall()
+        return [_job(r) for r in rows]
+
+    def latest_summary(self) -> dict[str, Any] | None:
+        """RunSummary of the newest succeeded job."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT summary FROM jobs WHERE status = ? AND summary IS NOT NULL ORDER BY finished_at DESC LIMIT 1",
+                (SUCCEEDED,),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def mark_running(self, job_id: str, pid: int) -> bool:
+        """queued -> running; False if the job already moved on (e.g. cancelled before it started)."""
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE jobs SET status = ?, pid = ?, started_at = ? WHERE job_id = ? AND status = ?",
+                (RUNNING, pid, time(), job_id, QUEUED),
+            )
+        return cur.rowcount == 1
+
+    def finish(self, job_id: str, status: str, summary: str | None = None, error: str = "") -> bool:
+        """Record the outcome of an active job; a job already finished (or cancelled) is left alone."""
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, summary = ?, error = ?"
+                " WHERE job_id = ? AND status IN (?, ?)",
+                (status, time(), summary, error, job_id, *ACTIVE),
+            )
+        return cur.rowcount == 1
+
+
+_history: RunHistory | None = None
+_history_lock = threading.Lock()
+
+
+def get_run_history(path: Path | str | None = None) -> RunHistory:
+    """Process-wide run history (storage/data/run_history.sqlite3 unless a path is given first)."""
+    global _history
+    with _history_lock:
+        if _history is None:
+            _history = RunHistory(path or _BACKEND_ROOT / "storage/data/run_history.sqlite3")
+        return _history
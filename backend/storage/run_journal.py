@@ -0,0 +1,187 @@
+"""
+Run journal - what a run_all run has finished, so `run_all.py --resume <run_id>` can continue it after
+an OOM kill, deploy or timeout. Per run: output file timestamp, platforms completed (with their
+PlatformResult), detail URLs processed per platform, listing cursor per platform stage, and every lead
+handed to the pipeline (replayed through a fresh LeadPipeline on resume, so merges come out the same). finish_run() drops
+the leads, URLs and cursors of finished runs - only an unfinished run can be resumed - so the file
+stays the size of the runs in flight. Every write commits; SQLite in WAL mode, shared by parallel
+worker processes.
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from time import time
+from typing import Iterable, Iterator
+
+from core.config import get_config
+from core.models import Lead, LeadRecord, PlatformResult
+from core.url_canon import canonical_key
+
+_BACKEND_ROOT = Path(__file__).resolve().parent.parent
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    file_timestamp TEXT NOT NULL DEFAULT ''  -- leads_<ts>.jsonl/.xlsx of the run, kept by a resume
+);
+CREATE TABLE IF NOT EXISTS platforms (
+    run_id TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    result TEXT NOT NULL,  -- PlatformResult JSON, leads excluded
+    PRIMARY KEY (run_id, platform)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS cursors (
+    run_id TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    position INTEGER NOT NULL,  -- listing items finished
+    PRIMARY KEY (run_id, platform, stage)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS urls (
+    run_id TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (run_id, platform, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS leads (
+    run_id TEXT NOT NULL,
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS leads_run ON leads (run_id, seq);
+"""
+
+
+class RunJournal:
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _write(self, sql: str, params: tuple) -> None:
+        with self._lock:
+            self._conn.execute(sql, params)
+            self._conn.commit()
+
+    def start_run(self, run_id: str, file_timestamp: str = "") -> None:
+        self._write(
+            "INSERT OR IGNORE INTO runs (run_id, started_at, file_timestamp) VALUES (?, ?, ?)",
+            (run_id, time(), file_timestamp),
+        )
+
+    def finish_run(self, run_id: str) -> None:
+        """Mark run_id finished and prune what only a resume needs, for every finished run."""
+        with self._lock:
+            self._conn.execute("UPDATE runs SET finished_at = ? WHERE run_id = ?", (time(), run_id))
+            for table in ("leads", "urls", "cursors"):
+                self._conn.execute(
+                    f"DELETE FROM {table} WHERE run_id IN (SELECT run_id FROM runs WHERE finished_at IS NOT NULL)"
+                )
+            self._conn.commit()
+
+    def finished(self, run_id: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT finished_at FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return row is not None and row[0] is not None
+
+    def started_at(self, run_id: str) -> float | None:
+        """When the first attempt of run_id started (a resume keeps it)."""
+        with self._lock:
+            row = self._conn.execute("SELECT started_at FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return row[0] if row else None
+
+    def file_timestamp(self, run_id: str) -> str | None:
+        """Output file timestamp of the first attempt of run_id, so a resume writes the same files."""
+        with self._lock:
+            row = self._conn.execute("SELECT file_timestamp FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return (row[0] or None) if row else None
+
+    def has_run(self, run_id: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM runs WHERE run_id = ?", (run_id,)).fetchone() is not None
+
+    def platform_done(self, run_id: str, result: PlatformResult) -> None:
+        data = result.model_dump_json(exclude={"leads"})
+        self._write(
+            "INSERT OR REPLACE INTO platforms (run_id, platform, result) VALUES (?, ?, ?)",
+            (run_id, result.platform, data),
+        )
+
+    def completed(self, run_id: str) -> dict[str, PlatformResult]:
+        """Platforms this run finished, with their results (leads are in leads(), not here)."""
+        with self._lock:
+            rows = self._conn.execute("SELECT platform, result FROM platforms WHERE run_id = ?", (run_id,)).fetchall()
+        return {name: PlatformResult.model_validate_json(data) for name, data in rows}
+
+    def cursor(self, run_id: str, platform: str, stage: str) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT position FROM cursors WHERE run_id = ? AND platform = ? AND stage = ?",
+                (run_id, platform, stage),
+            ).fetchone()
+        return row[0] if row else 0
+
+    def set_cursor(self, run_id: str, platform: str, stage: str, position: int) -> None:
+        self._write(
+            "INSERT OR REPLACE INTO cursors (run_id, platform, stage, position) VALUES (?, ?, ?, ?)",
+            (run_id, platform, stage, position),
+        )
+
+    def record_url(self, run_id: str, platform: str, url: str) -> None:
+        self._write(
+            "INSERT OR IGNORE INTO urls (run_id, platform, key) VALUES (?, ?, ?)",
+            (run_id, platform, canonical_key(url)),
+        )
+
+    def filter_new(self, run_id: str, platform: str, urls: Iterable[str]) -> list[str]:
+        """urls this run has not processed yet for platform."""
+        urls = list(urls)
+        with self._lock:
+            done = {
+                key for (key,) in self._conn.execute(
+                    "SELECT key FROM urls WHERE run_id = ? AND platform = ?", (run_id, platform)
+                )
+            }
+        return [u for u in urls if canonical_key(u) not in done]
+
+    def record_lead(self, run_id: str, lead: LeadRecord) -> None:
+        self._write("INSERT INTO leads (run_id, data) VALUES (?, ?)", (run_id, lead.to_json()))
+
+    def lead_count(self, run_id: str) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM leads WHERE run_id = ?", (run_id,)).fetchone()[0]
+
+    def leads(self, run_id: str) -> Iterator[LeadRecord]:
+        """Leads journaled for run_id, in the order they were scraped."""
+        with self._lock:
+            rows = self._conn.execute("SELECT data FROM leads WHERE run_id = ? ORDER BY seq", (run_id,)).fetchall()
+        for (data,) in rows:
+            yield LeadRecord.from_lead(Lead.model_validate_json(data))
+
+
+_journal: RunJournal | None = None
+_journal_lock = threading.Lock()
+
+
+def get_run_journal(config: dict | None = None) -> RunJournal | None:
+    """Process-wide journal from scraper.run_journal, or None when disabled."""
+    global _journal
+    cfg = config or get_config()
+    opts = cfg.get("run_journal") or {}
+    if not opts.get("enabled"):
+        return None
+    with _journal_lock:
+        if _journal is None:
+            _journal = RunJournal(_BACKEND_ROOT / (opts.get("path") or "storage/data/run_journal.sqlite3"))
+        return _journal
@@ -0,0 +1,121 @@
+"""
+Persistent index of every post URL visited or rejected, so later runs skip known posts.
+SQLite holds (url, platform, outcome, first/last seen); an in-memory Bloom filter in front answers
+"never seen" without touching the database. Outcome "failed" (page did not load) is retried.
+"""
+
+import hashlib
+import math
+import sqlite3
+import threading
+from pathlib import Path
+from time import time
+from typing import Iterable
+
+from core.config import get_config
+from core.url_canon import canonical_key
+
+_BACKEND_ROOT = Path(__file__).resolve().parent.parent
+
+LEAD = "lead"
+REJECTED = "rejected"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen (
+    key TEXT PRIMARY KEY,
+    platform TEXT NOT NULL DEFAULT '',
+    outcome TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+"""
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter; k bit positions from one blake2b digest (double hashing)."""
+
+    def __init__(self, capacity: int = 200_000, error_rate: float = 0.01):
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.k = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> Iterable[int]:
+        d = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(d[:8], "little")
+        h2 = int.from_bytes(d[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.k))
+
+    def add(self, item: str) -> None:
+        for p in self._positions(item):
+            self.bits[p >> 3] |= 1 << (p & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
+
+
+class SeenIndex:
+    def __init__(self, path: Path | str, capacity: int = 200_000):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        count = self._conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+        # Room for growth; an overfull filter only costs extra SQLite lookups, never wrong answers
+        self._bloom = BloomFilter(max(capacity, count * 2))
+        for (key,) in self._conn.execute("SELECT key FROM seen WHERE outcome != ?", (FAILED,)):
+            self._bloom.add(key)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def is_known(self, url: str) -> bool:
+        """True if url was already processed (lead or rejected) in this or an earlier run."""
+        key = canonical_key(url)
+        if key not in self._bloom:
+            return False
+        with self._lock:
+            row = self._conn.execute("SELECT outcome FROM seen WHERE key = ?", (key,)).fetchone()
+        return row is not None and row[0] != FAILED
+
+    def filter_new(self, urls: Iterable[str]) -> list[str]:
+        return [u for u in urls if not self.is_known(u)]
+
+    def record(self, url: str, platform: str, outcome: str) -> None:
+        key = canonical_key(url)
+        now = time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO seen (key, platform, outcome, first_seen, last_seen) VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT(key) DO UPDATE SET outcome=excluded.outcome, last_seen=excluded.last_seen",
+                (key, platform, outcome, now, now),
+            )
+            self._conn.commit()
+        if outcome != FAILED:
+            self._bloom.add(key)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+
+_index: SeenIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_seen_index(config: dict | None = None) -> SeenIndex | None:
+    """Process-wide index from scraper.seen_index, or None when disabled."""
+    global _index
+    cfg = config or get_config()
+    opts = cfg.get("seen_index") or {}
+    if not opts.get("enabled"):
+        return None
+    with _index_lock:
+        if _index is None:
+            _index = SeenIndex(_BACKEND_ROOT / (opts.get("path") or "storage/cache/seen_index.sqlite3"))
+        return _index
@@ -0,0 +1,55 @@
+"""Tests for the partitioned Parquet lead archive."""
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND = Path(__file__).resolve().parent.parent
+if str(BACKEND) not in sys.path:
+    sys.path.insert(0, str(BACKEND))
+
+pa = pytest.importorskip("pyarrow")
+
+from core.export import export_parquet
+from core.models import EmailSource, LeadRecord
+from storage.archive import count_by_platform, read_leads
+
+
+def _leads(platform, n, score=50):
+    return [
+        LeadRecord(client_name=f"{platform}{i}", post_url=f"https://{platform}.io/{i}", platform=platform,
+                   confidence_score=score + i, email=f"a{i}@x.io" if i % 2 else "",
+                   email_source=EmailSource.IN_POST if i % 2 else EmailSource.NONE,
+                   source_urls=[f"https://mirror.io/{i}"] if i == 0 else [])
+        for i in range(n)
+    ]
+
+
+def _archive(tmp_path):
+    cfg = {"output_dir": tmp_path}
+    export_parquet(_leads("Reddit", 4) + _leads("hackernews", 3), "run-a", cfg, run_date="2026-01-05")
+    export_parquet(_leads("reddit", 2, score=90), "run-b", cfg, run_date="2026-02-10")
+    return cfg
+
+
+def test_partitions_by_run_date_and_platform(tmp_path):
+    cfg = _archive(tmp_path)
+    files = sorted(p.relative_to(tmp_path / "archive").as_posix() for p in (tmp_path / "archive").rglob("*.parquet"))
+    assert files == [
+        "run_date=2026-01-05/platform=hackernews/run-a.parquet",
+        "run_date=2026-01-05/platform=reddit/run-a.parquet",
+        "run_date=2026-02-10/platform=reddit/run-b.parquet",
+    ]
+    assert count_by_platform(config=cfg) == {"reddit": 6, "hackernews": 3}
+
+
+def test_read_leads_filters_and_types(tmp_path):
+    cfg = _archive(tmp_path)
+    t = read_leads(platform="reddit", since="2026-02-01", config=cfg)
+    assert t.num_rows == 2 and set(t["run_id"].to_pylist()) == {"run-b"}
+    assert pa.types.is_dictionary(t.schema.field("email_source").type)
+    assert read_leads(min_score=52, email_only=True, columns=["client_name"], config=cfg).column_names == ["client_name"]
+    rows = read_leads(until="2026-01-31", min_score=52, email_only=True, config=cfg).to_pylist()
+    assert sorted(r["client_name"] for r in rows) == ["Reddit3"]
+    first = read_leads(platform=["reddit"], until="2026-01-05", config=cfg).to_pylist()
+    assert [r["source_urls"] for r in first if r["client_name"] == "Reddit0"] == [["https://mirror.io/0"]]
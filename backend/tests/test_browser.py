@@ -0,0 +1,162 @@
+"""Tests for resource blocking rules (no browser needed)."""
+import sys
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parent.parent
+if str(BACKEND) not in sys.path:
+    sys.path.insert(0, str(BACKEND))
+
+from core.browser import ResourceBlocker
+
+RULES = {
+    "enabled": True,
+    "types": ["image", "font", "stylesheet"],
+    "hosts": ["google-analytics.com"],
+    "allow": {"github": ["stylesheet"]},
+}
+
+
+def test_blocks_types_and_tracker_hosts():
+    b = ResourceBlocker(RULES, "reddit")
+    assert b.blocks("image", "https://i.redd.it/a.png")
+    assert b.blocks("script", "https://www.google-analytics.com/analytics.js")
+    assert not b.blocks("script", "https://www.reddit.com/app.js")
+    assert not b.blocks("document", "https://www.google-analytics.com/")
+
+
+def test_platform_opt_in():
+    assert not ResourceBlocker(RULES, "github").blocks("stylesheet", "https://github.com/a.css")
+    assert not ResourceBlocker(RULES, "reddit", allow=("font",)).blocks("font", "https://x.com/f.woff2")
+
+
+
+class _FakeBrowser:
+    def __init__(self, fail_contexts: int = 0):
+        self.connected = True
+        self.closed = False
+        self.fail_contexts = fail_contexts
+
+    def is_connected(self):
+        return self.connected
+
+    def new_context(self, **kwargs):
+        if self.fail_contexts:
+            self.fail_contexts -= 1
+            raise RuntimeError("Target closed")
+
+        class Ctx:
+            def set_default_timeout(self, ms):
+                pass
+
+        return Ctx()
+
+    def close(self):
+        self.closed = True
+
+
+def _fake_pool(size=1, max_contexts=3, fail_first=0):
+    from core.browser import BrowserPool
+
+    launched: list[_FakeBrowser] = []
+
+    class Chromium:
+        def launch(self, **kwargs):
+            launched.append(_FakeBrowser(fail_first if not launched else 0))
+            return launched[-1]
+
+    class Playwright:
+        chromium = Chromium()
+
+    pool = BrowserPool({"browser_max_contexts": max_contexts}, size=size)
+    pool.playwright = Playwright()
+    return pool, launched
+
+
+def test_pool_reuses_and_recycles_after_max_contexts():
+    pool, launched = _fake_pool(max_contexts=3)
+    for _ in range(3):
+        pool.new_context()
+    assert len(launched) == 1
+    pool.new_context()  # fourth context: browser recycled
+    assert len(launched) == 2 and launched[0].closed and not launched[1].closed
+
+
+def test_pool_relaunches_disconnected_browser_and_round_robins():
+    pool, launched = _fake_pool(size=2)
+    pool.new_context()
+    pool.new_context()
+    assert len(launched) == 2
+    launched[0].connected = False  # crashed
+    pool.new_context()
+    assert len(launched) == 3 and launched[0].closed
+    assert pool._slots[0]["browser"] is launched[2] and pool._slots[1]["browser"] is launched[1]
+
+
+def test_new_context_retries_once_on_a_fresh_browser():
+    pool, launched = _fake_pool(fail_first=1)
+    assert pool.new_context() is not None
+    assert len(launched) == 2 and launched[0].closed and pool._slots[0]["contexts"] == 1
+
+
+class _FakeAsyncBrowser:
+    def __init__(self, launches: list):
+        launches.append(self)
+        self.contexts = 0
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    async def new_context(self, **kwargs):
+        self.contexts += 1
+        browser = self
+
+        class Ctx:
+            def set_default_timeout(self, ms):
+                pass
+
+            async def close(self):
+                browser.contexts -= 1
+
+        return Ctx()
+
+    async def close(self):
+        self.closed = True
+
+
+def _fake_async_playwright(launches: list):
+    class Chromium:
+        async def launch(self, **kwargs):
+            return _FakeAsyncBrowser(launches)
+
+    class Playwright:
+        chromium = Chromium()
+
+        async def stop(self):
+            pass
+
+    class Starter:
+        async def start(self):
+            return Playwright()
+
+    return lambda: Starter()
+
+
+def test_async_engines_share_the_pool_browser(monkeypatch):
+    import core.async_browser as ab
+    from core.browser import browser_pool
+
+    launches: list = []
+    monkeypatch.setattr(ab, "async_playwright", _fake_async_playwright(launches))
+    cfg = {"browser_max_contexts": 2, "block_resources": {}}
+    with browser_pool(cfg):
+        for platform in ("reddit", "github", "upwork"):
+            engine = ab.AsyncPageEngine(cfg, platform, state=None).start()
+            assert launches[-1].contexts == 1
+            engine.close()
+        assert len(launches) == 2  # third context recycled the browser (browser_max_contexts=2)
+        assert launches[0].closed and not launches[1].closed
+    assert launches[1].closed
+
+    ab.AsyncPageEngine(cfg, "reddit", state=None).start().close()  # no pool: own browser, closed with it
+    assert len(launches) == 3 and launches[2].closed
@@ -0,0 +1,34 @@
+"""Tests for the cached config snapshot and SCRAPER_* env overlay."""
+import dataclasses
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND = Path(__file__).resolve().parent.parent
+if str(BACKEND) not in sys.path:
+    sys.path.insert(0, str(BACKEND))
+
+from core.config import get_config, reload_config
+
+
+def test_snapshot_is_cached_and_frozen():
+    cfg = reload_config()
+    assert get_config() is cfg
+    assert cfg["page_timeout"] == cfg.page_timeout == cfg.get("page_timeout")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        cfg.page_timeout = 1
+    with pytest.raises(TypeError):
+        cfg.platforms_enabled["reddit"] = False
+
+
+def test_env_overlay(monkeypatch):
+    monkeypatch.setenv("SCRAPER_PAGE_TIMEOUT", "1234")
+    monkeypatch.setenv("SCRAPER_HEADLESS", "false")
+    monkeypatch.setenv("SCRAPER_BLOCK_RESOURCES", "0")
+    cfg = reload_config()
+    assert cfg.page_timeout == 1234
+    assert cfg.headless is False
+    assert cfg.block_resources["enabled"] is False
+    monkeypatch.undo()
+    assert reload_config().version > cfg.version
@@ -7,7 +7,7 @@ if str(BACKEND) not in sys.path:
     sys.path.insert(0, str(BACKEND))
 
 from core.models import Lead, SourceType, EmailSource
-from core.dedupe import dedupe_leads
+from core.dedupe import DedupeEngine, dedupe_leads
 
 
 def test_dedupe_by_email():
@@ -27,3 +27,56 @@ def test_dedupe_by_platform_url():
     ]
     out = dedupe_leads(leads)
     assert len(out) == 1
+
+
+def test_fuzzy_name_url_across_platforms():
+    leads = [
+        Lead(client_name="Acme ", post_url="https://acme.io/job/", platform="reddit"),
+        Lead(client_name="acme", post_url="https://ACME.io/job", platform="github"),
+        Lead(client_name="", post_url="https://acme.io/job", platform="craigslist"),
+    ]
+    out = dedupe_leads(leads)
+    assert [l.platform for l in out] == ["reddit", "craigslist"]
+
+
+def test_engine_streaming_reports_duplicate_of():
+    engine = DedupeEngine()
+    first = Lead(client_name="A", post_url="https://a.com/1", email="A@x.com", platform="reddit")
+    assert engine.add(first).accepted
+    r = engine.add(Lead(client_name="B", post_url="https://b.com/1", email="a@x.com", platform="github"))
+    assert not r.accepted and r.duplicate_of is engine.accepted[0] and r.reason == "email"
+    r = engine.add(Lead(client_name="C", post_url="https://a.com/1/", platform="reddit"))
+    assert r.duplicate_of is engine.accepted[0] and r.reason == "platform_url"
+    r = engine.add(Lead(client_name="a", post_url="https://a.com/1", platform="github"))
+    assert r.duplicate_of is engine.accepted[0] and r.reason == "name_url"
+    assert len(engine.accepted) == 1
+    assert engine.accepted[0].source_urls == ["https://b.com/1", "https://a.com/1/"]
+    assert first.source_urls == []  # input untouched
+
+
+def test_duplicates_are_merged_field_by_field():
+    leads = [
+        Lead(client_name="", post_url="https://reddit.com/r/forhire/comments/abc/x", email="dev@acme.io", platform="reddit",
+             confidence_score=30, keywords_matched="react, mobile", post_date="2025-03-02"),
+        Lead(client_name="acme_hr", post_url="https://news.ycombinator.com/item?id=7", email="DEV@acme.io",
+             platform="hackernews", company="Acme", confidence_score=80, keywords_matched="React, budget",
+             post_date="2025-02-27", project_description="Longer description of the same job"),
+    ]
+    out = dedupe_leads(leads)
+    assert len(out) == 1
+    m = out[0]
+    assert (m.client_name, m.company, m.confidence_score, m.post_date) == ("acme_hr", "Acme", 80, "2025-02-27")
+    assert m.keywords_matched == "react, mobile, budget"
+    assert m.project_description == "Longer description of the same job"
+    assert m.post_url == leads[0].post_url and m.source_urls == ["https://news.ycombinator.com/item?id=7"]
+    assert dedupe_leads(leads, merge=False)[0] is leads[0]
+
+
+def test_keys_claimed_by_rejected_leads_still_block():
+    # The email of a lead dropped by the url rule is still claimed (matches the original pass)
+    leads = [
+        Lead(post_url="https://r.com/1", platform="reddit"),
+        Lead(post_url="https://r.com/1", platform="reddit", email="x@y.com"),
+        Lead(post_url="https://r.com/2", platform="reddit", email="x@y.com"),
+    ]
+    assert len(dedupe_leads(leads)) == 1
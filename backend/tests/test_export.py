@@ -0,0 +1,49 @@
+"""Tests for streaming XLSX/JSONL export."""
+import json
+import sys
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parent.parent
+if str(BACKEND) not in sys.path:
+    sys.path.insert(0, str(BACKEND))
+
+import openpyxl
+import pytest
+
+from core.export import HEADERS, export_leads, export_xlsx
+from core.models import Lead
+
+
+def _leads(n):
+    for i in range(n):
+        yield Lead(client_name=f"u{i}", post_url=f"https://x.io/{i}", confidence_score=i,
+                   source_urls=[f"https://y.io/{i}", f"https://z.io/{i}"] if i == 0 else [])
+
+
+def test_single_pass_writes_both_files_from_a_generator(tmp_path):
+    xlsx, jsonl = export_leads(_leads(25), {"output_dir": tmp_path})
+    ws = openpyxl.load_workbook(xlsx).active
+    assert ws.title == "Leads" and ws["A1"].font.b
+    rows = list(ws.iter_rows(values_only=True))
+    assert list(rows[0]) == HEADERS and len(rows) == 26
+    assert rows[1][HEADERS.index("source_urls")] == "https://y.io/0\nhttps://z.io/0"
+    lines = Path(jsonl).read_text().splitlines()
+    assert len(lines) == 25 and json.loads(lines[24])["confidence_score"] == 24
+
+
+def test_xlsx_only(tmp_path):
+    path = export_xlsx(_leads(3), {"output_dir": tmp_path})
+    assert path.endswith(".xlsx") and not list(tmp_path.glob("*.jsonl"))
+
+
+def test_failed_export_leaves_no_files(tmp_path):
+    def broken():
+        yield from _leads(3)
+        raise RuntimeError("scrape died")
+
+    live = tmp_path / "leads_20260101_000000.jsonl"
+    live.write_text("live\n", encoding="utf-8")
+    with pytest.raises(RuntimeError):
+        export_leads(broken(), {"output_dir": tmp_path}, timestamp="20260101_000000")
+    assert sorted(p.name for p in tmp_path.iterdir()) == [live.name]
+    assert live.read_text(encoding="utf-8") == "live\n"
@@ -0,0 +1,116 @@
+"""Tests for the on-disk response cache and its HTTP / page-route integrations (no network)."""
+import sys
+from pathlib import Path
+
+import httpx
+
+BACKEND = Path(__file__).resolve().parent.parent
+if str(BACKEND) not in sys.path:
+    sys.path.insert(0, str(BACKEND))
+
+from core.browser import PageCache
+from core.http_client import HttpClient
+from storage.http_cache import HttpCache, cache_key
+
+TTL = {"default": 60, "reddit": 60, "nocache": 0}
+
+
+def test_cache_key_canonical():
+    assert cache_key("HTTPS://News.YCombinator.com:443/item?id=1&b=2#c") == cache_key(
+        "https://news.ycombinator.com/item?b=2&id=1"
+    )
+    assert cache_key("https://a.com/x?q=1") != cache_key("https://a.com/x?q=2")
+
+
+def test_ttl_immutable_and_lru_eviction(tmp_path, monkeypatch):
+    cache = HttpCache(tmp_path / "c.sqlite3", max_bytes=10_000, ttl=TTL)
+    cache.put("https://a.com/1", "reddit", 200, "text/html", b"<p>one</p>", etag='"v1"')
+    cache.put("https://a.com/skip", "nocache", 200, "text/html", b"x")
+    assert cache.get("https://a.com/skip") is None
+    entry = cache.get_fresh("https://a.com/1", "reddit")
+    assert entry.body == b"<p>one</p>" and entry.validators() == {"If-None-Match": '"v1"'}
+
+    import storage.http_cache as hc
+    now = hc.time()
+    monkeypatch.setattr(hc, "time", lambda: now + 120)
+    assert cache.get_fresh("https://a.com/1", "reddit") is None
+    cache.mark_immutable("https://a.com/1")
+    assert cache.get_fresh("https://a.com/1", "reddit") is not None
+
+    import os
+    for i in range(20):  # incompressible bodies ~1.5 KB each, bound is 10 KB
+        cache.put(f"https://a.com/big{i}", "reddit", 200, "text/html", os.urandom(1500))
+    assert cache.total_bytes() <= 10_000
+    assert cache.get("https://a.com/big0") is None and cache.get("https://a.com/big19") is not None
+    cache.close()
+
+
+def test_http_client_revalidates_with_etag(tmp_path, monkeypatch):
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"n": 1}, headers={"etag": '"v1"'})
+
+    cache = HttpCache(tmp_path / "c.sqlite3", ttl=TTL)
+    c = HttpClient(transport=httpx.MockTransport(handler), cache=cache)
+    url = "https://www.reddit.com/r/x/new.json"
+    assert c.get_json(url, "reddit") == {"n": 1}
+    assert c.get_json(url, "reddit") == {"n": 1}  # fresh: no request
+    import storage.http_cache as hc
+    now = hc.time()
+    monkeypatch.setattr(hc, "time", lambda: now + 120)
+    assert c.get_json(url, "reddit") == {"n": 1}  # stale: 304 served from cache
+    assert seen == [None, '"v1"']
+    c.close()
+
+
+class FakeRoute:
+    def __init__(self, response=None):
+        self.request = type("Req", (), {"headers": {"user-agent": "ua"}})()
+        self.response = response
+        self.fetched_with = None
+        self.fulfilled = None
+
+    def fetch(self, headers=None):
+        self.fetched_with = headers
+        return self.response
+
+    def fulfill(self, **kw):
+        self.fulfilled = kw
+
+
+class FakeResponse:
+    status = 200
+    headers = {"content-type": "text/html; charset=utf-8", "last-modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+
+    def body(self):
+        return b"<html>item</html>"
+
+
+def test_page_route_stores_then_serves_locally(tmp_path):
+    cache = HttpCache(tmp_path / "c.sqlite3", ttl=TTL)
+    pc = PageCache(cache, "https://news.ycombinator.com/item?id=1", "reddit")
+    assert pc.matches("https://news.ycombinator.com/item?id=1#x")
+    first = FakeRoute(FakeResponse())
+    pc.handle(first)
+    assert first.fulfilled == {"response": first.response}
+    second = FakeRoute()
+    pc.handle(second)
+    assert second.fetched_with is None
+    assert second.fulfilled["body"] == b"<html>item</html>"
+    cache.close()
+
+
+def test_running_total_tracks_overwrites_and_evictions(tmp_path):
+    import os
+
+    cache = HttpCache(tmp_path / "c.sqlite3", max_bytes=6_000, ttl=TTL)
+    for i in range(12):
+        cache.put(f"https://a.com/{i % 5}", "reddit", 200, "text/html", os.urandom(500 + 100 * i))
+    actual = cache._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+    assert cache.total_bytes() == actual <= 6_000
+    cache.close()
+    assert HttpCache(tmp_path / "c.sqlite3", ttl=TTL).total_bytes() == actual
@@ -0,0 +1,65 @@
+"""Tests for the HTTP fast path: block detection and static-HTML link parsing (mock transport, no network)."""
+import sys
+from pathlib import Path
+
+import httpx
+
+BACKEND = Path(__file__).resolve().parent.parent
+if str(BACKEND) not in sys.path:
+    sys.path.insert(0, str(BACKEND))
+
+from core.http_client import HttpClient, parse_links
+from core.url_canon import unwrap
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.host == "api.ok":
+        return httpx.Response(200, json={"data": {"children": []}})
+    if request.url.host == "limited":
+        return httpx.Response(429)
+    if request.url.host == "html-json":
+        return httpx.Response(200, html="<html>Please verify</html>")
+    if request.url.host == "recaptcha.site":
+        return httpx.Response(200, html='<html><script src="https://www.google.com/recaptcha/api.js"></script>Access denied to drafts</html>')
+    return httpx.Response(403, html="<html><title>Just a moment...</title><div id='cf-chl-widget'></div></html>")
+
+
+def test_json_and_fallback_on_block():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.host)
+        return _handler(request)
+
+    c = HttpClient(transport=httpx.MockTransport(handler), backoff=0)
+    assert c.get_json("https://api.ok/r/x/new.json") == {"data": {"children": []}}
+    assert c.get_json("https://limited/a.json") is None
+    assert calls.count("limited") == 2  # 429 without an interstitial: retried once, host not blocked
+    assert not c.is_blocked("https://limited/")
+    assert c.get_json("https://html-json/a.json") is None and not c.is_blocked("https://html-json/")
+    assert c.get_json("https://html-json/b.json") is None and calls.count("html-json") == 2  # host still tried
+    assert c.get_html("https://challenge.site/") is None and c.is_blocked("https://challenge.site/")
+    assert c.get_html("https://challenge.site/b") is None  # host skipped, no second request
+    assert calls.count("challenge.site") == 1
+    assert "recaptcha" in c.get_html("https://recaptcha.site/") and not c.is_blocked("https://recaptcha.site/")
+    c.close()
+
+
+def test_transient_503_is_retried():
+    statuses = iter([503, 200])
+    c = HttpClient(
+        transport=httpx.MockTransport(lambda r: httpx.Response(next(statuses), html="<p>ok</p>")), backoff=0
+    )
+    assert c.get_html("https://busy.site/") == "<p>ok</p>" and not c.is_blocked("https://busy.site/")
+    c.close()
+
+
+def test_parse_links_with_parent_classes():
+    html = """<ol><li class="b_algo"><h2><a href="https://acme.dev/jobs">Acme</a></h2></li>
+    <li class="ad"><a href="/aclk?x=1">ad</a></li></ol>
+    <a class="result__a" href="//duckduckgo.com/l/?uddg=https%3A%2F%2Fshop.io%2Fhire&rut=1">r</a><br><img src=x>"""
+    links = parse_links(html, "https://www.bing.com/search?q=x")
+    assert [l.href for l in links if "b_algo" in l.parent_classes] == ["https://acme.dev/jobs"]
+    assert links[1].href == "https://www.bing.com/aclk?x=1"
+    ddg = [l for l in links if "result__a" in l.classes][0]
+    assert unwrap(ddg.href) == "https://shop.io/hire"
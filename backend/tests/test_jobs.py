@@ -0,0 +1,97 @@
+"""Tests for API run jobs: background process, coalescing, cancel, persisted history."""
+import sys
+import textwrap
+from pathlib import Path
+from time import sleep, time
+
+import pytest
+
+BACKEND = Path(__file__).resolve().parent.parent
+if str(BACKEND) not in sys.path:
+    sys.path.insert(0, str(BACKEND))
+
+from app.jobs import JobManager
+from storage.run_history import RunHistory
+
+# Stand-in for runners/run_job.py: sleeps `workers` seconds, exits without reporting if resume="die"
+FAKE_JOB = textwrap.dedent(f"""
+    import json, sys, time
+    sys.path.insert(0, {str(BACKEND)!r})
+    from storage.run_history import RunHistory, SUCCEEDED
+    history, job_id = RunHistory(sys.argv[1]), sys.argv[2]
+    job = history.get(job_id)
+    time.sleep(job["params"].get("workers") or 0)
+    if job["params"].get("resume") == "die":
+        sys.exit(1)
+    history.finish(job_id, SUCCEEDED, summary=json.dumps({{"run_id": job["run_id"], "unique_leads_after_dedupe": 3}}))
+""")
+
+
+@pytest.fixture
+def manager(tmp_path):
+    script = tmp_path / "fake_job.py"
+    script.write_text(FAKE_JOB)
+    db = tmp_path / "history.sqlite3"
+    return JobManager(RunHistory(db), command=[sys.executable, str(script), str(db)], log_dir=tmp_path / "logs")
+
+
+def _wait(manager, job_id, timeout=15.0):
+    deadline = time() + timeout
+    while time() < deadline:
+        job = manager.status(job_id)
+        if job["status"] not in ("queued", "running"):
+            return job
+        sleep(0.1)
+    raise AssertionError(f"job {job_id} still {job['status']}")
+
+
+def test_submit_returns_at_once_and_one_job_runs_at_a_time(manager):
+    t = time()
+    job, created = manager.submit({"workers": 1})
+    assert created and job["status"] == "running" and time() - t < 1.0
+    same, created_again = manager.submit({"workers": 1})
+    assert not created_again and same["job_id"] == job["job_id"]
+    other, created_other = manager.submit({"workers": 0})  # different params: still the active job
+    assert not created_other and other["job_id"] == job["job_id"]
+    done = _wait(manager, job["job_id"])
+    assert done["status"] == "succeeded" and done["summary"]["unique_leads_after_dedupe"] == 3
+    # history is persisted: a fresh manager (API restart) sees the same jobs
+    reopened = JobManager(RunHistory(manager.history.path))
+    assert reopened.history.latest_summary() is not None and len(reopened.recent()) == 1
+
+
+def test_cancel_and_interrupted(manager):
+    job, _ = manager.submit({"workers": 30})
+    cancelled = manager.cancel(job["job_id"])
+    assert cancelled["status"] == "cancelled"
+    proc = manager._procs[job["job_id"]]
+    proc.wait(timeout=10)
+    assert manager.cancel(job["job_id"])["status"] == "cancelled"  # already finished: unchanged
+
+    died, _ = manager.submit({"resume": "die"})
+    assert _wait(manager, died["job_id"])["status"] == "interrupted"
+
+
+def test_api_job_endpoints(manager, monkeypatch):
+    from fastapi.testclient import TestClient
+    from app.main import app
+    import app.routers.run as run_router
+
+    monkeypatch.setattr(run_router, "get_job_manager", lambda: manager)
+    client = TestClient(app)
+    assert client.get("/runs/latest").status_code == 404
+    res = client.post("/run", json={"workers": 30})
+    assert res.status_code == 202
+    job_id = res.json()["job_id"]
+    assert client.post("/run", json={"workers": 30}).json()["coalesced"] is True
+    busy = client.post("/run", json={})  # a second, different full scrape must not start alongside
+    assert busy.status_code == 409 and busy.json()["detail"]["job_id"] == job_id
+    assert client.get(f"/runs/{job_id}").json()["status"] == "running"
+    assert client.delete(f"/runs/{job_id}").json()["status"] == "cancelled"
+    assert client.delete(f"/runs/{job_id}").json()["status"] == "cancelled"  # idempotent
+    quick = client.post("/run", json={"workers": 0}).json()["job_id"]
+    _wait(manager, quick)
+    assert client.delete(f"/runs/{quick}").status_code == 409
+    assert client.get("/runs/latest").json()["unique_leads_after_dedupe"] == 3
+    assert client.get("/runs/nope").status_code == 404
+    assert [j["job_id"] for j in client.get("/runs").json()] == [quick, job_id]
@@ -0,0 +1,120 @@
+"""Tests for the SQLite lead store and GET /api/leads."""
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND = Path(__file__).resolve().parent.parent
+if str(BACKEND) not in sys.path:
+    sys.path.insert(0, str(BACKEND))
+
+from core.models import Lead, LeadRecord
+from storage.lead_store import LeadQuery, LeadStore
+
+
+def _leads():
+    return [
+        Lead(post_url=f"https://news.ycombinator.com/item?id={i}", platform="hackernews" if i % 2 else "reddit",
+             confidence_score=10 * (i % 7), email=f"u{i}@acme.io" if i % 3 == 0 else "",
+             post_date=f"2025-01-{i % 28 + 1:02d}")
+        for i in range(1, 41)
+    ]
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = LeadStore(tmp_path / "leads.sqlite3")
+    s.upsert(_leads(), "run1")
+    yield s
+    s.close()
+
+
+def test_upsert_is_keyed_on_normalized_url(store):
+    store.upsert([Lead(post_url="HTTPS://news.ycombinator.com/item?id=1#x", platform="hackernews", confidence_score=99)], "run2")
+    assert len(store) == 40
+    top = store.query(LeadQuery(limit=1)).leads[0]
+    assert top["confidence_score"] == 99 and top["run_id"] == "run2"
+
+
+@pytest.mark.parametrize("sort", ["confidence_score", "post_date", "id"])
+@pytest.mark.parametrize("order", ["asc", "desc"])
+def test_cursor_pages_cover_everything_once(store, sort, order):
+    q = LeadQuery(platform="hackernews", sort=sort, order=order, limit=7)
+    seen, keys = [], []
+    while True:
+        page = store.query(q)
+        seen += [r["id"] for r in page.leads]
+        keys += [(r[sort], r["id"]) for r in page.leads]
+        assert page.total == 20
+        if not page.next_cursor:
+            break
+        q.cursor = page.next_cursor
+    assert len(seen) == len(set(seen)) == 20
+    assert keys == sorted(keys, reverse=order == "desc")
+
+
+def test_filters(store):
+    page = store.query(LeadQuery(has_email=True, min_score=30, since="2025-01-10"))
+    assert page.leads and all(r["email"] and r["confidence_score"] >= 30 and r["post_date"] >= "2025-01-10" for r in page.leads)
+    with pytest.raises(ValueError):
+        store.query(LeadQuery(sort="email; DROP TABLE leads"))
+
+
+def test_api_lists_from_store(store, monkeypatch):
+    from fastapi.testclient import TestClient
+    from app.main import app
+    import app.routers.leads as leads_router
+
+    monkeypatch.setattr(leads_router, "get_lead_store", lambda: store)
+    client = TestClient(app)
+    body = client.get("/api/leads", params={"platform": "reddit", "limit": 5}).json()
+    assert body["total"] == 20 and len(body["leads"]) == 5 and body["next_cursor"]
+    assert client.get("/api/leads", params={"sort": "nope"}).status_code == 400
+
+
+def test_search_ranks_snippets_and_follows_upserts(tmp_path):
+    s = LeadStore(tmp_path / "leads.sqlite3")
+    s.upsert([
+        Lead(post_url="https://x.io/1", platform="reddit", project_description="Need a React Native developer for a fitness app",
+             keywords_matched="react native, mobile app"),
+        Lead(post_url="https://x.io/2", platform="reddit", project_description="Looking for a designer; react experience a plus"),
+        Lead(post_url="https://x.io/3", platform="hackernews", project_description="Django backend contract"),
+    ], "run1")
+    hits = s.search("react native")
+    assert [h["post_url"] for h in hits] == ["https://x.io/1"]
+    assert "[React]" in hits[0]["snippet"] or "[react]" in hits[0]["snippet"]
+    assert [h["post_url"] for h in s.search("react")][0] == "https://x.io/1"
+    assert s.search('"native developer" OR django') == []  # operators are plain words
+    assert s.search("") == []
+
+    s.upsert([Lead(post_url="https://x.io/3", platform="hackernews", project_description="React Native rewrite")], "run2")
+    assert {h["post_url"] for h in s.search("react native")} == {"https://x.io/1", "https://x.io/3"}
+    assert s.search("django") == []
+    assert [h["post_url"] for h in s.search("react native", platform="hackernews")] == ["https://x.io/3"]
+    s.close()
+
+    reopened = LeadStore(tmp_path / "leads.sqlite3")
+    assert len(reopened.search("react")) == 3
+    reopened.close()
+
+
+def test_search_ranks_every_match_not_just_the_newest(tmp_path):
+    s = LeadStore(tmp_path / "leads.sqlite3")
+    s.upsert([LeadRecord(post_url="https://x.io/old", platform="reddit",
+                         project_description="Shopify developer for a Shopify store migration, Shopify Plus")], "run1")
+    s.upsert([LeadRecord(post_url=f"https://x.io/{i}", platform="reddit",
+                         project_description=f"Website redesign {i}, long brief about pages and content; shopify maybe")
+              for i in range(300)], "run2")
+    assert s.search("shopify", limit=1)[0]["post_url"] == "https://x.io/old"
+    s.close()
+
+
+def test_api_search(store, monkeypatch):
+    from fastapi.testclient import TestClient
+    from app.main import app
+    import app.routers.leads as leads_router
+
+    store.upsert([Lead(post_url="https://x.io/s", platform="reddit", project_description="Shopify store redesign")], "run2")
+    monkeypatch.setattr(leads_router, "get_lead_store", lambda: store)
+    body = TestClient(app).get("/api/leads/search", params={"q": "shopify"}).json()
+    assert body["count"] == 1 and "[Shopify]" in body["results"][0]["snippet"]
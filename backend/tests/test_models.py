@@ -0,0 +1,42 @@
+"""Tests for the internal LeadRecord and its Pydantic twin."""
+import sys
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parent.parent
+if str(BACKEND) not in sys.path:
+    sys.path.insert(0, str(BACKEND))
+
+from core.models import EmailSource, Lead, LeadRecord, PlatformResult, SourceType
+
+
+def _record():
+    return LeadRecord(client_name="Zoë", post_url="https://x.io/1", source_type=SourceType.FORUM,
+                      email="a@x.io", email_source=EmailSource.IN_POST, confidence_score=80,
+                      source_urls=["https://y.io/1"])
+
+
+def test_record_is_slotted_and_round_trips_through_lead():
+    record = _record()
+    assert not hasattr(record, "__dict__")
+    lead = record.to_lead()
+    assert isinstance(lead, Lead) and LeadRecord.from_lead(lead) == record
+    assert record.to_json() == lead.model_dump_json()
+    assert record.to_dict() == lead.model_dump(mode="json")
+    assert record.to_row() == lead.to_row()
+
+
+def test_platform_result_keeps_records_without_copying():
+    record = _record()
+    result = PlatformResult(platform="reddit", success=True, leads=[record])
+    assert result.leads[0] is record
+    assert result.model_dump(mode="json")["leads"][0]["source_type"] == "forum"
+
+
+def test_merge_accepts_api_leads():
+    from core.merge import merged
+
+    lead = _record().to_lead()
+    assert merged(lead, Lead(post_url="https://x.io/1")) is lead  # nothing to fold in
+    out = merged(lead, LeadRecord(post_url="https://z.io/9", company="Acme"))
+    assert isinstance(out, Lead) and out.company == "Acme" and out.source_urls == ["https://y.io/1", "https://z.io/9"]
+    assert lead.company == ""
@@ -0,0 +1,64 @@
+"""Tests for MinHash/LSH near-duplicate detection and folding into the lead store."""
+import sys
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parent.parent
+if str(BACKEND) not in sys.path:
+    sys.path.insert(0, str(BACKEND))
+
+from core.models import Lead
+from core.near_dedupe import band_keys, collapse_near_duplicates, minhash, near_duplicate_clusters, shingles
+from storage.lead_store import LeadStore
+
+POST = (
+    "Looking for an experienced React Native developer to build a fitness tracking app for iOS and Android. "
+    "Must integrate with Apple Health and Google Fit, budget is around 8k, timeline two months."
+)
+
+
+def test_band_keys_are_stable_and_similar_texts_share_a_band():
+    a = band_keys(minhash(shingles(POST)))
+    assert a == band_keys(minhash(shingles(POST)))
+    assert len(a) == 8
+    b = band_keys(minhash(shingles("[Hiring] " + POST.replace("8k", "8000 USD"))))
+    assert set(a) & set(b)
+    assert band_keys(minhash(shingles("need a developer"))) == []  # too short to compare
+
+
+def test_clusters_cross_posts_only():
+    texts = [
+        POST,
+        "Wordpress plugin fix needed for a checkout bug on our store, should take a couple of hours at most.",
+        "[Hiring] " + POST + " DM me.",
+        "Looking for an experienced Django developer to build a fitness tracking API backend with Postgres.",
+    ]
+    assert near_duplicate_clusters(texts) == [[0, 2], [1], [3]]
+
+
+def test_collapse_keeps_best_lead_and_links_sources():
+    leads = [
+        Lead(post_url="https://reddit.com/r/forhire/1", platform="reddit", project_description=POST, confidence_score=40),
+        Lead(post_url="https://sf.craigslist.org/cpg/2.html", platform="craigslist", project_description=POST,
+             confidence_score=70),
+        Lead(post_url="https://news.ycombinator.com/item?id=3", platform="hackernews", project_description="Other work"),
+    ]
+    out = collapse_near_duplicates(leads)
+    assert [l.platform for l in out] == ["craigslist", "hackernews"]
+    assert out[0].source_urls == ["https://reddit.com/r/forhire/1"]
+    assert leads[1].source_urls == []  # inputs are not mutated
+
+
+def test_store_folds_cross_posts_from_later_runs(tmp_path):
+    s = LeadStore(tmp_path / "leads.sqlite3", near_threshold=0.7)
+    s.upsert([Lead(post_url="https://reddit.com/r/forhire/1", platform="reddit", project_description=POST)], "run1")
+    s.upsert([
+        Lead(post_url="https://news.ycombinator.com/item?id=9", platform="hackernews", project_description=POST + " Remote ok."),
+        Lead(post_url="https://x.io/other", platform="reddit", project_description="Shopify theme tweaks for a small clothing store, quick job"),
+    ], "run2")
+    assert len(s) == 2
+    rows = {r["post_url"]: r for r in s.search("fitness") + s.search("shopify")}
+    assert rows["https://reddit.com/r/forhire/1"]["source_urls"] == "https://news.ycombinator.com/item?id=9"
+    # A plain refresh of the kept lead does not drop its folded sources
+    s.upsert([Lead(post_url="https://reddit.com/r/forhire/1", platform="reddit", project_description=POST)], "run3")
+    assert s.search("fitness")[0]["source_urls"] == "https://news.ycombinator.com/item?id=9"
+    s.close()
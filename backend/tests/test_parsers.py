@@ -0,0 +1,78 @@
+"""Tests for detail-page parsers on extracted field dicts (no browser needed)."""
+import json
+import sys
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parent.parent
+if str(BACKEND) not in sys.path:
+    sys.path.insert(0, str(BACKEND))
+
+from core.extraction import EXTRACT_JS
+from platforms.craigslist.parser import lead_from_fields as craigslist_lead
+from platforms.hackernews.parser import lead_from_fields as hn_lead, parse_item_page
+from platforms.reddit.parser import lead_from_fields as reddit_lead, parse_post_page
+from platforms.reddit.selectors import DETAIL_SPEC as REDDIT_SPEC
+
+
+class FakePage:
+    """Records evaluate() calls and returns canned fields."""
+
+    def __init__(self, fields: dict):
+        self.fields = fields
+        self.calls: list = []
+
+    def evaluate(self, script: str, arg=None):
+        self.calls.append((script, arg))
+        return self.fields
+
+
+def test_reddit_fields_to_lead():
+    lead = reddit_lead(
+        {"title": " Need developer for MVP ", "body": "Budget $3k. Mail me at ceo@startup.io",
+         "time": "2 days ago", "datetime": "2025-01-05T10:00:00.000Z", "author": "u/founder"},
+        "https://www.reddit.com/r/forhire/comments/abc/x/",
+    )
+    assert lead is not None
+    assert lead.email == "ceo@startup.io"
+    assert lead.post_date == "2025-01-05T10:00:00.000Z"
+    assert lead.client_name == "u/founder"
+    assert "need developer" in lead.keywords_matched
+
+
+def test_missing_fields_and_relative_time():
+    assert reddit_lead({"title": None, "body": None}, "https://x") is None
+    lead = craigslist_lead({"title": "Hiring freelancer for app", "body": "need app built asap", "time": "3 days ago"}, "u")
+    assert lead is not None and lead.post_date and lead.client_name == "Unknown"
+    assert hn_lead({"title": "Show HN: my cat"}, "u") is None
+
+
+def test_page_parser_is_one_evaluate():
+    page = FakePage({"title": "Looking for developer", "body": "hiring a freelancer, email a@b.io"})
+    assert parse_post_page(page, "https://www.reddit.com/r/x/comments/1/")
+    assert len(page.calls) == 1 and page.calls[0] == (EXTRACT_JS, REDDIT_SPEC)
+    json.dumps(REDDIT_SPEC)  # passed straight to page.evaluate
+    assert parse_item_page(FakePage({}), "u") is None
+
+
+def test_generic_page_content_in_one_evaluate():
+    from core.parsing_utils import MAIN_CONTENT_JS, MAIN_SELECTORS
+    from platforms.search_discovery.parser import parse_generic_page
+
+    page = FakePage({"text": "  We are  hiring a freelancer\n to build an MVP. Contact jobs@acme.dev  ", "title": "Acme jobs"})
+    lead = parse_generic_page(page, "https://acme.dev/jobs")
+    assert page.calls == [(MAIN_CONTENT_JS, MAIN_SELECTORS)]
+    assert lead is not None and lead.client_name == "Acme jobs" and lead.email == "jobs@acme.dev"
+    assert lead.post_text_snippet.startswith("We are hiring a freelancer to build")
+
+
+def test_main_content_from_static_html():
+    from core.parsing_utils import main_content_from_html
+
+    body = "We need a developer to build our MVP, budget $5k. " * 3
+    html = f"""<html><head><title>Gig &amp; Co</title><style>p{{}}</style></head><body>
+    <nav>Home | About</nav><article><p>{body}</p><script>track()</script><footer>share</footer></article>
+    <footer>(c) 2025</footer></body></html>"""
+    text, title = main_content_from_html(html)
+    assert title == "Gig & Co"
+    assert text == body.strip()
+    assert main_content_from_html("<p>tiny <b>page</b></p>") == ("tiny page", "")
@@ -0,0 +1,78 @@
+"""Tests for streaming leads from connectors through LeadPipeline."""
+import json
+import sys
+from pathlib import Path
+from time import sleep, time
+
+BACKEND = Path(__file__).resolve().parent.parent
+if str(BACKEND) not in sys.path:
+    sys.path.insert(0, str(BACKEND))
+
+from core.models import LeadRecord
+from core.pipeline import LeadPipeline
+from platforms.base import BaseConnector, LeadSink
+from storage.lead_store import LeadStore
+
+
+class _Flaky(BaseConnector):
+    """Adds three posts (one a re-spelling of the first), then dies."""
+
+    name = "flaky"
+
+    def fetch(self, cutoff_date=None, query_config=None, state=None):
+        leads = self._lead_sink()
+        for url in ("https://www.reddit.com/r/a/comments/p1/x/", "https://redd.it/p1", "https://x.io/2"):
+            leads.add(LeadRecord(client_name="c", post_url=url, platform=self.name))
+        raise RuntimeError("browser crashed")
+
+
+def _config(tmp_path):
+    return {"output_dir": tmp_path, "lead_store": {}, "near_dedupe": {}}
+
+
+def test_sink_drops_repeat_spellings_and_streams():
+    got = []
+    sink = LeadSink(got.append)
+    assert sink.add(LeadRecord(post_url="https://x.io/1?utm_source=a"))
+    assert not sink.add(LeadRecord(post_url="https://X.io/1/"))
+    assert len(sink) == 1 and [l.post_url for l in got] == ["https://x.io/1?utm_source=a"] and sink.leads == []
+
+
+def test_leads_scraped_before_a_crash_are_kept(tmp_path):
+    result = _Flaky().run()
+    assert not result.success and [l.post_url for l in result.leads] == [
+        "https://www.reddit.com/r/a/comments/p1/x/", "https://x.io/2"]
+
+    pipeline = LeadPipeline("run-1", _config(tmp_path), flush_every=1)
+    pipeline.store = LeadStore(tmp_path / "leads.sqlite3")
+    result = _Flaky().run(on_lead=pipeline.add)
+    assert result.leads == [] and result.leads_found == 2
+    # durable before finish(): in the store and in the live JSONL
+    assert len(pipeline.store) == 2
+    live = Path(tmp_path).glob("leads_*.jsonl")
+    assert [json.loads(line)["post_url"] for line in next(live).read_text().splitlines()] == [
+        "https://www.reddit.com/r/a/comments/p1/x/", "https://x.io/2"]
+
+
+def test_pipeline_merges_online_and_finish_replaces_live_file(tmp_path):
+    pipeline = LeadPipeline("run-1", _config(tmp_path))
+    assert pipeline.add(LeadRecord(client_name="a", post_url="https://x.io/1?utm_source=z", platform="p"))
+    assert not pipeline.add(LeadRecord(client_name="a", post_url="https://x.io/1", platform="p", email="a@x.io"))
+    leads, xlsx, jsonl = pipeline.finish()
+    assert pipeline.received == 2 and len(leads) == 1
+    rows = [json.loads(line) for line in Path(jsonl).read_text().splitlines()]
+    assert rows == [leads[0].to_dict()] and rows[0]["email"] == "a@x.io" and rows[0]["post_url"] == "https://x.io/1"
+    assert Path(xlsx).exists() and len(list(Path(tmp_path).glob("leads_*.jsonl"))) == 1
+
+
+def test_pending_leads_are_flushed_on_a_timer(tmp_path):
+    pipeline = LeadPipeline("run-1", _config(tmp_path), flush_every=50, flush_seconds=0.2, live_jsonl=False)
+    pipeline.store = LeadStore(tmp_path / "leads.sqlite3")
+    pipeline.add(LeadRecord(client_name="c", post_url="https://x.io/1", platform="p"))
+    assert len(pipeline.store) == 0
+    deadline = time() + 5
+    while len(pipeline.store) == 0 and time() < deadline:  # no further add(): the timer flushes
+        sleep(0.05)
+    assert len(pipeline.store) == 1
+    pipeline.finish(export=False)
+    assert not pipeline._timer.is_alive()
@@ -0,0 +1,107 @@
+"""Tests for the run journal behind run_all --resume."""
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND = Path(__file__).resolve().parent.parent
+if str(BACKEND) not in sys.path:
+    sys.path.insert(0, str(BACKEND))
+
+import platforms.base as base
+from core.models import LeadRecord, PlatformResult
+from core.pipeline import LeadPipeline
+from core.run_context import RunContext
+from platforms.base import BaseConnector
+from storage.run_journal import RunJournal
+
+PAGES = [f"https://x.io/list/{i}" for i in range(4)]
+
+
+class _Pager(BaseConnector):
+    """Four listing pages of two posts each; dies on page crash_at."""
+
+    name = "pager"
+
+    def __init__(self, crash_at=None):
+        self.crash_at = crash_at
+        self.visited: list[str] = []
+
+    def fetch(self, cutoff_date=None, query_config=None, state=None):
+        leads = self._lead_sink()
+        for i, page in enumerate(self._listing("listing", PAGES, state)):
+            urls = [f"{page}/post/{j}" for j in range(2)]
+            if self._journal is not None:
+                urls = self._journal.filter_new(self._run_id, self.name, urls)
+            for url in urls:
+                if i == self.crash_at and url.endswith("/1"):
+                    raise RuntimeError("killed")
+                self.visited.append(url)
+                leads.add(LeadRecord(client_name="c", post_url=url, platform=self.name))
+                self._record_processed(url)
+        return leads.leads
+
+
+@pytest.fixture
+def journal(tmp_path, monkeypatch):
+    j = RunJournal(tmp_path / "journal.sqlite3")
+    monkeypatch.setattr(base, "get_run_journal", lambda config=None: j)
+    return j
+
+
+def _pipeline(tmp_path, journal, run_id, timestamp=None):
+    config = {"output_dir": tmp_path, "lead_store": {}, "near_dedupe": {}}
+    return LeadPipeline(run_id, config, journal=journal, timestamp=timestamp)
+
+
+def test_resume_skips_finished_pages_and_replays_leads(tmp_path, journal):
+    run = RunContext.create(600, 1, run_id="r1")
+    killed = _pipeline(tmp_path, journal, "r1")
+    journal.start_run("r1", killed.timestamp)
+    first = _Pager(crash_at=2)
+    result = first.run(run, on_lead=killed.add)
+    assert not result.success and len(first.visited) == 5
+    assert journal.cursor("r1", "pager", "listing") == 2
+
+    pipeline = _pipeline(tmp_path, journal, "r1", timestamp=journal.file_timestamp("r1"))
+    assert pipeline.timestamp == killed.timestamp
+    assert pipeline.replay(journal.leads("r1")) == 5
+    again = _Pager()
+    assert again.run(run, on_lead=pipeline.add).success
+    # page 2 restarts but its first post is not revisited; pages 0-1 are skipped entirely
+    assert again.visited == ["https://x.io/list/2/post/1", "https://x.io/list/3/post/0", "https://x.io/list/3/post/1"]
+    leads, _xlsx, _jsonl = pipeline.finish(export=False)
+    assert len(leads) == 8 and len(list(journal.leads("r1"))) == 8
+    # The resume rewrote the killed attempt's live file instead of leaving it beside a new one
+    live = list(tmp_path.glob("leads_*.jsonl"))
+    assert [f.name for f in live] == [f"leads_{killed.timestamp}.jsonl"]
+    assert len(live[0].read_text(encoding="utf-8").splitlines()) == 8
+
+
+def test_finished_runs_are_pruned(tmp_path, journal):
+    for run_id in ("done", "live"):
+        journal.start_run(run_id)
+        journal.record_lead(run_id, LeadRecord(post_url=f"https://x.io/{run_id}"))
+        journal.record_url(run_id, "pager", f"https://x.io/{run_id}")
+        journal.set_cursor(run_id, "pager", "listing", 3)
+    journal.finish_run("done")
+    assert journal.finished("done") and not journal.finished("live")
+    assert journal.lead_count("done") == 0 and journal.cursor("done", "pager", "listing") == 0
+    assert journal.filter_new("done", "pager", ["https://x.io/done"]) == ["https://x.io/done"]
+    assert journal.lead_count("live") == 1 and journal.cursor("live", "pager", "listing") == 3
+
+
+def test_completed_platforms_round_trip(tmp_path):
+    j = RunJournal(tmp_path / "journal.sqlite3")
+    assert not j.has_run("r1")
+    j.start_run("r1")
+    lead = LeadRecord(post_url="https://x.io/1")
+    j.platform_done("r1", PlatformResult(platform="reddit", success=True, leads=[lead], leads_found=1))
+    done = j.completed("r1")
+    assert j.has_run("r1") and list(done) == ["reddit"]
+    assert done["reddit"].leads == [] and done["reddit"].leads_found == 1
+    assert j.completed("other") == {}
+    first = j.started_at("r1")
+    j.start_run("r1")  # resumed later
+    assert j.started_at("r1") == first and j.started_at("other") is None
+    assert j.file_timestamp("r1") is None
@@ -0,0 +1,63 @@
+"""Tests for the compiled keyword matcher and requirement scoring."""
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND = Path(__file__).resolve().parent.parent
+if str(BACKEND) not in sys.path:
+    sys.path.insert(0, str(BACKEND))
+
+import core.keyword_matcher as keyword_matcher
+from core.keyword_matcher import KeywordMatcher
+from core.scoring import get_matcher, score_requirement
+
+WORDS = ["need help", "need help with", "help", "elp w", "with", "@", "202", "asap"]
+TEXTS = ["", "we need help with our app asap", "mail me @ x.com in 2024", "helpwith", "nothing here"]
+
+
+@pytest.mark.parametrize("automaton", [True, False])
+def test_matcher_same_as_substring_scan(monkeypatch, automaton):
+    if not automaton:
+        monkeypatch.setattr(keyword_matcher, "ahocorasick", None)
+    elif keyword_matcher.ahocorasick is None:
+        pytest.skip("pyahocorasick not installed")
+    m = KeywordMatcher(WORDS)
+    for text in TEXTS:
+        assert m.found(text) == {w for w in WORDS if w in text}
+        assert m.matches(text) == [w for w in WORDS if w in text]
+
+
+def test_score_requirement_uses_one_matcher_per_keyword_set():
+    cfg = {"search_keywords": ["Need Developer", "shopify"]}
+    assert get_matcher(cfg) is get_matcher(dict(cfg))
+    score, matched = score_requirement("Need developer for Shopify store, email me ASAP", cfg)
+    assert matched[:3] == ["contact", "need developer", "shopify"]
+    assert "asap" in matched
+    assert score == 40 + 20 + 5
+
+
+def test_score_many_matches_single_text_path():
+    from core.scoring import score_many, should_save_lead
+
+    texts = TEXTS + [None, "   ", "Hiring a freelancer, budget $500, contact me@x.io", "Looking for agency ASAP"]
+    results = score_many(texts)
+    for text, res in zip(texts, results):
+        score, matched = score_requirement(text)
+        assert (res.score, res.matched) == (score, matched)
+        assert res.save == should_save_lead(text, "@" in (text or ""), score, matched)
+
+
+def test_reddit_listing_batch_matches_per_post():
+    from platforms.reddit.parser import lead_from_json_post, leads_from_json_posts
+
+    posts = [
+        {"title": "Need developer for MVP", "selftext": "budget $2k, email a@b.co", "permalink": "/r/x/comments/1/a/",
+         "author": "u1", "created_utc": 1700000000},
+        {"title": "My cat photo", "selftext": "", "permalink": "/r/x/comments/2/b/"},
+        {"title": "", "selftext": "", "permalink": "/r/x/comments/3/c/"},
+    ]
+    batch = leads_from_json_posts(posts)
+    single = [lead_from_json_post(p) for p in posts]
+    assert batch == single
+    assert batch[0] is not None and batch[0].email == "a@b.co"
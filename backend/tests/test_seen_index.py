@@ -0,0 +1,59 @@
+"""Tests for the persistent seen-URL index and its Bloom filter."""
+import sys
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parent.parent
+if str(BACKEND) not in sys.path:
+    sys.path.insert(0, str(BACKEND))
+
+from storage.seen_index import FAILED, LEAD, REJECTED, BloomFilter, SeenIndex
+
+
+def test_bloom_no_false_negatives_and_low_fp():
+    bf = BloomFilter(capacity=5000, error_rate=0.01)
+    items = [f"https://news.ycombinator.com/item?id={i}" for i in range(5000)]
+    for it in items:
+        bf.add(it)
+    assert all(it in bf for it in items)
+    fp = sum(f"https://other.site/{i}" in bf for i in range(10000))
+    assert fp < 300
+
+
+def test_index_persists_across_runs_and_retries_failures(tmp_path):
+    path = tmp_path / "seen.sqlite3"
+    idx = SeenIndex(path)
+    idx.record("https://github.com/a/b/issues/1", "github", LEAD)
+    idx.record("https://github.com/a/b/issues/2", "github", REJECTED)
+    idx.record("https://github.com/a/b/issues/3", "github", FAILED)
+    idx.close()
+
+    idx = SeenIndex(path)  # next run
+    urls = [f"https://github.com/a/b/issues/{i}" for i in range(1, 5)]
+    assert idx.filter_new(urls) == urls[2:]
+    assert idx.is_known("https://GitHub.com/a/b/issues/1#top")
+    assert len(idx) == 3
+    idx.close()
+
+
+def test_only_runs_that_keep_their_leads_record_outcomes(tmp_path, monkeypatch):
+    import platforms.base as base
+    from core.models import LeadRecord
+
+    idx = SeenIndex(tmp_path / "seen.sqlite3")
+    monkeypatch.setattr(base, "get_seen_index", lambda config=None: idx)
+
+    class Conn(base.BaseConnector):
+        name = "github"
+
+        def fetch(self, cutoff_date=None, query_config=None, state=None):
+            url = "https://github.com/a/b/issues/7"
+            self._lead_sink().add(LeadRecord(post_url=url, platform=self.name))
+            self._record_seen(url, LEAD)
+            return []
+
+    Conn().run()  # e.g. run_platform.py without --export: nothing saves the lead
+    assert len(idx) == 0
+    kept = []
+    Conn().run(on_lead=kept.append)
+    assert len(kept) == 1 and idx.is_known("https://github.com/a/b/issues/7")
+    idx.close()
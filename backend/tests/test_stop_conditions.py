@@ -0,0 +1,31 @@
+"""Tests for run-wide deadline and fair-share budget in stop checks."""
+import sys
+from pathlib import Path
+from time import time
+
+BACKEND = Path(__file__).resolve().parent.parent
+if str(BACKEND) not in sys.path:
+    sys.path.insert(0, str(BACKEND))
+
+from core.run_context import RunContext
+from core.stop_conditions import StopState, check_platform_stop
+
+CFG = {"max_runtime_per_platform": 240, "global_max_runtime": 900, "watchdog_timeout": 60}
+
+
+def test_run_deadline_measured_from_run_start():
+    run = RunContext.create(900, platforms=3)
+    run.deadline = time() - 1  # run budget already used by earlier platforms
+    state = StopState(run=run)
+    assert check_platform_stop(state, CFG, "reddit") == (True, "global_max_runtime")
+
+
+def test_fair_share_grows_when_platforms_finish():
+    run = RunContext.create(300, platforms=3)
+    state = StopState(run=run)
+    state.platform_start = time() - 150  # 150s in; share is ~300/3 = 100s
+    assert check_platform_stop(state, CFG, "reddit") == (True, "max_runtime")
+    run.platform_finished(leads=0)
+    run.platform_finished(leads=0)  # others done early -> this platform may use the rest
+    state.last_progress_time = time()
+    assert check_platform_stop(state, CFG, "reddit") == (False, "")
@@ -0,0 +1,50 @@
+"""Tests for URL canonicalization."""
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND = Path(__file__).resolve().parent.parent
+if str(BACKEND) not in sys.path:
+    sys.path.insert(0, str(BACKEND))
+
+from core.url_canon import add_if_new, canonical_key, clean_url, unwrap
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.reddit.com/r/forhire/comments/1abcde/hiring_react_dev/",
+    "https://old.reddit.com/r/forhire/comments/1abcde/hiring_react_dev/?utm_source=share&utm_medium=web2x",
+    "http://new.reddit.com/r/ForHire/comments/1ABCDE",
+    "https://reddit.com/comments/1abcde",
+    "https://redd.it/1abcde",
+    "https://out.reddit.com/x?url=https%3A%2F%2Fwww.reddit.com%2Fr%2Fforhire%2Fcomments%2F1abcde%2F",
+])
+def test_reddit_spellings_share_post_id(url):
+    assert canonical_key(url) == "reddit:1abcde"
+
+
+def test_hn_item_and_algolia():
+    assert canonical_key("https://news.ycombinator.com/item?id=4242#c1") == "hn:4242"
+    assert canonical_key("https://hn.algolia.com/api/v1/items/4242") == "hn:4242"
+    assert canonical_key("https://hn.algolia.com/?story=4242") == "hn:4242"
+    assert canonical_key("https://news.ycombinator.com/item?id=4243") != "hn:4242"
+
+
+def test_platform_ids_for_craigslist_and_github():
+    assert canonical_key("https://sfbay.craigslist.org/sfc/cpg/d/web-dev/7712345678.html") == "craigslist:7712345678"
+    assert canonical_key("https://github.com/Acme/Site/issues/12") == canonical_key("https://github.com/acme/site/pull/12")
+
+
+def test_search_redirects_and_tracking_params():
+    target = "https://shop.io/hire?b=2&a=1"
+    assert unwrap("https://duckduckgo.com/l/?uddg=https%3A%2F%2Fshop.io%2Fhire%3Fb%3D2%26a%3D1&rut=x") == target
+    assert unwrap("https://www.bing.com/ck/a?!&&p=abc&u=a1aHR0cHM6Ly9zaG9wLmlvL2hpcmU&ntb=1") == "https://shop.io/hire"
+    assert clean_url("https://Shop.io:443/hire?utm_campaign=x&b=2&a=1&fbclid=9#top") == "https://shop.io/hire?a=1&b=2"
+    assert canonical_key("http://www.shop.io/hire/?b=2&a=1&gclid=1") == canonical_key(target) == "shop.io/hire?a=1&b=2"
+
+
+def test_add_if_new_collapses_spellings():
+    seen: set[str] = set()
+    assert add_if_new(seen, "https://news.ycombinator.com/item?id=1")
+    assert not add_if_new(seen, "https://hn.algolia.com/api/v1/items/1")
+    assert add_if_new(seen, "https://news.ycombinator.com/item?id=2")
@@ -1,8 +1,18 @@
 "use client";
 
-import { useState, useEffect, useCallback } from "react";
+import { useState, useEffect, useCallback, useRef } from "react";
 
 const API = "/api/backend";
+const POLL_MS = 2000;
+const ACTIVE = ["queued", "running"];
+
+type Job = {
+  job_id: string;
+  status: string;
+  error: string;
+  summary: Record<string, unknown> | null;
+  progress: { platforms_done: string[]; leads_so_far: number } | null;
+};
 
 function getMessage(detail: unknown): string {
   if (typeof detail === "string") return detail;
@@ -18,6 +28,8 @@ export default function LeadsPage() {
   const [error, setError] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
   const [backendOk, setBackendOk] = useState<boolean | null>(null);
+  const [job, setJob] = useState<Job | null>(null);
+  const poll = useRef<ReturnType<typeof setTimeout> | null>(null);
 
   const fetchData = useCallback(async () => {
     try {
@@ -43,8 +55,39 @@ export default function LeadsPage() {
     }
   }, []);
 
+  const refreshOutputs = async () => {
+    const outRes = await fetch(`${API}/outputs`);
+    const outData = await outRes.json();
+    setOutputs(outData.files ?? []);
+  };
+
+  const watchJob = useCallback(async (jobId: string) => {
+    try {
+      const res = await fetch(`${API}/runs/${jobId}`);
+      const data = await res.json().catch(() => ({}));
+      if (!res.ok) throw new Error(getMessage(data.detail ?? "Run status unavailable"));
+      setJob(data);
+      if (ACTIVE.includes(data.status)) {
+        poll.current = setTimeout(() => watchJob(jobId), POLL_MS);
+        return;
+      }
+      if (data.status === "succeeded") {
+        setSummary(data.summary);
+        await refreshOutputs();
+      } else if (data.status !== "cancelled") {
+        setError(data.error || `Run ${data.status}`);
+      }
+    } catch (e) {
+      setError(e instanceof Error ? e.message : "Run status unavailable");
+    }
+    setRunning(false);
+  }, []);
+
   useEffect(() => {
     fetchData();
+    return () => {
+      if (poll.current) clearTimeout(poll.current);
+    };
   }, [fetchData]);
 
   const runScrape = async () => {
@@ -53,18 +96,27 @@ export default function LeadsPage() {
     try {
       const res = await fetch(`${API}/run`, { method: "POST" });
       const data = await res.json().catch(() => ({}));
+      if (res.status === 409 && data.detail?.job_id) {
+        // another run is in progress: follow it instead
+        watchJob(data.detail.job_id);
+        return;
+      }
       if (!res.ok) throw new Error(getMessage(data.detail ?? "Run failed"));
-      setSummary(data);
-      const outRes = await fetch(`${API}/outputs`);
-      const outData = await outRes.json();
-      setOutputs(outData.files ?? []);
+      setJob(data);
+      watchJob(data.job_id);
     } catch (e) {
       setError(e instanceof Error ? e.message : "Run failed");
-    } finally {
       setRunning(false);
     }
   };
 
+  const cancelRun = async () => {
+    if (!job) return;
+    const res = await fetch(`${API}/runs/${job.job_id}`, { method: "DELETE" });
+    const data = await res.json().catch(() => ({}));
+    if (!res.ok) setError(getMessage(data.detail ?? "Cancel failed"));
+  };
+
   return (
     <div className="min-h-screen bg-slate-950 text-slate-100 p-6">
       <div className="max-w-4xl mx-auto space-y-8">
@@ -94,6 +146,21 @@ export default function LeadsPage() {
           >
             {running ? "Running…" : "Run scrape"}
           </button>
+          {running && job && (
+            <button
+              onClick={cancelRun}
+              className="ml-3 rounded-lg border border-slate-700 px-4 py-2 font-medium text-slate-300 hover:bg-slate-800"
+            >
+              Cancel
+            </button>
+          )}
+          {job && (
+            <p className="mt-2 text-slate-400 text-sm">
+              Job <span className="font-mono text-xs">{job.job_id}</span>: {job.status}
+              {job.progress &&
+                ` — ${job.progress.leads_so_far} leads, ${job.progress.platforms_done.length} platforms done`}
+            </p>
+          )}
           {error && <p className="mt-2 text-red-400 text-sm">{error}</p>}
         </section>
 